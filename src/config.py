@@ -6,8 +6,13 @@ All values defined here are intended to be imported and reused across modules.
 """
 
 import datetime
+import os
 from pathlib import Path
 
+from dotenv import load_dotenv
+
+load_dotenv()
+
 
 DIR_PATH = Path(__file__).resolve().parent.parent
 
@@ -19,14 +24,90 @@ json_file_name = "output.jsonl"
 csv_file_path = DATA_DIR / "output.csv"
 csv_file_name = "output.csv"
 
+sqlite_db_path = DATA_DIR / "apod.db"
+sqlite_db_name = "apod.db"
+
+sharded_logs_dir = DATA_DIR / "logs"
+sharded_manifest_path = sharded_logs_dir / "manifest.json"
+sharded_manifest_name = "logs/manifest.json"
+
+archive_file_path = DATA_DIR / "archive.apodz"
+archive_file_name = "archive.apodz"
+
 user_settings_path = DATA_DIR / "settings.jsonl"
 user_settings_name = "settings.jsonl"
 
+backfill_checkpoint_path = DATA_DIR / "backfill_checkpoint.json"
+
+apod_cache_dir = DATA_DIR / "cache" / "apod"
+
+# Validators (ETag / Last-Modified / Content-Length) of downloaded media files
+media_validators_dir = DATA_DIR / "cache" / "media"
+
 NASA_APOD_START_DATE = datetime.date(1995, 6, 16)
 DATE_TODAY = datetime.date.today()
 
 README_URL = "https://github.com/abner577/NASA-APOD-Logger/blob/main/README.md"
 
+# Shared HTTP transport (see src/utils/http_utils.py).
+# Each value can be overridden from .env without touching the code.
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "4"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "8"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+HTTP_BACKOFF_JITTER = float(os.getenv("HTTP_BACKOFF_JITTER", "0.5"))
+HTTP_MAX_CONCURRENCY_PER_HOST = int(os.getenv("HTTP_MAX_CONCURRENCY_PER_HOST", "6"))
+
+# API quota pacing (see src/nasa/nasa_rate_limit.py). The default limit is only
+# used until the first response reports the real X-RateLimit-Limit.
+RATE_LIMIT_DEFAULT_PER_HOUR = int(os.getenv("RATE_LIMIT_DEFAULT_PER_HOUR", "1000"))
+RATE_LIMIT_RESERVE = int(os.getenv("RATE_LIMIT_RESERVE", "5"))
+
+# Number of days requested per start_date/end_date call during a backfill.
+BACKFILL_WINDOW_DAYS = int(os.getenv("BACKFILL_WINDOW_DAYS", "30"))
+
+# Worker threads used when fetching many individual dates at once.
+CONCURRENT_FETCH_WORKERS = int(os.getenv("CONCURRENT_FETCH_WORKERS", "8"))
+
+# Parallel media downloads (see src/utils/media_download_pool.py).
+MEDIA_DOWNLOAD_WORKERS = int(os.getenv("MEDIA_DOWNLOAD_WORKERS", "6"))
+MEDIA_DOWNLOADS_PER_HOST = int(os.getenv("MEDIA_DOWNLOADS_PER_HOST", "4"))
+
+# Dates fetched per batch by the headless random sampler (--random).
+RANDOM_SAMPLE_BATCH_SIZE = int(os.getenv("RANDOM_SAMPLE_BATCH_SIZE", "50"))
+
+# Log storage backend: "files" (output.jsonl + output.csv), "sqlite" (apod.db) or
+# "sharded" (one JSONL file per APOD year under data/logs/). The last two export the
+# flat logs on demand; see src/storage/log_storage.py.
+STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "files").strip().lower()
+
+# How the files backend keeps output.csv: "mirror" writes every change to both logs,
+# "derived" writes only output.jsonl and regenerates the CSV from it (see src/storage/derived_csv.py).
+CSV_LOG_MODE = os.getenv("CSV_LOG_MODE", "mirror").strip().lower()
+
+# Compressed log archive written by --archive (see src/storage/log_archive.py): the codec
+# ("lzma" or "gzip") and how many records are compressed together in each block.
+ARCHIVE_CODEC = os.getenv("ARCHIVE_CODEC", "lzma").strip().lower()
+ARCHIVE_BLOCK_RECORDS = int(os.getenv("ARCHIVE_BLOCK_RECORDS", "256"))
+
+# JSON decoder for logs, settings and API responses (see src/utils/json_codec.py):
+# "auto" uses orjson when it is installed, "json" always uses the standard library.
+JSON_CODEC = os.getenv("JSON_CODEC", "auto").strip().lower()
+
+# Best-ranked entries shown by --search.
+SEARCH_RESULT_LIMIT = int(os.getenv("SEARCH_RESULT_LIMIT", "20"))
+
+# Patch records kept in a log's update journal before it is folded back into the log
+# (see src/storage/update_journal.py).
+UPDATE_JOURNAL_COMPACT_THRESHOLD = int(os.getenv("UPDATE_JOURNAL_COMPACT_THRESHOLD", "200"))
+
+# On-disk API response cache (see src/storage/cache_storage.py).
+APOD_CACHE_RECENT_TTL_SECONDS = int(os.getenv("APOD_CACHE_RECENT_TTL_SECONDS", "3600"))
+APOD_CACHE_MAX_ENTRIES = int(os.getenv("APOD_CACHE_MAX_ENTRIES", "20000"))
+APOD_CACHE_MAX_BYTES = int(os.getenv("APOD_CACHE_MAX_BYTES", str(100 * 1024 * 1024)))
+
 
 SPACE_STARTUP_ART_1 = r"""
 }}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}}
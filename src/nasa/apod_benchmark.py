@@ -0,0 +1,151 @@
+"""
+apod_benchmark.py
+
+Reproducible throughput benchmarks for the APOD network paths.
+By default a local stand-in server is started (see ``local_apod_server.py``),
+so results do not depend on the network or on NASA's rate limits.
+
+Run with:
+    python -m src.nasa.apod_benchmark --requests 500 --workers 8 --media-size 2000000
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+
+from rich.text import Text
+
+from src.config import NASA_APOD_START_DATE
+from src.nasa.local_apod_server import DEFAULT_MEDIA_SIZE, start_local_apod_server
+from src.startup.console import console
+from src.utils.data_utils import format_apod_data
+from src.utils.http_utils import decode_json_response, http_get
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """
+    Timing summary for one benchmark run.
+    """
+    name: str
+    operations: int
+    elapsed_seconds: float
+    latencies: list[float]
+    total_bytes: int = 0
+
+    @property
+    def operations_per_second(self) -> float:
+        return self.operations / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return (self.total_bytes / (1024 * 1024)) / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def latency_percentile(self, percentile: int) -> float:
+        if len(self.latencies) < 2:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100)[percentile - 1]
+
+
+def _benchmark_dates(count: int) -> list[str]:
+    """Return ``count`` distinct, deterministic APOD dates."""
+    return [(NASA_APOD_START_DATE + datetime.timedelta(days=offset)).isoformat() for offset in range(count)]
+
+
+def _run_timed(name: str, operation: Callable[[str], int], inputs: list[str], workers: int) -> BenchmarkResult:
+    """Run ``operation`` over ``inputs`` on a thread pool, timing each call and the whole run."""
+    latencies = []
+
+    def timed_operation(value: str) -> int:
+        started_at = time.perf_counter()
+        byte_count = operation(value)
+        latencies.append(time.perf_counter() - started_at)
+        return byte_count
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        total_bytes = sum(executor.map(timed_operation, inputs))
+    elapsed_seconds = time.perf_counter() - started_at
+
+    return BenchmarkResult(name, len(inputs), elapsed_seconds, latencies, total_bytes)
+
+
+def benchmark_api_requests(apod_url: str, request_count: int, workers: int) -> BenchmarkResult:
+    """Measure API requests per second for single-date requests."""
+    def request_one(date_value: str) -> int:
+        response = http_get(apod_url, params={"api_key": "BENCHMARK", "date": date_value})
+        return len(response.content)
+
+    return _run_timed("API requests", request_one, _benchmark_dates(request_count), workers)
+
+
+def benchmark_media_downloads(media_base_url: str, download_count: int, workers: int, media_size: int) -> BenchmarkResult:
+    """Measure media download throughput (MB/s) with streamed bodies."""
+    def download_one(date_value: str) -> int:
+        response = http_get(f"{media_base_url}apod-{date_value}.jpg", params={"size": media_size}, stream=True)
+        return sum(len(chunk) for chunk in response.iter_content(chunk_size=8192))
+
+    return _run_timed("Media downloads", download_one, _benchmark_dates(download_count), workers)
+
+
+def benchmark_end_to_end(apod_url: str, request_count: int, workers: int) -> BenchmarkResult:
+    """Measure request -> decode -> ``format_apod_data`` latency per APOD."""
+    def fetch_and_format(date_value: str) -> int:
+        response = http_get(apod_url, params={"api_key": "BENCHMARK", "date": date_value})
+        format_apod_data(decode_json_response(response), build_viewer=False)
+        return len(response.content)
+
+    return _run_timed("End-to-end fetch+format", fetch_and_format, _benchmark_dates(request_count), workers)
+
+
+def print_benchmark_result(result: BenchmarkResult) -> None:
+    msg = Text(f"{result.name}: ", style="app.secondary")
+    msg.append(f"{result.operations}", style="app.primary")
+    msg.append(f" ops in {result.elapsed_seconds:.2f}s -> ", style="body.text")
+    msg.append(f"{result.operations_per_second:.1f} ops/s", style="app.primary")
+    if result.total_bytes:
+        msg.append(", ", style="body.text")
+        msg.append(f"{result.megabytes_per_second:.1f} MB/s", style="app.primary")
+    msg.append(
+        f" | p50 {result.latency_percentile(50) * 1000:.1f} ms, p95 {result.latency_percentile(95) * 1000:.1f} ms",
+        style="body.text",
+    )
+    console.print(msg)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark APOD API and media throughput.")
+    parser.add_argument("--base-url", help="Server root to benchmark (default: start a local stand-in server).")
+    parser.add_argument("--requests", type=int, default=200, help="Number of API requests per benchmark.")
+    parser.add_argument("--downloads", type=int, default=20, help="Number of media downloads.")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--media-size", type=int, default=DEFAULT_MEDIA_SIZE)
+    args = parser.parse_args()
+
+    server = None
+    if args.base_url:
+        base_url = args.base_url.rstrip("/")
+    else:
+        server = start_local_apod_server(media_size=args.media_size)
+        base_url = server.base_url
+
+    apod_url = f"{base_url}/planetary/apod"
+    media_base_url = f"{base_url}/media/"
+
+    try:
+        print_benchmark_result(benchmark_api_requests(apod_url, args.requests, args.workers))
+        print_benchmark_result(benchmark_media_downloads(media_base_url, args.downloads, args.workers, args.media_size))
+        print_benchmark_result(benchmark_end_to_end(apod_url, args.requests, args.workers))
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    main()
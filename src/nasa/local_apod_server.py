@@ -0,0 +1,339 @@
+"""
+local_apod_server.py
+
+Local stand-in for the NASA APOD API, used for deterministic, offline
+throughput benchmarks. Serves ``/planetary/apod`` with the ``date``, ``count``,
+``start_date`` and ``end_date`` semantics of the real API, plus a
+``/media/<name>`` endpoint that returns image bodies of a configurable size.
+With ``--rate-limit`` it also emits ``X-RateLimit-*`` headers and answers 429
+once the hourly quota is spent, like api.nasa.gov. Successful responses carry
+an ``ETag`` and answer ``If-None-Match`` with ``304 Not Modified``.
+
+Point ``BASE_URL`` at ``http://<host>:<port>/planetary/apod`` to run the whole
+app against it.
+
+Run with:
+    python -m src.nasa.local_apod_server --port 8765 --media-size 2000000
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import hashlib
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from src.config import DATE_TODAY, NASA_APOD_START_DATE
+from src.utils import json_codec
+from src.utils.data_utils import (
+    TEST_DATA,
+    TEST_DATA2,
+    TEST_DATA3,
+    TEST_DATA4,
+    TEST_DATA5,
+    TEST_DATA6,
+    TEST_DATA7,
+)
+
+APOD_PATH = "/planetary/apod"
+MEDIA_PATH_PREFIX = "/media/"
+MAX_COUNT = 100
+DEFAULT_MEDIA_SIZE = 1024 * 1024
+
+FIXTURE_PAYLOADS = [TEST_DATA, TEST_DATA2, TEST_DATA3, TEST_DATA4, TEST_DATA5, TEST_DATA6, TEST_DATA7]
+
+_SYNTHETIC_SUBJECTS = [
+    "Nebula", "Galaxy", "Comet", "Aurora", "Eclipse", "Star Cluster",
+    "Supernova Remnant", "Planet", "Moon", "Milky Way",
+]
+_SYNTHETIC_PLACES = [
+    "in Orion", "over Iceland", "from Cassini", "near Andromeda", "in Cygnus",
+    "from Hubble", "above the Atacama", "in Sagittarius", "from Webb", "over Namibia",
+]
+_SYNTHETIC_SENTENCES = [
+    "Light from this object left it long before humans looked up.",
+    "The featured image combines exposures taken over several nights.",
+    "Dust lanes block the light of the stars behind them.",
+    "Glowing hydrogen gives the scene its reddish hue.",
+    "Astronomers continue to study how such structures form.",
+    "Faint details only appear in long, carefully processed exposures.",
+]
+
+
+def generate_synthetic_apod(date_object: datetime.date, media_base_url: str) -> dict[str, Any]:
+    """Build a deterministic, API-shaped APOD payload for a date.
+
+    The same date always produces the same payload, so benchmark runs are
+    reproducible.
+    """
+    rng = random.Random(date_object.toordinal())
+    date_value = date_object.isoformat()
+    explanation = " ".join(rng.choice(_SYNTHETIC_SENTENCES) for _ in range(rng.randint(4, 10)))
+
+    return {
+        "date": date_value,
+        "title": f"{rng.choice(_SYNTHETIC_SUBJECTS)} {rng.choice(_SYNTHETIC_PLACES)}",
+        "explanation": explanation,
+        "media_type": "image",
+        "service_version": "v1",
+        "url": f"{media_base_url}apod-{date_value}.jpg",
+        "hdurl": f"{media_base_url}apod-{date_value}-hd.jpg",
+    }
+
+
+def build_fixture_index(media_base_url: str) -> dict[str, dict[str, Any]]:
+    """Index the ``TEST_DATA*`` fixtures by date, pointing their media at the local server."""
+    fixtures = {}
+
+    for payload in FIXTURE_PAYLOADS:
+        fixture = dict(payload)
+        date_value = fixture["date"]
+        fixture.setdefault("media_type", "image")
+        fixture["url"] = f"{media_base_url}apod-{date_value}.jpg"
+        fixture["hdurl"] = f"{media_base_url}apod-{date_value}-hd.jpg"
+        fixtures[date_value] = fixture
+
+    return fixtures
+
+
+def build_media_body(size: int) -> bytes:
+    """Return a deterministic body of ``size`` bytes that starts with a JPEG marker."""
+    header = b"\xff\xd8\xff\xe0"
+    pattern = bytes(range(256))
+    repeats = (max(size, len(header)) // len(pattern)) + 1
+    return (header + pattern * repeats)[:max(size, len(header))]
+
+
+class LocalApodRequestHandler(BaseHTTPRequestHandler):
+    """Request handler implementing the subset of the APOD API the app uses."""
+
+    server: "LocalApodServer"
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without TCP_NODELAY every
+    # keep-alive response would stall on delayed ACKs (~40 ms per request).
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep benchmark output clean; the default handler logs every request to stderr.
+        return
+
+    def do_GET(self) -> None:
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+
+        if parsed.path.rstrip("/") == APOD_PATH:
+            self._handle_apod(query)
+        elif parsed.path.startswith(MEDIA_PATH_PREFIX):
+            self._handle_media(query)
+        else:
+            self._send_json(404, {"code": 404, "msg": "Not found"})
+
+    def _handle_apod(self, query: dict[str, str]) -> None:
+        if not self.server.take_rate_limit_slot():
+            self._send_json(429, {"error": {"code": "OVER_RATE_LIMIT", "message": "You have exceeded your rate limit."}})
+            return
+
+        if "count" in query and ("date" in query or "start_date" in query or "end_date" in query):
+            self._send_json(400, {"code": 400, "msg": "Bad Request: count cannot be combined with date parameters."})
+            return
+
+        try:
+            if "count" in query:
+                count = int(query["count"])
+                if not (0 < count <= MAX_COUNT):
+                    raise ValueError(f"count must be between 1 and {MAX_COUNT}.")
+                self._send_json(200, self.server.get_random_apods(count))
+
+            elif "start_date" in query or "end_date" in query:
+                start_date = self._parse_date(query.get("start_date", NASA_APOD_START_DATE.isoformat()))
+                end_date = self._parse_date(query.get("end_date", DATE_TODAY.isoformat()))
+                if start_date > end_date:
+                    raise ValueError("start_date cannot be after end_date.")
+                self._send_json(200, self.server.get_apod_range(start_date, end_date))
+
+            else:
+                date_object = self._parse_date(query.get("date", DATE_TODAY.isoformat()))
+                self._send_json(200, self.server.get_apod(date_object))
+
+        except ValueError as error:
+            self._send_json(400, {"code": 400, "msg": f"Bad Request: {error}"})
+
+    def _handle_media(self, query: dict[str, str]) -> None:
+        try:
+            size = int(query.get("size", self.server.media_size))
+        except ValueError:
+            size = self.server.media_size
+
+        self._send_body(200, "image/jpeg", self.server.get_media_body(size))
+
+    @staticmethod
+    def _parse_date(date_value: str) -> datetime.date:
+        date_object = datetime.date.fromisoformat(date_value)
+        if date_object < NASA_APOD_START_DATE or date_object > DATE_TODAY:
+            raise ValueError(f"Date must be between {NASA_APOD_START_DATE} and {DATE_TODAY}.")
+        return date_object
+
+    def _send_json(self, status_code: int, payload: Any) -> None:
+        body = json_codec.dumps(payload).encode("utf-8")
+        self._send_body(status_code, "application/json", body, self.server.get_rate_limit_headers())
+
+    def _send_body(self, status_code: int, content_type: str, body: bytes, extra_headers: dict[str, str] | None = None) -> None:
+        """Send a response; a 200 whose ETag matches ``If-None-Match`` becomes a bodiless 304."""
+        headers = dict(extra_headers or {})
+
+        if status_code == 200:
+            etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+            headers["ETag"] = etag
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                for header_name, header_value in headers.items():
+                    self.send_header(header_name, header_value)
+                self.end_headers()
+                return
+
+        self.send_response(status_code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for header_name, header_value in headers.items():
+            self.send_header(header_name, header_value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class LocalApodServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the fixture data and media settings."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        media_size: int = DEFAULT_MEDIA_SIZE,
+        seed: int = 0,
+        rate_limit_per_hour: int = 0,
+    ) -> None:
+        super().__init__(address, LocalApodRequestHandler)
+        self.media_size = media_size
+        self.rate_limit_per_hour = rate_limit_per_hour
+        self._request_times: deque[float] = deque()
+        self._rate_limit_lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._media_bodies: dict[int, bytes] = {}
+        self.fixtures = build_fixture_index(self.media_base_url)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def apod_url(self) -> str:
+        return f"{self.base_url}{APOD_PATH}"
+
+    @property
+    def media_base_url(self) -> str:
+        return f"{self.base_url}{MEDIA_PATH_PREFIX}"
+
+    def get_apod(self, date_object: datetime.date) -> dict[str, Any]:
+        fixture = self.fixtures.get(date_object.isoformat())
+        if fixture is not None:
+            return fixture
+        return generate_synthetic_apod(date_object, self.media_base_url)
+
+    def get_apod_range(self, start_date: datetime.date, end_date: datetime.date) -> list[dict[str, Any]]:
+        day_count = (end_date - start_date).days + 1
+        return [self.get_apod(start_date + datetime.timedelta(days=offset)) for offset in range(day_count)]
+
+    def get_random_apods(self, count: int) -> list[dict[str, Any]]:
+        span = (DATE_TODAY - NASA_APOD_START_DATE).days
+        with self._random_lock:
+            offsets = self._random.sample(range(span + 1), count)
+        return [self.get_apod(NASA_APOD_START_DATE + datetime.timedelta(days=offset)) for offset in offsets]
+
+    def _expire_request_times(self) -> None:
+        window_start = time.monotonic() - 3600
+        while self._request_times and self._request_times[0] < window_start:
+            self._request_times.popleft()
+
+    def take_rate_limit_slot(self) -> bool:
+        """Record one API request; return False when the rolling hourly quota is spent."""
+        if self.rate_limit_per_hour <= 0:
+            return True
+
+        with self._rate_limit_lock:
+            self._expire_request_times()
+            if len(self._request_times) >= self.rate_limit_per_hour:
+                return False
+            self._request_times.append(time.monotonic())
+            return True
+
+    def get_rate_limit_headers(self) -> dict[str, str]:
+        if self.rate_limit_per_hour <= 0:
+            return {}
+
+        with self._rate_limit_lock:
+            self._expire_request_times()
+            remaining = max(0, self.rate_limit_per_hour - len(self._request_times))
+
+        return {"X-RateLimit-Limit": str(self.rate_limit_per_hour), "X-RateLimit-Remaining": str(remaining)}
+
+    def get_media_body(self, size: int) -> bytes:
+        body = self._media_bodies.get(size)
+        if body is None:
+            body = build_media_body(size)
+            self._media_bodies[size] = body
+        return body
+
+
+def start_local_apod_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    media_size: int = DEFAULT_MEDIA_SIZE,
+    seed: int = 0,
+    rate_limit_per_hour: int = 0,
+) -> LocalApodServer:
+    """Start the stand-in server on a background thread and return it.
+
+    Passing ``port=0`` picks a free port; read it back from ``server.base_url``.
+    Call ``server.shutdown()`` to stop it.
+    """
+    server = LocalApodServer((host, port), media_size=media_size, seed=seed, rate_limit_per_hour=rate_limit_per_hour)
+    thread = threading.Thread(target=server.serve_forever, name="local-apod-server", daemon=True)
+    thread.start()
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for the NASA APOD API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--media-size", type=int, default=DEFAULT_MEDIA_SIZE, help="Bytes returned by /media/ requests.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for count= (random) responses.")
+    parser.add_argument("--rate-limit", type=int, default=0, help="Hourly API quota to enforce (0 = unlimited).")
+    args = parser.parse_args()
+
+    server = LocalApodServer(
+        (args.host, args.port),
+        media_size=args.media_size,
+        seed=args.seed,
+        rate_limit_per_hour=args.rate_limit,
+    )
+    print(f"Serving APOD stand-in at {server.apod_url}")
+    print(f"Set BASE_URL=\"{server.apod_url}\" to point the app at it.")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
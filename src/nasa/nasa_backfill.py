@@ -0,0 +1,287 @@
+"""
+nasa_backfill.py
+
+Date-range backfill for mirroring the APOD archive into the local logs.
+Walks a date range in API-sized windows using the ``start_date``/``end_date``
+query parameters and checkpoints progress so interrupted runs can resume.
+Window responses are decoded as they stream in and logged in small batches,
+so memory use does not grow with the window size.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+import requests
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from rich.text import Text
+
+from src.config import BACKFILL_WINDOW_DAYS, DATE_TODAY, NASA_APOD_START_DATE, backfill_checkpoint_path
+from src.nasa.nasa_client import _request_apod
+from src.nasa.nasa_rate_limit import print_projected_completion
+from src.startup.console import console
+from src.storage.cache_storage import get_cached_apod_range, store_cached_apod, store_missing_apod_dates
+from src.storage.data_storage import check_if_data_exists, create_data_directory
+from src.storage.log_storage import log_apod_entries
+from src.utils.apod_media_utils import _get_existing_local_file_path
+from src.utils.data_utils import format_apod_data
+from src.utils.json_stream_utils import iter_response_json_items
+
+# Entries formatted and handed to the logs together while a window streams in.
+BACKFILL_LOG_BATCH_SIZE = 50
+
+
+def split_date_range(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    window_days: int = BACKFILL_WINDOW_DAYS,
+) -> Iterator[tuple[datetime.date, datetime.date]]:
+    """Yield inclusive ``(window_start, window_end)`` pairs covering the range (windows are at least one day)."""
+    window_days = max(1, window_days)
+    window_start = start_date
+    while window_start <= end_date:
+        window_end = min(window_start + datetime.timedelta(days=window_days - 1), end_date)
+        yield window_start, window_end
+        window_start = window_end + datetime.timedelta(days=1)
+
+
+def load_backfill_checkpoint() -> dict[str, Any] | None:
+    """Return the saved checkpoint of an unfinished backfill, if one exists."""
+    if not backfill_checkpoint_path.is_file():
+        return None
+
+    try:
+        with open(file=backfill_checkpoint_path, mode="r", encoding="utf-8") as checkpoint_file:
+            return json.load(checkpoint_file)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_backfill_checkpoint(start_date: datetime.date, end_date: datetime.date, next_date: datetime.date, logged_count: int) -> None:
+    """Persist backfill progress so an interrupted run can resume from ``next_date``."""
+    checkpoint = {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "next_date": next_date.isoformat(),
+        "logged_count": logged_count,
+    }
+
+    # Write to a temp file first so a crash mid-write never corrupts the checkpoint.
+    temp_path = backfill_checkpoint_path.with_suffix(".tmp")
+    with open(file=temp_path, mode="w", encoding="utf-8") as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+    temp_path.replace(backfill_checkpoint_path)
+
+
+def clear_backfill_checkpoint() -> None:
+    """Remove the checkpoint once a backfill has finished."""
+    if backfill_checkpoint_path.is_file():
+        backfill_checkpoint_path.unlink()
+
+
+def fetch_apod_window(window_start: datetime.date, window_end: datetime.date) -> Iterator[dict[str, Any]] | None:
+    """Return an iterator over every APOD in one inclusive date window, or ``None`` on failure.
+
+    Windows whose dates are all in the local response cache (or confirmed to
+    have no APOD) are served without an API call. Otherwise the response is streamed: entries are decoded and
+    cached one at a time as bytes arrive, so the first entries can be logged
+    before the download finishes. Network errors while the body is streaming
+    are raised from the iterator as ``requests.RequestException``.
+    """
+    cached_entries = get_cached_apod_range(window_start, window_end)
+    if cached_entries is not None:
+        return iter(cached_entries)
+
+    try:
+        response = _request_apod({
+            "start_date": window_start.isoformat(),
+            "end_date": window_end.isoformat(),
+        }, stream=True, paced=True)
+    except requests.RequestException as error:
+        msg = Text("\nNetwork error: ", style="err")
+        msg.append(str(error), style="body.text")
+        console.print(msg)
+        return None
+
+    if response.status_code != 200:
+        response.close()
+        msg = Text("\nNASA API error: ", style="err")
+        msg.append(f"HTTP {response.status_code} for ", style="body.text")
+        msg.append(f"{window_start} -> {window_end}", style="app.primary")
+        msg.append(". Run the backfill again to resume.\n", style="body.text")
+        console.print(msg)
+        return None
+
+    return _iter_streamed_window(response, window_start, window_end)
+
+
+def _iter_streamed_window(
+    response: requests.Response,
+    window_start: datetime.date,
+    window_end: datetime.date,
+) -> Iterator[dict[str, Any]]:
+    """Yield and cache each entry of a streamed window response.
+
+    Once the whole response has been read, the window's dates it had no entry
+    for are cached as missing, so the window can later be served from cache.
+    """
+    missing_dates = {
+        (window_start + datetime.timedelta(days=offset)).isoformat()
+        for offset in range((window_end - window_start).days + 1)
+    }
+
+    with response:
+        # A single-day window comes back as one object, which the decoder yields on its own.
+        for raw_entry in iter_response_json_items(response):
+            store_cached_apod(raw_entry)
+            missing_dates.discard(str(raw_entry.get("date", "")))
+            yield raw_entry
+
+    store_missing_apod_dates(sorted(missing_dates))
+
+
+def iter_batches(entries: Iterable[dict[str, Any]], batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Group an entry stream into lists of at most ``batch_size`` entries."""
+    entry_iterator = iter(entries)
+    while batch := list(islice(entry_iterator, batch_size)):
+        yield batch
+
+
+def format_apod_window(raw_entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Format raw API entries for logging, skipping entries that cannot be formatted."""
+    formatted_entries = []
+
+    for raw_entry in raw_entries:
+        try:
+            existing_local_file_path = _get_existing_local_file_path(raw_entry)
+            formatted_entries.append(format_apod_data(raw_entry, local_file_path=existing_local_file_path))
+        except (KeyError, IndexError, AttributeError):
+            msg = Text("Skipped logging: ", style="app.secondary")
+            msg.append(f"apod-{raw_entry.get('date', 'unknown')}", style="app.primary")
+            msg.append(" is missing fields required for the log.", style="body.text")
+            console.print(msg)
+
+    return formatted_entries
+
+
+def resolve_backfill_range(
+    start_date: datetime.date | None,
+    end_date: datetime.date | None,
+) -> tuple[datetime.date, datetime.date, datetime.date, int]:
+    """Resolve the range to walk plus the resume point and already-logged count.
+
+    When no explicit range is given, an unfinished checkpoint is resumed. With
+    no checkpoint either, the full archive from ``NASA_APOD_START_DATE`` to
+    today is used.
+    """
+    checkpoint = load_backfill_checkpoint()
+
+    if checkpoint is not None:
+        checkpoint_start = datetime.date.fromisoformat(checkpoint["start_date"])
+        checkpoint_end = datetime.date.fromisoformat(checkpoint["end_date"])
+        same_range = (start_date in (None, checkpoint_start)) and (end_date in (None, checkpoint_end))
+        if same_range:
+            next_date = datetime.date.fromisoformat(checkpoint["next_date"])
+            return checkpoint_start, checkpoint_end, next_date, int(checkpoint.get("logged_count", 0))
+
+    start_date = max(start_date or NASA_APOD_START_DATE, NASA_APOD_START_DATE)
+    end_date = min(end_date or DATE_TODAY, DATE_TODAY)
+    return start_date, end_date, start_date, 0
+
+
+def run_backfill(
+    start_date: datetime.date | None = None,
+    end_date: datetime.date | None = None,
+    window_days: int = BACKFILL_WINDOW_DAYS,
+) -> int:
+    """
+    Mirror every APOD between two dates into the JSONL and CSV logs.
+
+    Each window is requested with one ``start_date``/``end_date`` API call and
+    written to the logs before the next window is requested. Progress is
+    checkpointed after every window, so calling this again after an
+    interruption resumes where the previous run stopped.
+
+    Args:
+        start_date: First date to backfill (defaults to ``NASA_APOD_START_DATE``).
+        end_date: Last date to backfill (defaults to today).
+        window_days: Number of days requested per API call.
+
+    Returns:
+        int: Number of entries formatted and handed to the logs in this run.
+    """
+    start_date, end_date, next_date, logged_count = resolve_backfill_range(start_date, end_date)
+
+    if start_date > end_date:
+        msg = Text("\nInput error: ", style="err")
+        msg.append("Backfill start date must be on or before the end date.\n", style="body.text")
+        console.print(msg)
+        return 0
+
+    if not check_if_data_exists():
+        msg = Text("Data directory not found. Creating it...\n", style="body.text")
+        console.print(msg)
+        create_data_directory()
+
+    if next_date > start_date:
+        msg = Text("\nResuming backfill ", style="body.text")
+        msg.append(f"{start_date} -> {end_date}", style="app.primary")
+        msg.append(" from ", style="body.text")
+        msg.append(str(next_date), style="app.primary")
+        console.print(msg)
+
+    windows = list(split_date_range(next_date, end_date, window_days))
+    entries_this_run = 0
+    print_projected_completion(len(windows))
+
+    with Progress(
+        SpinnerColumn(style="app.primary"),
+        TextColumn("[body.text]Backfilling [/body.text][app.primary]{task.fields[window]}[/app.primary]"),
+        BarColumn(bar_width=None, complete_style="app.primary", finished_style="ok"),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True,
+        expand=True,
+    ) as progress:
+        task_id = progress.add_task("backfill", total=len(windows), window="")
+
+        for window_start, window_end in windows:
+            progress.update(task_id, window=f"{window_start} -> {window_end}")
+
+            raw_entries = fetch_apod_window(window_start, window_end)
+            if raw_entries is None:
+                return entries_this_run
+
+            try:
+                for raw_batch in iter_batches(raw_entries, BACKFILL_LOG_BATCH_SIZE):
+                    formatted_entries = format_apod_window(raw_batch)
+                    log_apod_entries(formatted_entries, show_individual_success_messages=False)
+
+                    entries_this_run += len(formatted_entries)
+                    logged_count += len(formatted_entries)
+            except (requests.RequestException, ValueError) as error:
+                # The window is not checkpointed, so the next run repeats it; entries
+                # already logged from it are skipped as duplicates.
+                msg = Text("\nNetwork error: ", style="err")
+                msg.append(f"{window_start} -> {window_end} was interrupted ({error}). ", style="body.text")
+                msg.append("Run the backfill again to resume.\n", style="body.text")
+                console.print(msg)
+                return entries_this_run
+
+            save_backfill_checkpoint(start_date, end_date, window_end + datetime.timedelta(days=1), logged_count)
+            progress.advance(task_id)
+
+    clear_backfill_checkpoint()
+
+    msg = Text("\nSuccess: ", style="ok")
+    msg.append("Backfill ", style="body.text")
+    msg.append(f"{start_date} -> {end_date}", style="app.primary")
+    msg.append(" complete. ", style="body.text")
+    msg.append(str(logged_count), style="app.primary")
+    msg.append(" APODs processed ", style="body.text")
+    msg.append("✓\n", style="ok")
+    console.print(msg)
+
+    return entries_this_run
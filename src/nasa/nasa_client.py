@@ -11,25 +11,25 @@ import os
 
 import requests
 from dotenv import load_dotenv
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.text import Text
 
 from src.startup.console import console
 from src.nasa.nasa_date import check_valid_nasa_date
-from src.storage.data_storage import check_if_data_exists, create_data_directory
-from src.storage.csv_storage import (
-    log_data_to_csv,
-    log_multiple_csv_entries,
-    update_local_file_path_in_csv,
-)
-from src.storage.json_storage import (
-    log_data_to_json,
-    log_multiple_json_entries,
-    update_local_file_path_in_json,
+from src.storage.cache_storage import (
+    get_cached_apod,
+    get_cached_apod_entry,
+    refresh_cached_apod,
+    store_cached_apod,
+    store_cached_apods,
 )
+from src.storage.data_storage import check_if_data_exists, create_data_directory
+from src.storage.log_storage import log_apod_entries, log_apod_entry, update_local_file_path, update_local_file_paths
 from src.utils.browser_utils import take_user_to_browser
 from src.utils.data_utils import format_apod_data
+from src.utils.http_utils import build_conditional_headers, decode_json_response, extract_validators, http_get
+from src.nasa.nasa_rate_limit import api_rate_limiter
 from src.utils.apod_media_utils import maybe_download_apod_file, _get_existing_local_file_path
+from src.utils.media_download_pool import download_apod_files
 from src.wallpaper import apply_auto_wallpaper_for_single_apod
 from src.user_settings import (
     get_automatically_save_apod_files,
@@ -37,7 +37,7 @@ from src.user_settings import (
     get_automatically_set_wallpaper,
 )
 
-from src.config import NASA_APOD_START_DATE
+from src.config import NASA_APOD_START_DATE, DATE_TODAY
 
 load_dotenv()
 
@@ -46,6 +46,74 @@ NASA_API_KEY = os.getenv('NASA_API_KEY')
 BASE_URL = os.getenv('BASE_URL')
 
 
+def _request_apod(
+    params: dict[str, Any] | None = None,
+    *,
+    headers: dict[str, str] | None = None,
+    stream: bool = False,
+    paced: bool = False,
+) -> requests.Response:
+    """
+    Send one APOD API request through the shared pooled HTTP transport.
+
+    Every response re-syncs the rate-limit scheduler from its headers. Bulk
+    callers pass ``paced=True`` to wait for quota before sending, so long runs
+    never exhaust the hourly limit; interactive requests are never delayed.
+    """
+    query = {"api_key": NASA_API_KEY}
+    if params:
+        query.update(params)
+
+    if paced:
+        api_rate_limiter.acquire()
+
+    response = http_get(BASE_URL, params=query, headers=headers, stream=stream)
+    api_rate_limiter.update_from_headers(response.headers, response.status_code)
+    return response
+
+
+def _fetch_apod_payload(date_value: str | None = None, *, paced: bool = False) -> tuple[int, Any]:
+    """
+    Return ``(status_code, payload)`` for one APOD, serving it from the local cache when possible.
+
+    ``date_value`` of None requests today's APOD. Successful API responses are
+    stored in the cache so the next request for that date costs no API call.
+    An expired cache entry is revalidated with a conditional request; on a
+    304 the cached payload is reused and no body is transferred.
+    """
+    cache_key = date_value or DATE_TODAY.isoformat()
+    cached_payload = get_cached_apod(cache_key)
+    if cached_payload is not None:
+        return 200, cached_payload
+
+    expired_entry = get_cached_apod_entry(cache_key)
+    conditional_headers = build_conditional_headers(expired_entry.get("validators")) if expired_entry else {}
+
+    response = _request_apod(
+        {"date": date_value} if date_value else None,
+        headers=conditional_headers or None,
+        paced=paced,
+    )
+    if response.status_code == 304 and expired_entry is not None:
+        refresh_cached_apod(expired_entry)
+        return 200, expired_entry["data"]
+
+    if response.status_code != 200:
+        return response.status_code, None
+
+    payload = decode_json_response(response)
+    store_cached_apod(payload, extract_validators(response))
+    return 200, payload
+
+
+def _print_network_error(error: requests.RequestException) -> None:
+    """Print a consistent message when the API could not be reached at all."""
+    msg = Text("\nNetwork error: ", style="err")
+    msg.append("Could not reach the NASA API. Please try again later.\n", style="body.text")
+    console.print(msg)
+    console.print(Text(str(error), style="err"))
+
+
 def get_todays_apod() -> Any:
     """
        Fetch today's Astronomy Picture of the Day (APOD) from NASA's API.
@@ -63,18 +131,19 @@ def get_todays_apod() -> Any:
         console.print(msg)
         create_data_directory()
 
-    full_url = f"{BASE_URL}?api_key={NASA_API_KEY}"
-    # print(f"[DEBUG] Full_url: {full_url}")
-    response = requests.get(full_url)
+    try:
+        status_code, apod_raw_data = _fetch_apod_payload()
+    except requests.RequestException as error:
+        _print_network_error(error)
+        return
 
-    if response.status_code == 200:
+    if status_code == 200:
         msg = Text("\nSuccess: ", style="ok")
         msg.append("Today's APOD was retrieved ", style="body.text")
         msg.append("✓", style="ok")
         msg.append("\n", style="body.text")
         console.print(msg)
         # print("[DEBUG]: HTTP Response = 200")
-        apod_raw_data = response.json()
 
         save_setting = get_automatically_save_apod_files()
         should_save_file = save_setting and save_setting.get("automatically_save_apod_files") == "yes"
@@ -87,8 +156,7 @@ def get_todays_apod() -> Any:
             console.print(msg)
             create_data_directory()
 
-        log_data_to_csv(apod_data)
-        log_data_to_json(apod_data)
+        log_apod_entry(apod_data)
 
         redirect_url = apod_data['url']
         automatically_redirect_setting = get_automatically_redirect_setting()
@@ -107,8 +175,7 @@ def get_todays_apod() -> Any:
             local_file_path = maybe_download_apod_file(apod_raw_data, True)
             console.print()
             if local_file_path:
-                update_local_file_path_in_csv(apod_data['date'], local_file_path)
-                update_local_file_path_in_json(apod_data['date'], local_file_path)
+                update_local_file_path(apod_data['date'], local_file_path)
 
         wallpaper_setting = get_automatically_set_wallpaper()
         should_set_wallpaper = wallpaper_setting and wallpaper_setting.get("automatically_set_wallpaper") == "yes"
@@ -116,13 +183,13 @@ def get_todays_apod() -> Any:
             apply_auto_wallpaper_for_single_apod(apod_raw_data)
             console.print()
 
-    elif response.status_code == 404 or response.status_code == 403:
+    elif status_code == 404 or status_code == 403:
         msg = Text("\nRequest error: ", style="err")
         msg.append("Verify your API key and try again.\n", style="body.text")
         console.print(msg)
         return
 
-    elif response.status_code == 500 or response.status_code == 503 or response.status_code == 504:
+    elif status_code == 500 or status_code == 503 or status_code == 504:
         msg = Text("\nNASA API error: ", style="err")
         msg.append("Please try again later.\n", style="body.text")
         console.print(msg)
@@ -203,18 +270,19 @@ def get_apod_for_specific_day() -> Any:
                     create_data_directory()
 
                 # Valid date at this point
-                full_url = f"{BASE_URL}?api_key={NASA_API_KEY}&date={date_object}"
-                # print(f"\nDEBUG: Fetching APOD for {date_object}...")
-                response = requests.get(full_url)
+                try:
+                    status_code, apod_raw_data = _fetch_apod_payload(date_object.isoformat())
+                except requests.RequestException as error:
+                    _print_network_error(error)
+                    continue
 
-                if response.status_code == 200:
+                if status_code == 200:
                     msg = Text("\nSuccess: ", style="ok")
                     msg.append("APOD was retrieved ", style="body.text")
                     msg.append("✓", style="ok")
                     msg.append("\n", style="body.text")
                     console.print(msg)
                     # print("[DEBUG]: HTTP Response = 200")
-                    apod_raw_data = response.json()
 
                     save_setting = get_automatically_save_apod_files()
                     should_save_file = save_setting and save_setting.get("automatically_save_apod_files") == "yes"
@@ -222,8 +290,7 @@ def get_apod_for_specific_day() -> Any:
                     existing_local_file_path = _get_existing_local_file_path(apod_raw_data)
                     apod_data = format_apod_data(apod_raw_data, local_file_path=existing_local_file_path)
 
-                    log_data_to_csv(apod_data)
-                    log_data_to_json(apod_data)
+                    log_apod_entry(apod_data)
 
                     redirect_url = apod_data['url']
                     automatically_redirect_setting = get_automatically_redirect_setting()
@@ -239,8 +306,7 @@ def get_apod_for_specific_day() -> Any:
                         console.print()
                         local_file_path = maybe_download_apod_file(apod_raw_data, True)
                         if local_file_path:
-                            update_local_file_path_in_csv(apod_data['date'], local_file_path)
-                            update_local_file_path_in_json(apod_data['date'], local_file_path)
+                            update_local_file_path(apod_data['date'], local_file_path)
 
                     wallpaper_setting = get_automatically_set_wallpaper()
                     should_set_wallpaper = wallpaper_setting and wallpaper_setting.get("automatically_set_wallpaper") == "yes"
@@ -248,12 +314,12 @@ def get_apod_for_specific_day() -> Any:
                         console.print()
                         apply_auto_wallpaper_for_single_apod(apod_raw_data)
 
-                elif response.status_code == 404 or response.status_code == 403:
+                elif status_code == 404 or status_code == 403:
                     msg = Text("\nRequest error: ", style="err")
                     msg.append("Verify your API key and try again.\n", style="body.text")
                     console.print(msg)
 
-                elif response.status_code == 500 or response.status_code == 503 or response.status_code == 504:
+                elif status_code == 500 or status_code == 503 or status_code == 504:
                     msg = Text("\nNASA API error: ", style="err")
                     msg.append("Please try again later.\n", style="body.text")
                     console.print(msg)
@@ -316,10 +382,11 @@ def get_random_n_apods() -> Any:
                         continue
 
 
-                    full_url = f"{BASE_URL}?api_key={NASA_API_KEY}&count={n}"
-                    # print(f"[DEBUG]: Fetching {n} random APODs...")
-                    # print(f"[DEBUG] Request URL: {full_url}")
-                    response = requests.get(full_url)
+                    try:
+                        response = _request_apod({"count": n})
+                    except requests.RequestException as error:
+                        _print_network_error(error)
+                        continue
 
                     list_of_formatted_apod_entries = []
                     list_of_unformatted_apod_entries = []
@@ -332,7 +399,8 @@ def get_random_n_apods() -> Any:
                         console.print(msg)
 
                         # print("[DEBUG]: HTTP Response = 200")
-                        list_of_unformatted_apod_entries = response.json()
+                        list_of_unformatted_apod_entries = decode_json_response(response)
+                        store_cached_apods(list_of_unformatted_apod_entries)
 
                         save_setting = get_automatically_save_apod_files()
                         should_save_file = save_setting and save_setting.get("automatically_save_apod_files") == "yes"
@@ -347,8 +415,7 @@ def get_random_n_apods() -> Any:
                             console.print(msg)
                             create_data_directory()
 
-                        log_multiple_csv_entries(list_of_formatted_apod_entries, show_individual_success_messages=False)
-                        log_multiple_json_entries(list_of_formatted_apod_entries, show_individual_success_messages=False)
+                        log_apod_entries(list_of_formatted_apod_entries, show_individual_success_messages=False)
 
                         msg = Text("Success: ", style="ok")
                         msg.append(str(n), style="app.primary")
@@ -370,41 +437,8 @@ def get_random_n_apods() -> Any:
 
                         if should_save_file:
                             console.print()
-                            apods_to_save = [
-                                apod_raw for apod_raw in list_of_unformatted_apod_entries
-                                if not _get_existing_local_file_path(apod_raw)
-                            ]
-                            if apods_to_save:
-                                with Progress(
-                                    SpinnerColumn(style="app.primary"),
-                                    TextColumn(
-                                        "[body.text]Saving [/body.text][app.primary]{task.fields[file_count]}[/app.primary]"
-                                        "[body.text] APOD files to Downloads...[/body.text]"
-                                    ),
-                                    BarColumn(bar_width=None, complete_style="app.primary", finished_style="ok"),
-                                    TextColumn("[app.secondary]{task.percentage:>3.0f}%[/app.secondary]"),
-                                    console=console,
-                                    transient=True,
-                                    expand=True,
-                                ) as progress:
-                                    task_id = progress.add_task(
-                                        "save-random-apods",
-                                        total=len(apods_to_save),
-                                        file_count=str(len(apods_to_save)),
-                                    )
-                                    for apod_raw in list_of_unformatted_apod_entries:
-                                        if _get_existing_local_file_path(apod_raw):
-                                            maybe_download_apod_file(apod_raw, True, show_progress=False)
-                                            continue
-
-                                        local_file_path = maybe_download_apod_file(apod_raw, True, show_progress=False)
-                                        if local_file_path:
-                                            update_local_file_path_in_csv(apod_raw['date'], local_file_path)
-                                            update_local_file_path_in_json(apod_raw['date'], local_file_path)
-                                        progress.advance(task_id)
-                            else:
-                                for apod_raw in list_of_unformatted_apod_entries:
-                                    maybe_download_apod_file(apod_raw, True, show_progress=False)
+                            saved_file_paths = download_apod_files(list_of_unformatted_apod_entries)
+                            update_local_file_paths(saved_file_paths)
 
                     elif response.status_code == 404 or response.status_code == 403:
                         msg = Text("\nRequest error: ", style="err")
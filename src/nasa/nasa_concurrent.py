@@ -0,0 +1,177 @@
+"""
+nasa_concurrent.py
+
+Concurrent multi-date APOD fetching with bounded parallelism.
+Dates are fetched on a thread pool, results are yielded as they complete,
+and every date succeeds or fails on its own.
+"""
+from __future__ import annotations
+
+import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+import requests
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from rich.text import Text
+
+from src.config import CONCURRENT_FETCH_WORKERS, DATE_TODAY, NASA_APOD_START_DATE
+from src.nasa.nasa_client import _fetch_apod_payload
+from src.nasa.nasa_rate_limit import print_projected_completion
+from src.startup.console import console
+from src.storage.data_storage import check_if_data_exists, create_data_directory
+from src.storage.log_storage import log_apod_entry
+from src.utils.apod_media_utils import _get_existing_local_file_path
+from src.utils.data_utils import format_apod_data
+
+
+@dataclass(frozen=True)
+class DateFetchResult:
+    """
+    Outcome of fetching one APOD date: either the raw API payload or an error message.
+    """
+    date: str
+    apod_data: dict[str, Any] | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _validate_apod_date(date_value: str) -> str | None:
+    """Return an error message when ``date_value`` is not a fetchable APOD date."""
+    try:
+        date_object = datetime.date.fromisoformat(date_value)
+    except ValueError:
+        return "Not a valid YYYY-MM-DD date."
+
+    if date_object < NASA_APOD_START_DATE or date_object > DATE_TODAY:
+        return f"Outside the APOD range {NASA_APOD_START_DATE} -> {DATE_TODAY}."
+
+    return None
+
+
+def fetch_single_date(date_value: str) -> DateFetchResult:
+    """Fetch the APOD for one date (cache first) and wrap the outcome in a ``DateFetchResult``."""
+    validation_error = _validate_apod_date(date_value)
+    if validation_error is not None:
+        return DateFetchResult(date_value, error=validation_error)
+
+    try:
+        status_code, apod_raw_data = _fetch_apod_payload(date_value, paced=True)
+    except requests.RequestException as error:
+        return DateFetchResult(date_value, error=f"Network error: {error}")
+
+    if status_code != 200:
+        return DateFetchResult(date_value, error=f"HTTP {status_code}")
+
+    return DateFetchResult(date_value, apod_data=apod_raw_data)
+
+
+def fetch_apods_for_dates(dates: Iterable[str], max_workers: int = CONCURRENT_FETCH_WORKERS) -> Iterator[DateFetchResult]:
+    """
+    Fetch many APOD dates concurrently and yield each result as soon as it completes.
+
+    Duplicate dates are fetched once. Results arrive in completion order, not
+    input order. In-flight requests per host are additionally capped by the
+    shared HTTP transport, and API calls are paced to stay under the quota.
+
+    Args:
+        dates: ISO ``YYYY-MM-DD`` date strings to fetch.
+        max_workers: Maximum number of worker threads.
+
+    Returns:
+        Iterator[DateFetchResult]: One result per unique date.
+    """
+    unique_dates = list(dict.fromkeys(date_value.strip() for date_value in dates))
+    if not unique_dates:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique_dates)))) as executor:
+        futures = {executor.submit(fetch_single_date, date_value): date_value for date_value in unique_dates}
+
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as error:
+                yield DateFetchResult(futures[future], error=str(error))
+
+
+def log_apods_for_dates(dates: Iterable[str], max_workers: int = CONCURRENT_FETCH_WORKERS) -> list[DateFetchResult]:
+    """
+    Fetch many APOD dates concurrently and log each success to the CSV and JSONL logs.
+
+    Formatting and logging happen on the calling thread as each result arrives,
+    so log writes stay sequential while the network requests overlap.
+
+    Returns:
+        list[DateFetchResult]: The results for dates that failed.
+    """
+    dates = list(dict.fromkeys(date_value.strip() for date_value in dates))
+
+    if not check_if_data_exists():
+        msg = Text("Data directory not found. Creating it...\n", style="body.text")
+        console.print(msg)
+        create_data_directory()
+
+    print_projected_completion(len(dates))
+
+    failures = []
+    logged_count = 0
+
+    with Progress(
+        SpinnerColumn(style="app.primary"),
+        TextColumn("[body.text]Fetching APODs...[/body.text]"),
+        BarColumn(bar_width=None, complete_style="app.primary", finished_style="ok"),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True,
+        expand=True,
+    ) as progress:
+        task_id = progress.add_task("fetch-dates", total=len(dates))
+
+        for result in fetch_apods_for_dates(dates, max_workers):
+            progress.advance(task_id)
+
+            failure = log_fetch_result(result)
+            if failure is not None:
+                failures.append(failure)
+            else:
+                logged_count += 1
+
+    print_fetch_summary(logged_count, failures)
+    return failures
+
+
+def log_fetch_result(result: DateFetchResult) -> DateFetchResult | None:
+    """Format a successful result and log it; return the failure otherwise."""
+    if not result.ok:
+        return result
+
+    try:
+        existing_local_file_path = _get_existing_local_file_path(result.apod_data)
+        apod_data = format_apod_data(result.apod_data, local_file_path=existing_local_file_path)
+    except (KeyError, IndexError, AttributeError):
+        return DateFetchResult(result.date, error="Response is missing required fields.")
+
+    log_apod_entry(apod_data, show_individual_success_message=False)
+    return None
+
+
+def print_fetch_summary(logged_count: int, failures: list[DateFetchResult]) -> None:
+    """Print how many dates were logged, followed by one line per failed date."""
+    msg = Text("\nSuccess: ", style="ok")
+    msg.append(str(logged_count), style="app.primary")
+    msg.append(" APODs were retrieved and logged ", style="body.text")
+    msg.append("✓", style="ok")
+    console.print(msg)
+
+    for failure in sorted(failures, key=lambda result: result.date):
+        msg = Text("Failed: ", style="err")
+        msg.append(failure.date, style="app.primary")
+        msg.append(f" ({failure.error})", style="body.text")
+        console.print(msg)
+
+    console.print()
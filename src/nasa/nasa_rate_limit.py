@@ -0,0 +1,126 @@
+"""
+nasa_rate_limit.py
+
+Token-bucket scheduler that paces APOD API calls using the
+``X-RateLimit-Limit`` / ``X-RateLimit-Remaining`` headers returned by
+api.nasa.gov, so long bulk runs stay just under the hourly quota instead of
+running into 429 errors.
+"""
+from __future__ import annotations
+
+import datetime
+import threading
+import time
+from typing import Mapping
+
+from rich.text import Text
+
+from src.config import RATE_LIMIT_DEFAULT_PER_HOUR, RATE_LIMIT_RESERVE
+from src.startup.console import console
+
+RATE_LIMIT_WINDOW_SECONDS = 3600
+
+
+class RateLimitScheduler:
+    """
+    Thread-safe token bucket sized from the API's rate-limit headers.
+
+    The bucket holds at most ``limit - reserve`` tokens and refills at
+    ``limit / hour``. Every paced request takes one token, and every response
+    clamps the bucket to what the server says is actually left. The reserve
+    keeps a few requests free for interactive use during a long backfill.
+    """
+
+    def __init__(self, limit_per_hour: int = RATE_LIMIT_DEFAULT_PER_HOUR, reserve: int = RATE_LIMIT_RESERVE) -> None:
+        self._lock = threading.Lock()
+        self.reserve = reserve
+        self.limit = limit_per_hour
+        self.remaining: int | None = None
+        self._tokens = float(max(0, limit_per_hour - reserve))
+        self._refilled_at = time.monotonic()
+
+    @property
+    def refill_rate(self) -> float:
+        """Tokens regained per second."""
+        return self.limit / RATE_LIMIT_WINDOW_SECONDS
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        capacity = max(0, self.limit - self.reserve)
+        self._tokens = min(capacity, self._tokens + (now - self._refilled_at) * self.refill_rate)
+        self._refilled_at = now
+
+    def acquire(self) -> float:
+        """Block until a request may be sent, take one token, and return the seconds waited."""
+        waited_seconds = 0.0
+
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited_seconds
+
+                wait_seconds = (1 - self._tokens) / self.refill_rate if self.refill_rate else 1.0
+
+            time.sleep(wait_seconds)
+            waited_seconds += wait_seconds
+
+    def update_from_headers(self, headers: Mapping[str, str], status_code: int | None = None) -> None:
+        """Re-sync the bucket with the server's view of the quota after a response."""
+        limit_header = headers.get("X-RateLimit-Limit")
+        remaining_header = headers.get("X-RateLimit-Remaining")
+
+        with self._lock:
+            self._refill()
+
+            if limit_header is not None and limit_header.isdigit():
+                self.limit = int(limit_header)
+
+            if remaining_header is not None and remaining_header.isdigit():
+                self.remaining = int(remaining_header)
+                self._tokens = min(self._tokens, float(max(0, self.remaining - self.reserve)))
+
+            if status_code == 429:
+                self.remaining = 0
+                self._tokens = 0.0
+
+    def estimate_seconds_for(self, request_count: int) -> float:
+        """Estimate how long ``request_count`` paced requests will take to be admitted."""
+        with self._lock:
+            self._refill()
+            shortfall = request_count - self._tokens
+
+        if shortfall <= 0:
+            return 0.0
+
+        return shortfall / self.refill_rate if self.refill_rate else float("inf")
+
+    def projected_completion(self, request_count: int) -> datetime.datetime:
+        """Return the wall-clock time by which ``request_count`` requests should be done."""
+        return datetime.datetime.now() + datetime.timedelta(seconds=self.estimate_seconds_for(request_count))
+
+
+api_rate_limiter = RateLimitScheduler()
+
+
+def print_projected_completion(request_count: int) -> None:
+    """Print how many API calls a bulk run needs and when the quota allows it to finish."""
+    seconds = api_rate_limiter.estimate_seconds_for(request_count)
+
+    msg = Text("\nAPI calls needed: ", style="app.secondary")
+    msg.append(f"up to {request_count}", style="app.primary")
+
+    if api_rate_limiter.remaining is not None:
+        msg.append(" | Quota remaining: ", style="body.text")
+        msg.append(f"{api_rate_limiter.remaining}/{api_rate_limiter.limit}", style="app.primary")
+
+    if seconds > 0:
+        finish_at = api_rate_limiter.projected_completion(request_count)
+        msg.append(" | Paced to finish around ", style="body.text")
+        msg.append(finish_at.strftime("%H:%M:%S"), style="app.primary")
+        msg.append(f" (~{int(seconds // 60)} min)", style="body.text")
+    else:
+        msg.append(" | Within current quota", style="body.text")
+
+    console.print(msg)
@@ -0,0 +1,130 @@
+"""
+nasa_sampling.py
+
+Headless random sampling of APOD dates that are not logged yet.
+Unlike the API's ``count`` parameter (capped at 100 and blind to the local
+log), dates are drawn locally from the unlogged part of the archive and only
+those dates are requested, so ``n`` can run into the thousands and every
+successful call adds a new entry.
+"""
+from __future__ import annotations
+
+import datetime
+import random
+
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+from rich.text import Text
+
+from src.config import CONCURRENT_FETCH_WORKERS, DATE_TODAY, NASA_APOD_START_DATE, RANDOM_SAMPLE_BATCH_SIZE
+from src.nasa.nasa_concurrent import DateFetchResult, fetch_apods_for_dates, log_fetch_result, print_fetch_summary
+from src.nasa.nasa_rate_limit import print_projected_completion
+from src.startup.console import console
+from src.storage.data_storage import check_if_data_exists, create_data_directory
+from src.storage.log_storage import get_logged_dates
+
+# Consecutive batches in which every date failed before the run gives up.
+MAX_CONSECUTIVE_FAILED_BATCHES = 3
+
+
+def get_unlogged_dates() -> list[str]:
+    """Return every APOD date from ``NASA_APOD_START_DATE`` to today that is not logged yet."""
+    logged_dates = get_logged_dates()
+    day_count = (DATE_TODAY - NASA_APOD_START_DATE).days + 1
+
+    unlogged_dates = []
+    for offset in range(day_count):
+        date_value = (NASA_APOD_START_DATE + datetime.timedelta(days=offset)).isoformat()
+        if date_value not in logged_dates:
+            unlogged_dates.append(date_value)
+
+    return unlogged_dates
+
+
+def log_random_unlogged_apods(
+    n: int,
+    batch_size: int = RANDOM_SAMPLE_BATCH_SIZE,
+    max_workers: int = CONCURRENT_FETCH_WORKERS,
+) -> int:
+    """
+    Log ``n`` APODs picked uniformly at random from the dates not yet logged.
+
+    The unlogged dates are shuffled once and consumed in batches. Dates that
+    fail (e.g. days without an APOD) are replaced by the next dates in the
+    shuffle, so the run keeps going until ``n`` entries were logged or the
+    archive runs out of unlogged dates. ``MAX_CONSECUTIVE_FAILED_BATCHES``
+    batches in a row in which every date fails stop the run, since that
+    points to a network or quota problem rather than to individual missing
+    days (a small final batch can fail entirely on its own).
+
+    Args:
+        n: Number of new entries to log.
+        batch_size: Dates requested per batch.
+        max_workers: Worker threads used within a batch.
+
+    Returns:
+        int: Number of entries logged.
+    """
+    if n < 1:
+        msg = Text("Input error: ", style="err")
+        msg.append("Sample size must be a positive number.", style="body.text")
+        console.print(msg)
+        return 0
+
+    if not check_if_data_exists():
+        msg = Text("Data directory not found. Creating it...\n", style="body.text")
+        console.print(msg)
+        create_data_directory()
+
+    candidates = get_unlogged_dates()
+    random.shuffle(candidates)
+
+    if len(candidates) < n:
+        msg = Text("\nOnly ", style="body.text")
+        msg.append(str(len(candidates)), style="app.primary")
+        msg.append(" dates are not logged yet; sampling all of them.", style="body.text")
+        console.print(msg)
+        n = len(candidates)
+
+    if n == 0:
+        return 0
+
+    print_projected_completion(n)
+
+    logged_count = 0
+    failures: list[DateFetchResult] = []
+    next_index = 0
+    failed_batches = 0
+
+    with Progress(
+        SpinnerColumn(style="app.primary"),
+        TextColumn("[body.text]Sampling unlogged APODs[/body.text]"),
+        BarColumn(bar_width=None, complete_style="app.primary", finished_style="ok"),
+        MofNCompleteColumn(),
+        console=console,
+        transient=True,
+        expand=True,
+    ) as progress:
+        task_id = progress.add_task("sample", total=n)
+
+        while logged_count < n and next_index < len(candidates):
+            batch_count = min(batch_size, n - logged_count, len(candidates) - next_index)
+            batch = candidates[next_index:next_index + batch_count]
+            next_index += batch_count
+
+            batch_logged_count = 0
+            for result in fetch_apods_for_dates(batch, max_workers=max_workers):
+                failure = log_fetch_result(result)
+                if failure is not None:
+                    failures.append(failure)
+                    continue
+
+                batch_logged_count += 1
+                progress.advance(task_id)
+
+            logged_count += batch_logged_count
+            failed_batches = failed_batches + 1 if batch_logged_count == 0 else 0
+            if failed_batches >= MAX_CONSECUTIVE_FAILED_BATCHES:
+                break
+
+    print_fetch_summary(logged_count, failures)
+    return logged_count
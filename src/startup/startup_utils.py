@@ -25,17 +25,23 @@ from src.startup.startup_art import (
     render_satellite_startup_art1,
 )
 from src.storage.data_storage import check_if_data_exists, create_data_directory
-from src.storage.json_storage import (
-    show_first_n_json_log_entries,
-    show_last_n_json_log_entries,
-    show_all_json_entries,
-    delete_one_json_entry,
-    fetch_most_recent_json_apod,
-    fetch_oldest_json_apod,
+from src.storage.log_storage import (
+    is_sqlite_backend,
+    is_sharded_backend,
+    show_first_n_log_entries,
+    show_last_n_log_entries,
+    show_all_log_entries,
+    delete_log_entry,
+    fetch_most_recent_apod,
+    fetch_oldest_apod,
+    clear_logs,
+    get_log_entry_count,
 )
-from src.storage.csv_storage import delete_one_csv_entry
-from src.utils.json_utils import clear_json_output_file, check_if_json_output_exists, create_json_output_file, get_line_count
-from src.utils.csv_utils import clear_csv_output_file, check_if_csv_output_exists, create_csv_output_file, write_header_to_csv
+from src.storage.sqlite_storage import check_if_sqlite_db_exists, create_sqlite_database, is_sqlite_import_complete
+from src.storage.sharded_storage import check_if_sharded_log_exists, create_sharded_log, is_sharded_migration_complete
+from src.storage.derived_csv import schedule_csv_refresh
+from src.utils.json_utils import check_if_json_output_exists, create_json_output_file
+from src.utils.csv_utils import check_if_csv_output_exists, create_csv_output_file
 import random
 from src.startup.console import console
 from src.utils.box_utils import build_box_lines, stylize_line
@@ -185,18 +191,15 @@ def output_files_menu() -> Any:
 
         match user_choice:
             case 1:
-                show_first_n_json_log_entries()
+                show_first_n_log_entries()
             case 2:
-                show_last_n_json_log_entries()
+                show_last_n_log_entries()
             case 3:
-                show_all_json_entries()
+                show_all_log_entries()
             case 4:
                 target_date = ask_user_for_date()
 
-                found_json = delete_one_json_entry(target_date)
-                found_csv = delete_one_csv_entry(target_date)
-
-                if found_json and found_csv:
+                if delete_log_entry(target_date):
                     msg = Text("\nDeleted entry: ", style="body.text")
                     msg.append(str(target_date), style="app.primary")
                     msg.append(" ", style="body.text")
@@ -209,18 +212,16 @@ def output_files_menu() -> Any:
                     msg.append("X\n", style="err")
                     console.print(msg)
             case 5:
-                fetch_most_recent_json_apod()
+                fetch_most_recent_apod()
             case 6:
-                fetch_oldest_json_apod()
+                fetch_oldest_apod()
             case 7:
-                if clear_json_output_file() and clear_csv_output_file():
+                if clear_logs():
                     msg = Text("\nAll log files have been cleared ", style="body.text")
                     msg.append("✓\n", style="ok")
                     console.print(msg)
-
-                    write_header_to_csv()
             case 8:
-                line_count = get_line_count(0)
+                line_count = get_log_entry_count()
 
                 msg = Text("\nTotal logged entries: ", style="app.secondary")
                 msg.append(f"{line_count}", style="app.primary")
@@ -383,6 +384,8 @@ def run_startup_checks() -> list[str]:
     settings_status = "Found"
     json_status = "Found"
     csv_status = "Found"
+    sqlite_status = "Found"
+    sharded_status = "Found"
 
     if not check_if_data_exists():
         create_data_directory()
@@ -392,13 +395,30 @@ def run_startup_checks() -> list[str]:
         create_user_settings()
         settings_status = "Created"
 
-    if not check_if_json_output_exists():
-        create_json_output_file()
-        json_status = "Created"
+    if is_sqlite_backend():
+        # The flat logs are exports in this mode and are only written by --export.
+        # Importing an existing output.jsonl is retried until it has completed.
+        if not is_sqlite_import_complete():
+            if not check_if_sqlite_db_exists():
+                sqlite_status = "Created"
+            create_sqlite_database()
+    elif is_sharded_backend():
+        # Migrates an existing output.jsonl into the year shards; retried until it has completed.
+        if not is_sharded_migration_complete():
+            if not check_if_sharded_log_exists():
+                sharded_status = "Created"
+            create_sharded_log()
+    else:
+        if not check_if_json_output_exists():
+            create_json_output_file()
+            json_status = "Created"
+
+        if not check_if_csv_output_exists():
+            create_csv_output_file()
+            csv_status = "Created"
 
-    if not check_if_csv_output_exists():
-        create_csv_output_file()
-        csv_status = "Created"
+        # No-op unless CSV_LOG_MODE=derived; brings output.csv up to date with output.jsonl.
+        schedule_csv_refresh()
 
     settings_dict = get_all_user_settings()
     automatically_redirect_setting = settings_dict["automatically_redirect"]
@@ -420,10 +440,19 @@ def run_startup_checks() -> list[str]:
     else:
         automatically_save_apod_files_message = f"Auto-save APOD files  X OFF"
 
+    if is_sqlite_backend():
+        storage_lines = [f"SQLite database       ✓ {sqlite_status}"]
+    elif is_sharded_backend():
+        storage_lines = [f"Sharded logs          ✓ {sharded_status}"]
+    else:
+        storage_lines = [
+            f"JSONL log             ✓ {json_status}",
+            f"CSV log               ✓ {csv_status}",
+        ]
+
     return [
         f"Data directory        ✓ {data_dir_status}",
-        f"JSONL log             ✓ {json_status}",
-        f"CSV log               ✓ {csv_status}",
+        *storage_lines,
         f"User settings         ✓ {settings_status}",
         automatically_redirect_setting_message,
         automatically_set_wallpaper_setting_message,
@@ -0,0 +1,161 @@
+"""
+apod_record.py
+
+Compact in-memory representation of one logged APOD.
+``ApodRecord`` uses ``__slots__`` and stores:
+    - the APOD date as a date ordinal (``int``),
+    - ``logged_at`` as epoch seconds of its wall-clock time (``int``),
+    - ``url`` and ``local_file_path`` as an interned directory prefix plus a
+      file name, so the viewer/media directories shared by every entry (and
+      the "Not saved yet" sentinel) are stored once.
+Values that do not match the expected formats (e.g. hand-edited logs) are kept
+as the original strings, so converting back to the on-disk form is exact.
+"""
+from __future__ import annotations
+
+import datetime
+import re
+import sys
+from typing import Any, Sequence
+
+NOT_SAVED_YET = sys.intern("Not saved yet")
+
+# Written by data_utils.format_apod_data.
+_LOGGED_AT_PATTERN = re.compile(r"Day: (\d{2})-(\d{2})-(\d{4}) \| Time: (\d{2}):(\d{2}):(\d{2})")
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86400
+
+
+def date_to_ordinal(value: str) -> int | str:
+    """Convert ``YYYY-MM-DD`` to a date ordinal (any other value is returned unchanged)."""
+    if isinstance(value, str) and len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return datetime.date.fromisoformat(value).toordinal()
+        except ValueError:
+            pass
+    return value
+
+
+def ordinal_to_date(value: int | str) -> str:
+    return datetime.date.fromordinal(value).isoformat() if isinstance(value, int) else value
+
+
+def logged_at_to_epoch(value: str) -> int | str:
+    """Convert a ``Day: MM-DD-YYYY | Time: HH:MM:SS`` stamp to epoch seconds (any other value is returned unchanged)."""
+    match = _LOGGED_AT_PATTERN.fullmatch(value) if isinstance(value, str) else None
+    if match is None:
+        return value
+
+    month, day, year, hour, minute, second = map(int, match.groups())
+    if hour > 23 or minute > 59 or second > 59:
+        return value
+
+    try:
+        ordinal = datetime.date(year, month, day).toordinal()
+    except ValueError:
+        return value
+
+    return (ordinal - _EPOCH_ORDINAL) * _SECONDS_PER_DAY + hour * 3600 + minute * 60 + second
+
+
+def epoch_to_logged_at(value: int | str) -> str:
+    if not isinstance(value, int):
+        return value
+
+    days, seconds = divmod(value, _SECONDS_PER_DAY)
+    day_value = datetime.date.fromordinal(days + _EPOCH_ORDINAL)
+    hour, seconds = divmod(seconds, 3600)
+    minute, second = divmod(seconds, 60)
+    return (
+        f"Day: {day_value.month:02d}-{day_value.day:02d}-{day_value.year:04d} "
+        f"| Time: {hour:02d}:{minute:02d}:{second:02d}"
+    )
+
+
+def _split_path(value: str) -> tuple[str, str]:
+    """Split a URL or path after its last separator, interning the (shared) directory prefix."""
+    cut = max(value.rfind("/"), value.rfind("\\")) + 1
+    if cut == 0:
+        return "", sys.intern(value)
+    return sys.intern(value[:cut]), value[cut:]
+
+
+class ApodRecord:
+    """
+    One logged APOD snapshot. Fields read and convert like the on-disk strings;
+    use ``from_dict``/``to_dict`` and ``from_row``/``to_row`` at format boundaries.
+    """
+
+    __slots__ = ("_date", "title", "_url_prefix", "_url_name", "explanation", "_logged_at", "_path_prefix", "_path_name")
+
+    FIELDS = ("date", "title", "url", "explanation", "logged_at", "local_file_path")
+
+    def __init__(self, date: str, title: str, url: str, explanation: str, logged_at: str, local_file_path: str) -> None:
+        self._date = date_to_ordinal(date)
+        self.title = title
+        self._url_prefix, self._url_name = _split_path(url)
+        self.explanation = explanation
+        self._logged_at = logged_at_to_epoch(logged_at)
+        self._path_prefix, self._path_name = _split_path(local_file_path)
+
+    @classmethod
+    def from_dict(cls, entry: dict[str, Any]) -> ApodRecord:
+        return cls(
+            date=entry["date"],
+            title=entry.get("title", ""),
+            url=entry.get("url") or "",
+            explanation=entry.get("explanation", ""),
+            logged_at=entry.get("logged_at") or "",
+            local_file_path=entry.get("local_file_path") or NOT_SAVED_YET,
+        )
+
+    @classmethod
+    def from_row(cls, row: Sequence[str]) -> ApodRecord:
+        """Build a record from values in ``FIELDS`` order (e.g. a database row)."""
+        return cls(*row)
+
+    @property
+    def date(self) -> str:
+        return ordinal_to_date(self._date)
+
+    @property
+    def date_ordinal(self) -> int | None:
+        return self._date if isinstance(self._date, int) else None
+
+    @property
+    def url(self) -> str:
+        return self._url_prefix + self._url_name
+
+    @property
+    def logged_at(self) -> str:
+        return epoch_to_logged_at(self._logged_at)
+
+    @property
+    def logged_at_epoch(self) -> int | None:
+        return self._logged_at if isinstance(self._logged_at, int) else None
+
+    @property
+    def local_file_path(self) -> str:
+        return self._path_prefix + self._path_name
+
+    def to_row(self) -> tuple[str, ...]:
+        return self.date, self.title, self.url, self.explanation, self.logged_at, self.local_file_path
+
+    def to_dict(self) -> dict[str, str]:
+        return dict(zip(self.FIELDS, self.to_row()))
+
+    def replace(self, **fields: Any) -> ApodRecord:
+        """Return a copy with some fields changed (unknown field names are ignored)."""
+        values = self.to_dict()
+        values.update((key, value) for key, value in fields.items() if key in values)
+        return ApodRecord(**values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ApodRecord):
+            return NotImplemented
+        return self.to_row() == other.to_row()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"ApodRecord(date={self.date!r}, title={self.title!r})"
@@ -0,0 +1,279 @@
+"""
+cache_storage.py
+
+On-disk cache of raw APOD API responses, keyed by APOD date.
+Past entries never change, so they are served locally forever (subject to the
+size limits); entries for the most recent days get a short TTL because NASA
+can still edit them during the day. Expired entries keep the response's
+validators, so they can be revalidated with a conditional request.
+
+Past dates that a range response confirmed have no APOD (gap days in the
+archive) are stored as ``"missing"`` markers, so a cached range containing
+them can still be served without an API call.
+
+The validators of downloaded media files are stored here as well, one small
+record per APOD date.
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from src.config import (
+    APOD_CACHE_MAX_BYTES,
+    APOD_CACHE_MAX_ENTRIES,
+    APOD_CACHE_RECENT_TTL_SECONDS,
+    DATE_TODAY,
+    apod_cache_dir,
+    media_validators_dir,
+)
+from src.utils import json_codec
+
+# After an eviction pass the cache is trimmed to this fraction of its limits,
+# so the (full directory) eviction scan runs rarely instead of on every write.
+_EVICTION_LOW_WATER_MARK = 0.9
+
+_cache_lock = threading.Lock()
+_cache_totals: dict[str, int] | None = None
+
+
+def _get_cache_file_path(date_value: str) -> Path:
+    return apod_cache_dir / f"{date_value}.json"
+
+
+def _is_recent_date(date_value: str) -> bool:
+    """Return True for dates that NASA may still change (today, plus one day of timezone slack)."""
+    try:
+        date_object = datetime.date.fromisoformat(date_value)
+    except ValueError:
+        return False
+
+    return date_object >= DATE_TODAY - datetime.timedelta(days=1)
+
+
+def _scan_cache_files() -> list[tuple[Path, os.stat_result]]:
+    """Return ``(path, stat)`` pairs for every cached response file."""
+    if not apod_cache_dir.is_dir():
+        return []
+
+    return [(path, path.stat()) for path in apod_cache_dir.glob("*.json") if path.is_file()]
+
+
+def _get_cache_totals() -> dict[str, int]:
+    """Return the running entry/byte totals, scanning the cache directory on first use."""
+    global _cache_totals
+
+    if _cache_totals is None:
+        cache_files = _scan_cache_files()
+        _cache_totals = {
+            "entries": len(cache_files),
+            "bytes": sum(stat.st_size for _, stat in cache_files),
+        }
+
+    return _cache_totals
+
+
+def _evict_least_recently_used() -> None:
+    """Delete least-recently-used entries until the cache is back under its limits."""
+    global _cache_totals
+
+    cache_files = sorted(_scan_cache_files(), key=lambda item: item[1].st_mtime)
+    entry_count = len(cache_files)
+    byte_count = sum(stat.st_size for _, stat in cache_files)
+
+    target_entries = int(APOD_CACHE_MAX_ENTRIES * _EVICTION_LOW_WATER_MARK)
+    target_bytes = int(APOD_CACHE_MAX_BYTES * _EVICTION_LOW_WATER_MARK)
+
+    for path, stat in cache_files:
+        if entry_count <= target_entries and byte_count <= target_bytes:
+            break
+
+        try:
+            path.unlink()
+        except OSError:
+            continue
+
+        entry_count -= 1
+        byte_count -= stat.st_size
+
+    _cache_totals = {"entries": entry_count, "bytes": byte_count}
+
+
+def get_cached_apod_entry(date_value: str) -> dict[str, Any] | None:
+    """
+    Return the stored cache record for an APOD date, ignoring the TTL.
+
+    Returns:
+        dict | None: ``{"date", "fetched_at", "data"}`` (or ``"missing"`` instead of
+        ``"data"`` for a confirmed gap day), or None when nothing is cached.
+    """
+    cache_file_path = _get_cache_file_path(date_value)
+
+    try:
+        with open(file=cache_file_path, mode="rb") as cache_file:
+            return json_codec.loads(cache_file.read())
+    except (OSError, json_codec.JSONDecodeError):
+        return None
+
+
+def get_cached_apod(date_value: str) -> dict[str, Any] | None:
+    """
+    Return the cached raw API payload for an APOD date, or None on a miss.
+
+    Entries for the most recent days expire after ``APOD_CACHE_RECENT_TTL_SECONDS``.
+    Every hit refreshes the file's modification time, which is what the LRU
+    eviction orders by.
+    """
+    cache_entry = get_cached_apod_entry(date_value)
+    if cache_entry is None:
+        return None
+
+    if _is_recent_date(date_value):
+        age_seconds = time.time() - float(cache_entry.get("fetched_at", 0))
+        if age_seconds > APOD_CACHE_RECENT_TTL_SECONDS:
+            return None
+
+    try:
+        os.utime(_get_cache_file_path(date_value))
+    except OSError:
+        pass
+
+    return cache_entry.get("data")
+
+
+def _is_confirmed_missing(date_value: str) -> bool:
+    """Return True for a past date that a range response confirmed has no APOD."""
+    cache_entry = get_cached_apod_entry(date_value)
+    return cache_entry is not None and cache_entry.get("missing") is True and not _is_recent_date(date_value)
+
+
+def get_cached_apod_range(start_date: datetime.date, end_date: datetime.date) -> list[dict[str, Any]] | None:
+    """
+    Return cached payloads for every date in the range, or None if any date is uncached.
+    Dates confirmed to have no APOD are skipped instead of counting as uncached.
+    """
+    payloads = []
+    date_object = start_date
+
+    while date_object <= end_date:
+        date_value = date_object.isoformat()
+        payload = get_cached_apod(date_value)
+        if payload is not None:
+            payloads.append(payload)
+        elif not _is_confirmed_missing(date_value):
+            return None
+
+        date_object += datetime.timedelta(days=1)
+
+    return payloads
+
+
+def store_cached_apod(apod_raw_data: dict[str, Any], validators: dict[str, str] | None = None) -> None:
+    """
+    Store one raw API payload under its APOD date.
+
+    ``validators`` are the response's ETag/Last-Modified values, kept for
+    conditional revalidation once the entry expires. Writes are atomic (temp
+    file + rename), and the LRU eviction pass runs only once the configured
+    entry or byte limit is exceeded.
+    """
+    date_value = str(apod_raw_data.get("date", "")).strip()
+    if not date_value:
+        return
+
+    cache_entry = {"date": date_value, "fetched_at": time.time(), "data": apod_raw_data}
+    if validators:
+        cache_entry["validators"] = validators
+    _write_cache_entry(date_value, cache_entry)
+
+
+def store_missing_apod_dates(date_values: Iterable[str]) -> None:
+    """
+    Remember past dates a complete range response had no entry for.
+    Recent dates are skipped, because their APOD may still be published.
+    """
+    for date_value in date_values:
+        if not _is_recent_date(date_value):
+            _write_cache_entry(date_value, {"date": date_value, "fetched_at": time.time(), "missing": True})
+
+
+def _write_cache_entry(date_value: str, cache_entry: dict[str, Any]) -> None:
+    encoded_entry = json_codec.dumps(cache_entry).encode("utf-8")
+
+    cache_file_path = _get_cache_file_path(date_value)
+
+    try:
+        apod_cache_dir.mkdir(parents=True, exist_ok=True)
+
+        with _cache_lock:
+            totals = _get_cache_totals()
+            previous_size = cache_file_path.stat().st_size if cache_file_path.is_file() else None
+
+            temp_path = cache_file_path.with_suffix(".tmp")
+            with open(file=temp_path, mode="wb") as cache_file:
+                cache_file.write(encoded_entry)
+            temp_path.replace(cache_file_path)
+
+            if previous_size is None:
+                totals["entries"] += 1
+            else:
+                totals["bytes"] -= previous_size
+            totals["bytes"] += len(encoded_entry)
+
+            if totals["entries"] > APOD_CACHE_MAX_ENTRIES or totals["bytes"] > APOD_CACHE_MAX_BYTES:
+                _evict_least_recently_used()
+
+    except OSError:
+        # The cache is an optimization only; a failed write must never break a fetch.
+        return
+
+
+def store_cached_apods(apod_raw_entries: list[dict[str, Any]]) -> None:
+    """Store several raw API payloads (e.g. a range or random-count response)."""
+    for apod_raw_data in apod_raw_entries:
+        store_cached_apod(apod_raw_data)
+
+
+def refresh_cached_apod(cache_entry: dict[str, Any]) -> None:
+    """Restart the TTL of a cache entry the server confirmed unchanged (HTTP 304)."""
+    store_cached_apod(cache_entry["data"], cache_entry.get("validators"))
+
+
+def _get_media_validators_path(date_value: str) -> Path:
+    return media_validators_dir / f"{date_value}.json"
+
+
+def get_media_validators(date_value: str) -> dict[str, Any] | None:
+    """
+    Return the validators recorded when the media file for a date was downloaded.
+
+    Returns:
+        dict | None: ``{"url", "file_path", "etag", "last_modified", "content_length"}``
+        (validator keys only when the server sent them), or None when nothing is recorded.
+    """
+    try:
+        with open(file=_get_media_validators_path(date_value), mode="r", encoding="utf-8") as validators_file:
+            return json.load(validators_file)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def store_media_validators(date_value: str, media_url: str, file_path: Path, validators: dict[str, str]) -> None:
+    """Record the validators of a freshly downloaded media file."""
+    record = {"url": media_url, "file_path": str(file_path), **validators}
+    validators_path = _get_media_validators_path(date_value)
+
+    try:
+        media_validators_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = validators_path.with_suffix(".tmp")
+        with open(file=temp_path, mode="w", encoding="utf-8") as validators_file:
+            json.dump(record, validators_file)
+        temp_path.replace(validators_path)
+    except OSError:
+        return
+
@@ -4,16 +4,23 @@ csv_storage.py
 CSV persistence layer for APOD snapshots.
 Responsible for creating, writing, reading, and rewriting the CSV log.
 """
+import io
+import os
+from itertools import islice
 from typing import Any
 
 from src.utils.csv_utils import (
+    HEADERS,
     csv,
     check_if_csv_output_exists,
     check_for_duplicate_csv_entries,
     format_raw_csv_entry,
-    get_line_count,
+    get_csv_log_repository,
+    get_csv_update_journal,
 )
-from src.config import csv_file_path, csv_file_name, NASA_APOD_START_DATE, DATE_TODAY, DATA_DIR
+from src.config import csv_file_path, csv_file_name, DATA_DIR
+from src.storage.apod_record import ApodRecord
+from src.storage.log_query import ORDER_DATE, ORDER_DATE_DESC, ORDER_LOGGED_DESC, iter_csv_records
 from rich.text import Text
 from src.startup.console import console
 
@@ -42,14 +49,16 @@ def log_data_to_csv(formatted_apod_data: Any, show_individual_success_message: b
             writer = csv.DictWriter(csv_file, fieldnames=formatted_apod_data.keys())
             writer.writerow(formatted_apod_data)
 
-            if show_individual_success_message:
-                msg = Text("Saved: ", style="app.secondary")
-                msg.append("APOD ", style="body.text")
-                msg.append(f"'{formatted_apod_data['date']}'", style="app.primary")
-                msg.append(" -> ", style="body.text")
-                msg.append(f"{csv_file_name} ", style="app.primary")
-                msg.append("✓", style="ok")
-                console.print(msg)
+        get_csv_log_repository().record_appended([ApodRecord.from_dict(formatted_apod_data)])
+
+        if show_individual_success_message:
+            msg = Text("Saved: ", style="app.secondary")
+            msg.append("APOD ", style="body.text")
+            msg.append(f"'{formatted_apod_data['date']}'", style="app.primary")
+            msg.append(" -> ", style="body.text")
+            msg.append(f"{csv_file_name} ", style="app.primary")
+            msg.append("✓", style="ok")
+            console.print(msg)
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
@@ -65,166 +74,105 @@ def log_data_to_csv(formatted_apod_data: Any, show_individual_success_message: b
         console.print(Text(str(e), style="err"))
 
 
-def show_first_n_csv_log_entries() -> Any:
-    """
-     Display the first N logged CSV entries.
+def _print_csv_error(error: Exception, access: str = "read") -> None:
+    """Report a failure to read (or rewrite) the CSV log."""
+    if isinstance(error, PermissionError):
+        msg = Text("\nPermission error: ", style="err")
+        msg.append(f"Unable to {access} ", style="body.text")
+        msg.append(f"'{csv_file_name}'", style="app.primary")
+        msg.append(" at ", style="body.text")
+        msg.append(f"'{csv_file_path}' ", style="app.primary")
+        msg.append("X", style="err")
+        console.print(msg)
+        return
 
-     Args:
-    entries_amount: Number of entries to display.
+    console.print()
+    console.print(Text(str(error), style="err"))
 
-     Returns:
-        None:
-    """
+
+def _ask_csv_entries_amount() -> int | None:
+    """Prompt for how many entries to show; return None (after printing why) on bad input."""
     try:
         entries_amount = int(input("\nEnter number of entries: "))
     except ValueError:
         msg = Text("\nInput error: ", style="err")
         msg.append("Enter a valid number.\n", style="body.text")
         console.print(msg)
-        return
+        return None
     except Exception as e:
         console.print()
         console.print(Text(str(e), style="err"))
-        return
+        return None
 
     if entries_amount < 1:
         msg = Text("\nInput error: ", style="err")
         msg.append("Enter a number of 1 or more.\n", style="body.text")
         console.print(msg)
-        return
+        return None
 
-    if not check_if_csv_output_exists():
-        return
+    return entries_amount
 
-    line_count = get_line_count(count=0)
 
-    if line_count == 0:
+def _show_csv_records(records: list[ApodRecord], requested_amount: int) -> None:
+    if not records:
         console.print(Text("\nNo entries found.\n", style="body.text"))
         return
 
-    if entries_amount > line_count:
+    if requested_amount > len(records):
         msg = Text("\nOnly ", style="body.text")
-        msg.append(str(line_count), style="app.primary")
+        msg.append(str(len(records)), style="app.primary")
         msg.append(" entries available. Showing all available entries.\n", style="body.text")
         console.print(msg)
-        entries_amount = line_count
 
-    count = 0
-    try:
-        with open(file=csv_file_path, mode='r', encoding='utf-8') as csv_file:
-            content = csv.reader(csv_file)
-            for row in content:
-                if not row or row[0] == 'date':
-                    continue
-                format_raw_csv_entry(row, count)
-                count += 1
-                if count == entries_amount:
-                    break
+    for count, record in enumerate(records):
+        format_raw_csv_entry(record.to_dict(), count)
 
-    except PermissionError:
-        msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read ", style="body.text")
-        msg.append(f"'{csv_file_name}'", style="app.primary")
-        msg.append(" at ", style="body.text")
-        msg.append(f"'{csv_file_path}' ", style="app.primary")
-        msg.append("X", style="err")
-        console.print(msg)
 
-    except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
-
-
-def show_last_n_csv_log_entries() -> Any:
+def show_first_n_csv_log_entries() -> Any:
     """
-        Display the last N logged CSV entries.
-
-        Args:
-        entries_amount: Number of entries to display.
+     Display the first N logged CSV entries.
+     Rows are streamed from the start of the log and reading stops after N.
 
-        Returns:
-            None:
+     Returns:
+        None:
     """
-
-    try:
-        entries_amount = int(input("\nEnter number of entries: "))
-
-    except ValueError:
-        msg = Text("\nInput error: ", style="err")
-        msg.append("Enter a valid number.\n", style="body.text")
-        console.print(msg)
+    entries_amount = _ask_csv_entries_amount()
+    if entries_amount is None or not check_if_csv_output_exists():
         return
 
+    try:
+        records = list(islice(iter_csv_records(csv_file_path), entries_amount))
     except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
+        _print_csv_error(e)
         return
 
-    if entries_amount < 1:
-        msg = Text("\nInput error: ", style="err")
-        msg.append("Enter a number of 1 or more.\n", style="body.text")
-        console.print(msg)
-        return
+    _show_csv_records(records, entries_amount)
 
-    if not check_if_csv_output_exists():
-        return
 
-    line_count = get_line_count(count=0)
+def show_last_n_csv_log_entries() -> Any:
+    """
+        Display the last N logged CSV entries.
+        The log is read backwards from its end, so only those N rows are decoded.
 
-    if line_count == 0:
-        console.print(Text("\nNo entries found.\n", style="body.text"))
+        Returns:
+            None:
+    """
+    entries_amount = _ask_csv_entries_amount()
+    if entries_amount is None or not check_if_csv_output_exists():
         return
 
-    if entries_amount > line_count:
-        msg = Text("\nOnly ", style="body.text")
-        msg.append(str(line_count), style="app.primary")
-        msg.append(" entries available. Showing all available entries.", style="body.text")
-        console.print(msg)
-
-        entries_amount = line_count
-
-    entries_list = []
-    count = 0
-
     try:
-        with open(file=csv_file_path, mode='r', encoding='utf-8') as csv_file:
-            content = csv.reader(csv_file)
-
-            for row in content:
-                if not row or row[0] == 'date':
-                    continue
-
-                entries_list.append(row)
-                count += 1
-
-                if count > entries_amount:
-                    entries_list.remove(entries_list[0])
-                    count -= 1
-
-    except PermissionError:
-        msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read ", style="body.text")
-        msg.append(f"'{csv_file_name}'", style="app.primary")
-        msg.append(" at ", style="body.text")
-        msg.append(f"'{csv_file_path}' ", style="app.primary")
-        msg.append("X", style="err")
-        console.print(msg)
-        return
-
+        records = list(islice(iter_csv_records(csv_file_path, order=ORDER_LOGGED_DESC), entries_amount))
     except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
+        _print_csv_error(e)
         return
 
-    count = 0
-    for entry in entries_list:
-        format_raw_csv_entry(entry, count)
-        count += 1
+    _show_csv_records(records[::-1], entries_amount)
 
 
 def show_all_csv_entries() -> Any:
     """
-      Display all logged CSV entries.
+      Display all logged CSV entries, streaming them from the log.
 
       Returns:
           None:
@@ -235,29 +183,12 @@ def show_all_csv_entries() -> Any:
 
     count = 0
     try:
-        with open(file=csv_file_path, mode='r', encoding='utf-8') as csv_file:
-            content = csv.reader(csv_file)
-
-            for row in content:
-                if not row or row[0] == 'date':
-                    continue
-
-                format_raw_csv_entry(row, count)
-                count += 1
-
-
-    except PermissionError:
-        msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read ", style="body.text")
-        msg.append(f"'{csv_file_name}'", style="app.primary")
-        msg.append(" at ", style="body.text")
-        msg.append(f"'{csv_file_path}' ", style="app.primary")
-        msg.append("X", style="err")
-        console.print(msg)
+        for record in iter_csv_records(csv_file_path):
+            format_raw_csv_entry(record.to_dict(), count)
+            count += 1
 
     except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
+        _print_csv_error(e)
 
     if count == 0:
         console.print(Text("No entries found.\n", style="body.text"))
@@ -268,14 +199,13 @@ def delete_one_csv_entry(target_date: Any) -> Any | bool:
     """
         Delete a single CSV entry by its APOD date.
 
-        Prompts the user for a date, removes the matching row, and rewrites the
-        CSV file with the remaining entries.
+        Rows are streamed into a temporary file without the matching row,
+        which then replaces the log; nothing is written when the date is not logged.
 
         Returns:
         Boolean:
     """
 
-    entries_to_keep = []
     viewer_filename = f"apod-{target_date}.html"
     viewer_path = (DATA_DIR / "viewer" / viewer_filename)
 
@@ -283,93 +213,68 @@ def delete_one_csv_entry(target_date: Any) -> Any | bool:
         return False
 
     found = False
+    temp_path = csv_file_path.with_name(csv_file_path.name + ".tmp")
 
     try:
-        # Read phase
-        with open(csv_file_path, mode="r", encoding="utf-8", newline="") as csv_file:
+        with open(csv_file_path, mode="r", encoding="utf-8", newline="") as csv_file, \
+                open(temp_path, mode="w", encoding="utf-8", newline="") as temp_file:
             reader = csv.DictReader(csv_file)
+            writer = csv.DictWriter(temp_file, fieldnames=reader.fieldnames or list(HEADERS.keys()))
+            writer.writeheader()
 
             for row in reader:
                 if row["date"] == target_date:
                     found = True
                     continue
-                entries_to_keep.append(row)
+                writer.writerow(row)
 
         if not found:
+            temp_path.unlink()
             return False
 
-        # Write phase
-        with open(csv_file_path, mode="w", encoding="utf-8", newline="") as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=reader.fieldnames)
-
-            writer.writeheader()
-            writer.writerows(entries_to_keep)
+        temp_path.replace(csv_file_path)
+        get_csv_update_journal().discard(target_date)
+        get_csv_log_repository().invalidate()
 
         if viewer_path.exists() and viewer_path.is_file():
             viewer_path.unlink()
 
         return True
 
-    except PermissionError:
-        msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read/write ", style="body.text")
-        msg.append(f"'{csv_file_name}'", style="app.primary")
-        msg.append(" at ", style="body.text")
-        msg.append(f"'{csv_file_path}' ", style="app.primary")
-        msg.append("X", style="err")
-        console.print(msg)
-
     except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
+        _print_csv_error(e, access="read/write")
 
+    return False
 
-def fetch_most_recent_csv_apod() -> Any:
-    """
-      Fetch the most recent APOD (by date) from the CSV log.
-      Doesn't matter in which order it was logged.
-      Ex: Todays APOD will always be the most recent.
-
-      Returns:
-          None:
-      """
 
+def _fetch_one_csv_apod(order: str) -> None:
     if not check_if_csv_output_exists():
         return
 
-    most_recent_date = NASA_APOD_START_DATE.isoformat()
-    most_recent_apod = None
-
     try:
-        with open(file=csv_file_path, mode='r', encoding='utf-8') as csv_file:
-            content = csv.reader(csv_file)
-            for row in content:
-                if not row or row[0] == 'date':
-                    continue
+        record = next(iter_csv_records(csv_file_path, order=order), None)
+    except Exception as e:
+        _print_csv_error(e)
+        return
 
-                if row[0] >= most_recent_date:
-                    most_recent_date = row[0]
-                    most_recent_apod = row
+    if record is None:
+        console.print(Text("\nNo entries found.\n", style="body.text"))
+        return
 
-            if most_recent_apod is None:
-                console.print(Text("\nNo entries found.\n", style="body.text"))
-                return
+    console.print()
+    format_raw_csv_entry(record.to_dict(), 0)
 
-            console.print()
-            format_raw_csv_entry(most_recent_apod, 0)
 
-    except PermissionError:
-        msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read ", style="body.text")
-        msg.append(f"'{csv_file_name}'", style="app.primary")
-        msg.append(" at ", style="body.text")
-        msg.append(f"'{csv_file_path}' ", style="app.primary")
-        msg.append("X", style="err")
-        console.print(msg)
+def fetch_most_recent_csv_apod() -> Any:
+    """
+      Fetch the most recent APOD (by date) from the CSV log.
+      Doesn't matter in which order it was logged.
+      Ex: Todays APOD will always be the most recent.
 
-    except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
+      Returns:
+          None:
+      """
+    _fetch_one_csv_apod(ORDER_DATE_DESC)
 
 
 def fetch_oldest_csv_apod() -> Any:
@@ -381,34 +286,60 @@ def fetch_oldest_csv_apod() -> Any:
         Returns:
             None:
     """
+    _fetch_one_csv_apod(ORDER_DATE)
 
-    if not check_if_csv_output_exists():
-        return
 
-    oldest_date = DATE_TODAY.isoformat()
-    oldest_apod = None
+def log_multiple_csv_entries(list_formatted_apod_data: Any, show_individual_success_messages: bool = True) -> Any:
+    """
+       Log multiple APOD entries to csv in one bulk write.
+
+       The batch is checked once against the logged dates (and deduplicated
+       within itself), then every new row is appended with a single buffered
+       write and one fsync. Instead of one message per entry, a single summary
+       is printed: saved and skipped counts when
+       ``show_individual_success_messages`` is True, otherwise only the
+       skipped duplicates.
+
+       Returns:
+           int: Number of rows written.
+    """
+    if not check_if_csv_output_exists():
+        return 0
 
     try:
-        with open(file=csv_file_path, mode='r', encoding='utf-8') as csv_file:
-            content = csv.reader(csv_file)
-            for row in content:
-                if not row or row[0] == 'date':
-                    continue
+        csv_log_repository = get_csv_log_repository()
+        logged_dates = csv_log_repository.dates()
+        seen_dates = set()
+        new_entries = []
+        skipped_count = 0
+
+        for entry in list_formatted_apod_data:
+            if entry['date'] in logged_dates or entry['date'] in seen_dates:
+                skipped_count += 1
+                continue
 
-                if row[0] >= oldest_date:
-                    oldest_date = row[0]
-                    oldest_apod = row
+            seen_dates.add(entry['date'])
+            new_entries.append(entry)
 
-            if oldest_apod is None:
-                console.print(Text("\nNo entries found.\n", style="body.text"))
-                return
+        if new_entries:
+            buffer = io.StringIO(newline="")
+            writer = csv.DictWriter(buffer, fieldnames=HEADERS.keys())
+            writer.writerows(new_entries)
 
-            print()
-            format_raw_csv_entry(oldest_apod, 0)
+            # newline="" prevents extra blank lines on Windows when writing CSV.
+            with open(file=csv_file_path, mode='a', encoding='utf-8', newline="") as csv_file:
+                csv_file.write(buffer.getvalue())
+                csv_file.flush()
+                os.fsync(csv_file.fileno())
+
+            csv_log_repository.record_appended([ApodRecord.from_dict(entry) for entry in new_entries])
+
+        _print_bulk_log_summary(len(new_entries), skipped_count, show_individual_success_messages)
+        return len(new_entries)
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read ", style="body.text")
+        msg.append("Unable to write ", style="body.text")
         msg.append(f"'{csv_file_name}'", style="app.primary")
         msg.append(" at ", style="body.text")
         msg.append(f"'{csv_file_path}' ", style="app.primary")
@@ -419,53 +350,65 @@ def fetch_oldest_csv_apod() -> Any:
         console.print()
         console.print(Text(str(e), style="err"))
 
+    return 0
 
-def log_multiple_csv_entries(list_formatted_apod_data: Any, show_individual_success_messages: bool = True) -> Any:
-    """
-       Log multiple APOD entries to csv.
 
-       Returns:
-           None:
-    """
-    for entry in list_formatted_apod_data:
-        log_data_to_csv(entry, show_individual_success_messages)
+def _print_bulk_log_summary(saved_count: int, skipped_count: int, show_saved: bool) -> None:
+    """Print the roll-up message of a bulk CSV ingest."""
+    if show_saved and saved_count:
+        msg = Text("Saved: ", style="app.secondary")
+        msg.append(str(saved_count), style="app.primary")
+        msg.append(" APODs -> ", style="body.text")
+        msg.append(f"{csv_file_name} ", style="app.primary")
+        msg.append("✓", style="ok")
+        console.print(msg)
+
+    if skipped_count:
+        msg = Text("Skipped logging: ", style="app.secondary")
+        msg.append(str(skipped_count), style="app.primary")
+        msg.append(" duplicate APODs not added to ", style="body.text")
+        msg.append(str(csv_file_name), style="app.primary")
+        msg.append(".", style="body.text")
+        console.print(msg)
 
 
 def update_local_file_path_in_csv(target_date: str, local_file_path: str) -> bool:
-    """Rewrite the CSV log so the matching APOD row stores a local file path."""
-    if not check_if_csv_output_exists():
-        return False
+    """Record a local file path for the matching APOD row in the CSV update journal."""
+    return update_local_file_paths_in_csv({target_date: local_file_path}) > 0
 
-    rows = []
-    updated = False
 
-    try:
-        with open(file=csv_file_path, mode='r', encoding='utf-8', newline='') as csv_file:
-            reader = csv.DictReader(csv_file)
-            fieldnames = list(reader.fieldnames or [])
+def update_local_file_paths_in_csv(local_file_paths: dict[str, str]) -> int:
+    """Record several ``{date: local_file_path}`` values as patches in the CSV update journal.
 
-            if "local_file_path" not in fieldnames:
-                fieldnames.append("local_file_path")
+    Each call appends one small write to the journal instead of rewriting the
+    log; readers overlay the patches. Once the journal passes its threshold it
+    is folded into the log with a single rewrite.
 
-            for row in reader:
-                if row.get("date") == target_date:
-                    row["local_file_path"] = local_file_path
-                    updated = True
+    Returns:
+        int: Number of rows that were updated.
+    """
+    if not local_file_paths or not check_if_csv_output_exists():
+        return 0
 
-                if "local_file_path" not in row:
-                    row["local_file_path"] = ""
+    try:
+        logged_dates = get_csv_log_repository().dates()
+        updates = {
+            date_value: {"local_file_path": local_file_path}
+            for date_value, local_file_path in local_file_paths.items()
+            if date_value in logged_dates
+        }
 
-                rows.append(row)
+        if not updates:
+            return 0
 
-        if not updated:
-            return False
+        update_journal = get_csv_update_journal()
+        update_journal.record(updates)
+        get_csv_log_repository().record_patched(updates)
 
-        with open(file=csv_file_path, mode='w', encoding='utf-8', newline='') as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+        if update_journal.needs_compaction():
+            compact_csv_update_journal()
 
-        return True
+        return len(updates)
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
@@ -480,4 +423,50 @@ def update_local_file_path_in_csv(target_date: str, local_file_path: str) -> boo
         console.print()
         console.print(Text(str(e), style="err"))
 
-    return False
+    return 0
+
+
+def compact_csv_update_journal() -> int:
+    """Fold the pending update journal patches into the CSV log with one rewrite.
+
+    Returns:
+        int: Number of rows that were patched.
+    """
+    update_journal = get_csv_update_journal()
+    patches = update_journal.patches()
+
+    if not patches or not check_if_csv_output_exists():
+        update_journal.clear()
+        return 0
+
+    rows = []
+    updated = 0
+
+    with open(file=csv_file_path, mode='r', encoding='utf-8', newline='') as csv_file:
+        reader = csv.DictReader(csv_file)
+        fieldnames = list(reader.fieldnames or [])
+
+        if "local_file_path" not in fieldnames:
+            fieldnames.append("local_file_path")
+
+        for row in reader:
+            if row.get("date") in patches:
+                row.update({key: value for key, value in patches[row["date"]].items() if key in fieldnames})
+                updated += 1
+
+            if "local_file_path" not in row:
+                row["local_file_path"] = ""
+
+            rows.append(row)
+
+    temp_path = csv_file_path.with_name(csv_file_path.name + ".tmp")
+    with open(file=temp_path, mode='w', encoding='utf-8', newline='') as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    temp_path.replace(csv_file_path)
+
+    update_journal.clear()
+    get_csv_log_repository().invalidate()
+    return updated
+
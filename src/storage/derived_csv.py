@@ -0,0 +1,135 @@
+"""
+derived_csv.py
+
+Regenerates ``output.csv`` from ``output.jsonl`` (``CSV_LOG_MODE=derived``).
+In this mode the JSONL log is the only write target. The CSV is rebuilt in
+one streaming pass, either on demand or in a background thread after writes,
+whenever it is stale. ``<csv>.source`` records the JSONL log and update
+journal signatures the CSV was derived from. When they no longer match, the
+CSV is stale.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import threading
+from typing import Any
+
+from src.config import CSV_LOG_MODE, csv_file_path, json_file_path
+from src.storage.apod_record import ApodRecord
+from src.storage.log_signature import get_log_signature
+from src.utils import json_codec
+from src.utils.csv_utils import HEADERS, get_csv_log_repository, get_csv_update_journal
+from src.utils.json_utils import get_json_update_journal
+
+_source_path = csv_file_path.with_name(csv_file_path.name + ".source")
+_derive_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+_refresh_thread: threading.Thread | None = None
+_refresh_requested = False
+
+
+def is_csv_derived() -> bool:
+    return CSV_LOG_MODE == "derived"
+
+
+def _get_source_signature() -> list[Any]:
+    """Return the state of the JSONL log (and its pending updates) the CSV would be derived from."""
+    log_signature = get_log_signature(json_file_path)
+    journal_signature = get_json_update_journal().signature()
+    return [list(log_signature) if log_signature else None, list(journal_signature) if journal_signature else None]
+
+
+def _read_stamp() -> list[Any] | None:
+    try:
+        with open(file=_source_path, mode="r", encoding="utf-8") as source_file:
+            return json.load(source_file)
+    except (OSError, ValueError):
+        return None
+
+
+def is_csv_stale() -> bool:
+    """True when ``output.csv`` is missing or was not derived from the current JSONL log."""
+    return not csv_file_path.exists() or _read_stamp() != _get_source_signature()
+
+
+def derive_csv_from_jsonl() -> int:
+    """
+       Rewrite ``output.csv`` from the JSONL log in one streaming pass (atomically replacing it).
+
+       Returns:
+           int: Number of rows written.
+    """
+    with _derive_lock:
+        # Taken before reading, so changes made during the pass leave the CSV stale.
+        source_signature = _get_source_signature()
+        journal = get_json_update_journal()
+        temp_path = csv_file_path.with_name(csv_file_path.name + ".tmp")
+        written = 0
+
+        with open(file=temp_path, mode="w", encoding="utf-8", newline="") as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=HEADERS.keys())
+            writer.writeheader()
+
+            if source_signature[0] is not None:
+                with open(file=json_file_path, mode="r", encoding="utf-8") as json_file:
+                    for line in json_file:
+                        if line.strip():
+                            entry = journal.apply(json_codec.loads(line))
+                            writer.writerow(ApodRecord.from_dict(entry).to_dict())
+                            written += 1
+
+        temp_path.replace(csv_file_path)
+        get_csv_update_journal().clear()
+        get_csv_log_repository().invalidate()
+
+        with open(file=_source_path, mode="w", encoding="utf-8") as source_file:
+            json.dump(source_signature, source_file)
+
+        return written
+
+
+def refresh_derived_csv() -> bool:
+    """Re-derive the CSV if it is stale; return whether it was rewritten."""
+    if not is_csv_stale():
+        return False
+
+    derive_csv_from_jsonl()
+    return True
+
+
+def _run_background_refresh() -> None:
+    global _refresh_thread, _refresh_requested
+
+    while True:
+        with _refresh_lock:
+            if not _refresh_requested:
+                _refresh_thread = None
+                return
+            _refresh_requested = False
+
+        try:
+            refresh_derived_csv()
+        except Exception:
+            # The CSV stays stale; the next refresh (or --export) retries.
+            pass
+
+
+def schedule_csv_refresh() -> None:
+    """
+    Refresh the derived CSV in a background thread.
+
+    Requests that arrive while a refresh is running are folded into one more
+    pass. The thread is not a daemon, so a refresh that has started finishes
+    before the app exits.
+    """
+    global _refresh_thread, _refresh_requested
+
+    if not is_csv_derived():
+        return
+
+    with _refresh_lock:
+        _refresh_requested = True
+        if _refresh_thread is None:
+            _refresh_thread = threading.Thread(target=_run_background_refresh, name="csv-refresh")
+            _refresh_thread.start()
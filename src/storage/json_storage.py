@@ -4,16 +4,26 @@ json_storage.py
 JSONL persistence layer for APOD snapshots.
 Responsible for creating, writing, reading, and rewriting the JSONL log.
 """
+from itertools import islice
 from typing import Any
 
 from src.utils.json_utils import (
-    json,
     check_if_json_output_exists,
     check_for_duplicate_json_entries,
-    get_line_count,
+    get_json_log_index,
+    get_json_log_repository,
+    get_json_search_index,
+    get_json_update_journal,
     format_raw_jsonl_entry,
+    show_search_results,
+    ask_entries_amount,
+    show_log_records,
 )
-from src.config import json_file_path, json_file_name, NASA_APOD_START_DATE, DATE_TODAY, DATA_DIR
+from src.config import json_file_path, json_file_name, DATA_DIR, SEARCH_RESULT_LIMIT
+from src.storage.apod_record import ApodRecord
+from src.storage.log_query import ORDER_DATE, ORDER_DATE_DESC, ORDER_LOGGED_DESC, iter_jsonl_records
+from src.storage.log_signature import get_log_signature
+from src.utils import json_codec
 from rich.text import Text
 from src.startup.console import console
 
@@ -36,19 +46,22 @@ def log_data_to_json(formatted_apod_data: Any, show_individual_success_message:
         return "Duplicate found."
 
     try:
-        with open(file=json_file_path, mode='a', encoding='utf-8') as json_file:
-            # One JSON object per line so we can safely append.
-            # Need to use .dumps to write JSON as a string
-            json_file.write(json.dumps(formatted_apod_data, ensure_ascii=False) + "\n")
-
-            if show_individual_success_message:
-                msg = Text("Saved: ", style="app.secondary")
-                msg.append("APOD ", style="body.text")
-                msg.append(f"'{formatted_apod_data['date']}'", style="app.primary")
-                msg.append(" -> ", style="body.text")
-                msg.append(f"{json_file_name} ", style="app.primary")
-                msg.append("✓", style="ok")
-                console.print(msg)
+        # One JSON object per line so we can safely append.
+        # The index records where the line lands, so later duplicate checks need no scan.
+        line = json_codec.dumps_line(formatted_apod_data)
+        previous_signature = get_log_signature(json_file_path)
+        get_json_log_index().append_line(formatted_apod_data['date'], line)
+        get_json_log_repository().record_appended([ApodRecord.from_dict(formatted_apod_data)])
+        get_json_search_index().record_appended([formatted_apod_data], previous_signature)
+
+        if show_individual_success_message:
+            msg = Text("Saved: ", style="app.secondary")
+            msg.append("APOD ", style="body.text")
+            msg.append(f"'{formatted_apod_data['date']}'", style="app.primary")
+            msg.append(" -> ", style="body.text")
+            msg.append(f"{json_file_name} ", style="app.primary")
+            msg.append("✓", style="ok")
+            console.print(msg)
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
@@ -66,73 +79,9 @@ def log_data_to_json(formatted_apod_data: Any, show_individual_success_message:
     return None
 
 
-def show_first_n_json_log_entries() -> Any:
-    """
-        Display the first N logged JSONL entries.
-
-        Args:
-        entries_amount: Number of entries to display.
-
-        Returns:
-         None:
-    """
-
-    try:
-        console.print("\nEnter number of entries: ", style="app.secondary", end="")
-        entries_amount = int(input())
-
-    except ValueError:
-        console.print(Text("\nInput error: ", style="err").append("Enter a valid number.", style="body.text"))
-        console.print()
-        return
-
-    except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
-        return
-
-    if entries_amount < 1:
-        console.print(Text("\nInput error: ", style="err").append("Enter a number of 1 or more.", style="body.text"))
-        console.print()
-        return
-
-    if not check_if_json_output_exists():
-        return
-
-    line_count = get_line_count(0)
-
-    if line_count == 0:
-        console.print(Text("\nNo entries found.\n", style="body.text"))
-        return
-
-    if entries_amount > line_count:
-        msg = Text("\nOnly ", style="body.text")
-        msg.append(str(line_count), style="app.primary")
-        msg.append(" entries available. Showing all available entries.", style="body.text")
-        console.print(msg)
-
-        entries_amount = line_count
-
-    console.print()
-    count = 0
-
-    try:
-        with open(file=json_file_path, mode='r') as json_file:
-            for line in json_file:
-                if line is None or len(line) == 0:
-                    continue
-
-                # Need to use .loads to convert JSON string --> dict
-                # Since we used .dumps we need to use .loads to read the proper format
-                content = json.loads(line)
-                format_raw_jsonl_entry(content, count)
-                count += 1
-                if count == entries_amount:
-                    break
-
-        console.print()
-
-    except PermissionError:
+def _print_json_read_error(error: Exception) -> None:
+    """Report a failure to read the JSONL log."""
+    if isinstance(error, PermissionError):
         msg = Text("\nPermission error: ", style="err")
         msg.append("Unable to read ", style="body.text")
         msg.append(f"'{json_file_name}'", style="app.primary")
@@ -140,119 +89,65 @@ def show_first_n_json_log_entries() -> Any:
         msg.append(f"'{json_file_path}' ", style="app.primary")
         msg.append("X", style="err")
         console.print(msg)
+        return
 
-    except json.decoder.JSONDecodeError:
+    if isinstance(error, json_codec.JSONDecodeError):
         msg = Text("\nJSONL parse error: ", style="err")
         msg.append("Could not decode JSON from file ", style="body.text")
         msg.append(f"'{json_file_name}'", style="app.primary")
         msg.append(". Check the file format.", style="body.text")
         console.print(msg)
+        return
 
-    except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
+    console.print()
+    console.print(Text(str(error), style="err"))
 
 
-def show_last_n_json_log_entries() -> Any:
+def show_first_n_json_log_entries() -> Any:
     """
-    Display the last N logged JSONL entries.
-
-       Args:
-    entries_amount: Number of entries to display.
+        Display the first N logged JSONL entries.
+        Entries are streamed from the start of the log and reading stops after N.
 
-       Returns:
-        None:
+        Returns:
+         None:
     """
-
-    try:
-        console.print("\nEnter number of entries: ", style="app.secondary", end="")
-        entries_amount = int(input())
-
-    except ValueError:
-        console.print(Text("\nInput error: ", style="err").append("Enter a valid number.", style="body.text"))
-        console.print()
+    entries_amount = ask_entries_amount()
+    if entries_amount is None or not check_if_json_output_exists():
         return
 
+    try:
+        records = list(islice(iter_jsonl_records(json_file_path), entries_amount))
     except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
+        _print_json_read_error(e)
         return
 
-    if entries_amount < 1:
-        console.print(Text("\nInput error: ", style="err").append("Enter a number of 1 or more.", style="body.text"))
-        console.print()
-        return
+    show_log_records(records, entries_amount)
 
-    if not check_if_json_output_exists():
-        return
 
-    line_count = get_line_count(count=0)
+def show_last_n_json_log_entries() -> Any:
+    """
+        Display the last N logged JSONL entries.
+        The log is read backwards from its end, so only those N entries are decoded.
 
-    if line_count == 0:
-        console.print(Text("\nNo entries found.\n", style="body.text"))
+        Returns:
+         None:
+    """
+    entries_amount = ask_entries_amount()
+    if entries_amount is None or not check_if_json_output_exists():
         return
 
-    if entries_amount > line_count:
-        msg = Text("\nOnly ", style="body.text")
-        msg.append(str(line_count), style="app.primary")
-        msg.append(" entries available. Showing all available entries.", style="body.text")
-        console.print(msg)
-
-        entries_amount = line_count
-
-    count = 0
-    entries_list = []
-
     try:
-        with open(file=json_file_path, mode='r') as json_file:
-            for line in json_file:
-                if line is None or len(line) == 0:
-                    continue
-
-                content = json.loads(line)
-                entries_list.append(content)
-                count += 1
-
-                if count > entries_amount:
-                    entries_list.remove(entries_list[0])
-                    count -= 1
-
-    except PermissionError:
-        msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read ", style="body.text")
-        msg.append(f"'{json_file_name}'", style="app.primary")
-        msg.append(" at ", style="body.text")
-        msg.append(f"'{json_file_path}' ", style="app.primary")
-        msg.append("X", style="err")
-        console.print(msg)
-        return
-
-    except json.decoder.JSONDecodeError:
-        msg = Text("\nJSONL parse error: ", style="err")
-        msg.append("Could not decode JSON from file ", style="body.text")
-        msg.append(f"'{json_file_name}'", style="app.primary")
-        msg.append(". Check the file format.", style="body.text")
-        console.print(msg)
-        return
-
+        records = list(islice(iter_jsonl_records(json_file_path, order=ORDER_LOGGED_DESC), entries_amount))
     except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
+        _print_json_read_error(e)
         return
 
-    console.print()
-    count = 0
-
-    for entry in entries_list:
-        format_raw_jsonl_entry(entry, count)
-        count += 1
-
-    console.print()
+    show_log_records(records[::-1], entries_amount)
 
 
 def show_all_json_entries() -> Any:
     """
-        Display all logged JSONL entries.
+        Display all logged JSONL entries, streaming them from the log.
 
     Returns:
         None:
@@ -265,34 +160,12 @@ def show_all_json_entries() -> Any:
     count = 0
 
     try:
-        with open(file=json_file_path, mode='r') as json_file:
-            for line in json_file:
-                if line is None or len(line) == 0:
-                    continue
-
-                content = json.loads(line)
-                format_raw_jsonl_entry(content, count)
-                count += 1
-
-    except PermissionError:
-        msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read ", style="body.text")
-        msg.append(f"'{json_file_name}'", style="app.primary")
-        msg.append(" at ", style="body.text")
-        msg.append(f"'{json_file_path}' ", style="app.primary")
-        msg.append("X", style="err")
-        console.print(msg)
-
-    except json.decoder.JSONDecodeError:
-        msg = Text("\nJSONL parse error: ", style="err")
-        msg.append("Could not decode JSON from file ", style="body.text")
-        msg.append(f"'{json_file_name}'", style="app.primary")
-        msg.append(". Check the file format.", style="body.text")
-        console.print(msg)
+        for record in iter_jsonl_records(json_file_path):
+            format_raw_jsonl_entry(record.to_dict(), count)
+            count += 1
 
     except Exception as e:
-        console.print()
-        console.print(Text(str(e), style="err"))
+        _print_json_read_error(e)
 
     if count == 0:
         console.print(Text("No entries found.\n", style="body.text"))
@@ -305,50 +178,31 @@ def delete_one_json_entry(target_date: Any) -> Any:
     """
        Delete a single JSONL entry by its APOD date.
 
-       Prompts the user for a date, removes the matching JSON object, and rewrites
-       the JSONL file with the remaining entries.
+       The entry is located through the sidecar date index and cut out of the
+       file by copying the bytes around it, so no other line is decoded.
 
        Returns:
         Boolean:
     """
 
-    entries_to_keep = []
     viewer_filename = f"apod-{target_date}.html"
     viewer_path = (DATA_DIR / "viewer" / viewer_filename)
 
     if not check_if_json_output_exists():
         return False
 
-    found = False
-
     try:
-        # Read phase
-        # Need to rewrite the entire file: you can't delete a single JSONL line in-place safely.
-        with open(file=json_file_path, mode='r') as json_file:
-            for line in json_file:
-                if line is None or len(line) == 0:
-                    continue
-
-                content = json.loads(line)
-
-                if content['date'] == target_date:
-                    found = True
-
-                else:
-                    entries_to_keep.append(content)
-
-            if not found:
-                return False
+        previous_signature = get_log_signature(json_file_path)
+        if not get_json_log_index().remove_entry(target_date):
+            return False
 
-            # Write phase
-            with open(file=json_file_path, mode='w') as file:
-                for entry in entries_to_keep:
-                    file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        get_json_search_index().record_removed(target_date, previous_signature)
+        get_json_update_journal().discard(target_date)
 
-            if viewer_path.exists() and viewer_path.is_file():
-                viewer_path.unlink()
+        if viewer_path.exists() and viewer_path.is_file():
+            viewer_path.unlink()
 
-            return True
+        return True
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
@@ -359,7 +213,7 @@ def delete_one_json_entry(target_date: Any) -> Any:
         msg.append("X", style="err")
         console.print(msg)
 
-    except json.decoder.JSONDecodeError:
+    except json_codec.JSONDecodeError:
         print(f"\nJSONL parse error: Could not decode JSON from file '{json_file_name}'. Check the file format.")
         msg = Text("JSONL parse Error : ", style="err")
         msg.append("Could not decode JSON from file ", style="body.text")
@@ -372,6 +226,26 @@ def delete_one_json_entry(target_date: Any) -> Any:
         console.print(Text(str(e), style="err"))
 
 
+def _fetch_one_json_apod(order: str) -> None:
+    """Show the first entry in a date order; the summary sidecar locates it, so only that line is read."""
+    if not check_if_json_output_exists():
+        return
+
+    try:
+        record = next(iter_jsonl_records(json_file_path, order=order), None)
+    except Exception as e:
+        _print_json_read_error(e)
+        return
+
+    if record is None:
+        console.print(Text("\nNo entries found.\n", style="body.text"))
+        return
+
+    console.print()
+    format_raw_jsonl_entry(record.to_dict(), 0)
+    console.print()
+
+
 def fetch_most_recent_json_apod() -> Any:
     """
          Fetch the most recent APOD (by date) from the jsonl log.
@@ -381,46 +255,78 @@ def fetch_most_recent_json_apod() -> Any:
          Returns:
              None:
     """
-    if not check_if_json_output_exists():
-        return
+    _fetch_one_json_apod(ORDER_DATE_DESC)
 
-    most_recent_date = NASA_APOD_START_DATE.isoformat()
-    most_recent_apod = None
 
-    try:
-        with open(file=json_file_path, mode='r') as json_file:
-            for line in json_file:
-                if line is None or len(line) == 0:
-                    continue
+def fetch_oldest_json_apod() -> Any:
+    """
+        Fetch the oldest APOD (by date) from the jsonl log.
+        Doesn't matter in which order it was logged.
+        Ex: First APOD ever uploaded will always be the oldest.
 
-                content = json.loads(line)
+        Returns:
+            None:
+    """
+    _fetch_one_json_apod(ORDER_DATE)
 
-                if content['date'] >= most_recent_date:
-                    most_recent_date = content['date']
-                    most_recent_apod = content
 
-            if most_recent_apod is None:
-                console.print(Text("\nNo entries found.\n", style="body.text"))
-                return
+def log_multiple_json_entries(list_formatted_apod_data: Any, show_individual_success_messages: bool = True) -> Any:
+    """
+       Log multiple APOD entries to jsonl in one bulk write.
 
-            console.print()
-            format_raw_jsonl_entry(most_recent_apod, 0)
-            console.print()
+       The batch is checked once against the logged dates (and deduplicated
+       within itself), then every new line is appended with a single buffered
+       write and one fsync. Instead of one message per entry, a single summary
+       is printed: saved and skipped counts when
+       ``show_individual_success_messages`` is True, otherwise only the
+       skipped duplicates.
+
+       Returns:
+           int: Number of entries written.
+    """
+    if not check_if_json_output_exists():
+        return 0
+
+    try:
+        json_log_index = get_json_log_index()
+        logged_dates = json_log_index.dates()
+        seen_dates = set()
+        new_entries = []
+        skipped_count = 0
+
+        for entry in list_formatted_apod_data:
+            if entry['date'] in logged_dates or entry['date'] in seen_dates:
+                skipped_count += 1
+                continue
+
+            seen_dates.add(entry['date'])
+            new_entries.append(entry)
+
+        if new_entries:
+            previous_signature = get_log_signature(json_file_path)
+            json_log_index.append_lines(
+                [(entry['date'], json_codec.dumps_line(entry)) for entry in new_entries],
+                sync=True,
+            )
+            get_json_log_repository().record_appended([ApodRecord.from_dict(entry) for entry in new_entries])
+            get_json_search_index().record_appended(new_entries, previous_signature)
+
+        _print_bulk_log_summary(len(new_entries), skipped_count, show_individual_success_messages)
+        return len(new_entries)
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read/write ", style="body.text")
+        msg.append("Unable to write ", style="body.text")
         msg.append(f"'{json_file_name}'", style="app.primary")
         msg.append(" at ", style="body.text")
         msg.append(f"'{json_file_path}' ", style="app.primary")
         msg.append("X", style="err")
         console.print(msg)
 
-    except json.decoder.JSONDecodeError:
-        print(f"\nJSONL parse error: Could not decode JSON from file '{json_file_name}'. Check the file format.")
-        msg = Text("JSONL parse Error : ", style="err")
+    except json_codec.JSONDecodeError:
+        msg = Text("\nJSONL parse error: ", style="err")
         msg.append("Could not decode JSON from file ", style="body.text")
-        msg.append(f"'{json_file_name}' ", style="app.primary")
+        msg.append(f"'{json_file_name}'", style="app.primary")
         msg.append(". Check the file format.", style="body.text")
         console.print(msg)
 
@@ -428,42 +334,65 @@ def fetch_most_recent_json_apod() -> Any:
         console.print()
         console.print(Text(str(e), style="err"))
 
+    return 0
 
-def fetch_oldest_json_apod() -> Any:
-    """
-        Fetch the oldest APOD (by date) from the CSV log.
-        Doesn't matter in which order it was logged.
-        Ex: First APOD ever uploaded will always be the oldest.
 
-        Returns:
-            None:
-    """
+def _print_bulk_log_summary(saved_count: int, skipped_count: int, show_saved: bool) -> None:
+    """Print the roll-up message of a bulk JSONL ingest."""
+    if show_saved and saved_count:
+        msg = Text("Saved: ", style="app.secondary")
+        msg.append(str(saved_count), style="app.primary")
+        msg.append(" APODs -> ", style="body.text")
+        msg.append(f"{json_file_name} ", style="app.primary")
+        msg.append("✓", style="ok")
+        console.print(msg)
 
-    if not check_if_json_output_exists():
-        return
+    if skipped_count:
+        msg = Text("Skipped logging: ", style="app.secondary")
+        msg.append(str(skipped_count), style="app.primary")
+        msg.append(" duplicate APODs not added to ", style="body.text")
+        msg.append(str(json_file_name), style="app.primary")
+        msg.append(".", style="body.text")
+        console.print(msg)
+
+
+def update_local_file_path_in_json(target_date: str, local_file_path: str) -> bool:
+    """Record a local file path for the matching APOD entry in the JSONL update journal."""
+    return update_local_file_paths_in_json({target_date: local_file_path}) > 0
+
+
+def update_local_file_paths_in_json(local_file_paths: dict[str, str]) -> int:
+    """Record several ``{date: local_file_path}`` values as patches in the JSONL update journal.
 
-    oldest_date = DATE_TODAY.isoformat()
-    oldest_apod = None
+    Each call appends one small write to the journal instead of rewriting the
+    log; readers overlay the patches. Once the journal passes its threshold it
+    is folded into the log with a single rewrite.
+
+    Returns:
+        int: Number of entries that were updated.
+    """
+    if not local_file_paths or not check_if_json_output_exists():
+        return 0
 
     try:
-        with open(file=json_file_path, mode='r') as json_file:
-            for line in json_file:
-                if line is None or len(line) == 0:
-                    continue
+        logged_dates = get_json_log_repository().dates()
+        updates = {
+            date_value: {'local_file_path': local_file_path}
+            for date_value, local_file_path in local_file_paths.items()
+            if date_value in logged_dates
+        }
 
-                content = json.loads(line)
+        if not updates:
+            return 0
 
-                if content['date'] <= oldest_date:
-                    oldest_date = content['date']
-                    oldest_apod = content
+        update_journal = get_json_update_journal()
+        update_journal.record(updates)
+        get_json_log_repository().record_patched(updates)
 
-            if oldest_apod is None:
-                console.print(Text("\nNo entries found.\n", style="body.text"))
-                return
+        if update_journal.needs_compaction():
+            compact_json_update_journal()
 
-            console.print()
-            format_raw_jsonl_entry(oldest_apod, 0)
-            console.print()
+        return len(updates)
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
@@ -474,11 +403,10 @@ def fetch_oldest_json_apod() -> Any:
         msg.append("X", style="err")
         console.print(msg)
 
-    except json.decoder.JSONDecodeError:
-        print(f"\nJSONL parse error: Could not decode JSON from file '{json_file_name}'. Check the file format.")
-        msg = Text("JSONL parse Error : ", style="err")
+    except json_codec.JSONDecodeError:
+        msg = Text("\nJSONL parse error: ", style="err")
         msg.append("Could not decode JSON from file ", style="body.text")
-        msg.append(f"'{json_file_name}' ", style="app.primary")
+        msg.append(f"'{json_file_name}'", style="app.primary")
         msg.append(". Check the file format.", style="body.text")
         console.print(msg)
 
@@ -486,60 +414,80 @@ def fetch_oldest_json_apod() -> Any:
         console.print()
         console.print(Text(str(e), style="err"))
 
+    return 0
 
-def log_multiple_json_entries(list_formatted_apod_data: Any, show_individual_success_messages: bool = True) -> Any:
-    """
-       Log multiple APOD entries to jsonl.
 
-       Returns:
-           None:
-    """
-    for entry in list_formatted_apod_data:
-        log_data_to_json(entry, show_individual_success_messages)
+def compact_json_update_journal() -> int:
+    """Fold the pending update journal patches into the JSONL log with one rewrite.
 
+    Returns:
+        int: Number of entries that were patched.
+    """
+    update_journal = get_json_update_journal()
+    patches = update_journal.patches()
 
-def update_local_file_path_in_json(target_date: str, local_file_path: str) -> bool:
-    """Rewrite the JSONL log so the matching APOD entry stores a local file path."""
-    if not check_if_json_output_exists():
-        return False
+    if not patches or not check_if_json_output_exists():
+        update_journal.clear()
+        return 0
 
     entries = []
-    updated = False
-
-    try:
-        with open(file=json_file_path, mode='r', encoding='utf-8') as json_file:
-            for line in json_file:
-                if line is None or len(line) == 0:
-                    continue
-
-                content = json.loads(line)
-                if content.get('date') == target_date:
-                    content['local_file_path'] = local_file_path
-                    updated = True
-                elif 'local_file_path' not in content:
-                    content['local_file_path'] = ''
-
-                entries.append(content)
+    updated = 0
+
+    with open(file=json_file_path, mode='r', encoding='utf-8') as json_file:
+        for line in json_file:
+            if not line.strip():
+                continue
+
+            content = json_codec.loads(line)
+            if content.get('date') in patches:
+                content.update(patches[content['date']])
+                updated += 1
+            elif 'local_file_path' not in content:
+                content['local_file_path'] = ''
+
+            entries.append(content)
+
+    previous_signature = get_log_signature(json_file_path)
+    temp_path = json_file_path.with_name(json_file_path.name + ".tmp")
+    with open(file=temp_path, mode='w', encoding='utf-8') as json_file:
+        for entry in entries:
+            json_file.write(json_codec.dumps(entry) + "\n")
+    temp_path.replace(json_file_path)
+
+    update_journal.clear()
+    get_json_log_index().invalidate()
+    # Only local_file_path changed, so the search postings still hold.
+    get_json_search_index().carry_over(previous_signature)
+    get_json_log_repository().invalidate()
+    return updated
+
+
+def search_json_log_entries(query: str, limit: int = SEARCH_RESULT_LIMIT) -> Any:
+    """
+       Display the logged JSONL entries whose title or explanation match a query, best match first.
 
-        if not updated:
-            return False
+       Matches come from the full-text search index and each result is read
+       with a single seek through the date index.
 
-        with open(file=json_file_path, mode='w', encoding='utf-8') as json_file:
-            for entry in entries:
-                json_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+       Returns:
+           None:
+    """
+    if not check_if_json_output_exists():
+        return
 
-        return True
+    try:
+        show_search_results(query, get_json_search_index().search(query), get_json_log_index().read_entry, limit)
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
-        msg.append("Unable to read/write ", style="body.text")
+        msg.append("Unable to read ", style="body.text")
         msg.append(f"'{json_file_name}'", style="app.primary")
         msg.append(" at ", style="body.text")
         msg.append(f"'{json_file_path}' ", style="app.primary")
         msg.append("X", style="err")
         console.print(msg)
 
-    except json.decoder.JSONDecodeError:
+    except json_codec.JSONDecodeError:
         msg = Text("\nJSONL parse error: ", style="err")
         msg.append("Could not decode JSON from file ", style="body.text")
         msg.append(f"'{json_file_name}'", style="app.primary")
@@ -550,4 +498,3 @@ def update_local_file_path_in_json(target_date: str, local_file_path: str) -> bo
         console.print()
         console.print(Text(str(e), style="err"))
 
-    return False
@@ -0,0 +1,332 @@
+"""
+jsonl_index.py
+
+Persistent date -> (byte offset, length) index for JSONL logs.
+The index lives next to the log as ``<log>.idx`` and records the log's size
+and mtime it was built against. Whenever those no longer match the log (it was
+edited by hand, rewritten, or written by an older version of the app), the
+index is rebuilt from the log automatically.
+
+Sidecar layout (plain text):
+    <log size:20 digits> <log mtime_ns:20 digits>\\n
+    YYYY-MM-DD <offset> <length>\\n
+    ...
+The fixed-width header is rewritten in place after every append, so logging
+one entry costs one appended index line instead of a full rewrite. The index
+also keeps the log's ``.summary`` sidecar (see log_summary.py) current.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+
+from src.storage.log_scan import find_date_location, iter_date_locations
+from src.storage.log_signature import get_log_signature
+from src.storage.log_summary import EMPTY_LOG_SUMMARY, LogSummary, SummarySidecar, summarize_locations
+from src.storage.update_journal import get_update_journal
+from src.utils import json_codec
+
+_HEADER_WIDTH = 20
+
+
+def _format_header(size: int, mtime_ns: int) -> bytes:
+    return f"{size:0{_HEADER_WIDTH}d} {mtime_ns:0{_HEADER_WIDTH}d}\n".encode("ascii")
+
+
+class JsonlIndex:
+    """
+    In-memory view of one log's sidecar index, revalidated against the log on every use.
+
+    Only the first line for a date is indexed; the loggers never write a date
+    twice, so later duplicates can only come from manual edits.
+    """
+
+    def __init__(self, log_path: Path) -> None:
+        self.log_path = log_path
+        self.index_path = log_path.with_name(log_path.name + ".idx")
+        self._lock = threading.RLock()
+        self._entries: dict[str, tuple[int, int]] = {}
+        self._signature: tuple[int, int] | None = None
+        # True while the sidecar on disk matches the in-memory entries, so appends may extend it.
+        self._sidecar_synced = False
+        self._summary_sidecar = SummarySidecar(log_path)
+
+    def _load_current(self) -> bool:
+        """Bring the entries up to date from memory or the sidecar; False when only a rebuild would do."""
+        signature = get_log_signature(self.log_path)
+
+        if signature is None:
+            self._entries, self._signature = {}, None
+            return True
+
+        return signature == self._signature or self._load_sidecar(signature)
+
+    def _ensure_fresh(self) -> dict[str, tuple[int, int]]:
+        """Return the entries, reloading or rebuilding them if the log changed."""
+        if not self._load_current():
+            self.rebuild()
+
+        return self._entries
+
+    def _load_sidecar(self, signature: tuple[int, int]) -> bool:
+        """Load the sidecar if it was built against ``signature``; return whether it was used."""
+        try:
+            with open(file=self.index_path, mode="rb") as index_file:
+                if index_file.readline() != _format_header(*signature):
+                    return False
+
+                entries = {}
+                for line in index_file:
+                    date_value, offset, length = line.split()
+                    entries.setdefault(date_value.decode("ascii"), (int(offset), int(length)))
+
+        except (OSError, ValueError):
+            return False
+
+        self._entries, self._signature = entries, signature
+        self._sidecar_synced = True
+        return True
+
+    def _write_sidecar(self) -> None:
+        """Write the whole sidecar atomically for the current entries and signature."""
+        self._sidecar_synced = False
+        if self._signature is None:
+            return
+
+        temp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(file=temp_path, mode="wb") as index_file:
+                index_file.write(_format_header(*self._signature))
+                index_file.writelines(
+                    f"{date_value} {offset} {length}\n".encode("ascii")
+                    for date_value, (offset, length) in self._entries.items()
+                )
+            temp_path.replace(self.index_path)
+        except OSError:
+            # The index is only an accelerator; it will be rebuilt next session.
+            return
+
+        self._sidecar_synced = True
+
+    def rebuild(self) -> None:
+        """Rebuild the index with a memory-mapped scan of the log (see log_scan.py)."""
+        with self._lock:
+            entries: dict[str, tuple[int, int]] = {}
+
+            try:
+                for date_value, offset, length in iter_date_locations(self.log_path):
+                    entries.setdefault(date_value, (offset, length))
+            except OSError:
+                self._entries, self._signature = {}, None
+                return
+
+            self._entries = entries
+            self._signature = get_log_signature(self.log_path)
+            self._write_sidecar()
+            self._summary_sidecar.write(summarize_locations(entries), self._signature)
+
+    def invalidate(self) -> None:
+        """Forget the in-memory state so the next lookup revalidates against the sidecar and log."""
+        with self._lock:
+            self._signature = None
+
+    def contains(self, date_value: str) -> bool:
+        return self.lookup(date_value) is not None
+
+    def lookup(self, date_value: str) -> tuple[int, int] | None:
+        """
+        Return ``(offset, length)`` of the line for a date, or None.
+
+        Without a usable sidecar (first run, or a log from an older version)
+        the log is scanned for just this date instead of building the index;
+        the next append or full read builds it.
+        """
+        with self._lock:
+            if self._load_current():
+                return self._entries.get(date_value)
+
+            return find_date_location(self.log_path, date_value)
+
+    def dates(self) -> set[str]:
+        with self._lock:
+            return set(self._ensure_fresh())
+
+    def locations(self) -> list[tuple[str, int, int]]:
+        """Return ``(date, offset, length)`` of every indexed line, in file order."""
+        with self._lock:
+            return [(date_value, offset, length) for date_value, (offset, length) in self._ensure_fresh().items()]
+
+    def summary(self) -> LogSummary:
+        """
+        Return the entry count and earliest/latest dates with their line locations.
+
+        Served from the ``.summary`` sidecar without loading the index; when it
+        does not match the log (or is missing) it is rebuilt from the index.
+        """
+        with self._lock:
+            signature = get_log_signature(self.log_path)
+            if signature is None:
+                return EMPTY_LOG_SUMMARY
+
+            summary = self._summary_sidecar.read(signature)
+            if summary is None:
+                summary = summarize_locations(self._ensure_fresh())
+                self._summary_sidecar.write(summary, self._signature)
+
+            return summary
+
+    def read_entry(self, date_value: str) -> dict[str, Any] | None:
+        """Read one logged entry (with pending journal patches) with a single seek, or None when the date is not logged."""
+        location = self.lookup(date_value)
+        if location is None:
+            return None
+
+        return self.read_entry_at(*location)
+
+    def read_entry_at(self, offset: int, length: int) -> dict[str, Any]:
+        """Read the entry stored at a known line location (with pending journal patches)."""
+        with open(file=self.log_path, mode="rb") as log_file:
+            log_file.seek(offset)
+            entry = json_codec.loads(log_file.read(length))
+
+        return get_update_journal(self.log_path).apply(entry)
+
+    def append_line(self, date_value: str, line: bytes) -> None:
+        """Append one encoded log line and record it in the index."""
+        self.append_lines([(date_value, line)])
+
+    def append_lines(self, dated_lines: list[tuple[str, bytes]], *, sync: bool = False) -> None:
+        """
+        Append encoded log lines with one write and record them in the index.
+
+        With ``sync=True`` the log is flushed and fsynced once after the write,
+        so a bulk ingest is durable without paying a sync per entry.
+        """
+        if not dated_lines:
+            return
+
+        with self._lock:
+            self._ensure_fresh()
+            previous_signature = get_log_signature(self.log_path)
+
+            with open(file=self.log_path, mode="ab") as log_file:
+                offset = log_file.seek(0, os.SEEK_END)
+                log_file.write(b"".join(line for _, line in dated_lines))
+                if sync:
+                    log_file.flush()
+                    os.fsync(log_file.fileno())
+
+            locations = []
+            for date_value, line in dated_lines:
+                locations.append((date_value, offset, len(line)))
+                offset += len(line)
+
+            self.record_appends(locations, previous_signature)
+
+    def record_appends(
+        self,
+        locations: list[tuple[str, int, int]],
+        previous_signature: tuple[int, int] | None = None,
+    ) -> None:
+        """
+        Record ``(date, offset, length)`` of lines the caller just appended and re-sign the sidecars.
+
+        ``previous_signature`` is the log's signature before the append; the
+        summary is only updated in place when it matched it.
+        """
+        with self._lock:
+            new_locations = []
+            for date_value, offset, length in locations:
+                if date_value not in self._entries:
+                    self._entries[date_value] = (offset, length)
+                    new_locations.append((date_value, offset, length))
+
+            self._signature = get_log_signature(self.log_path)
+            self._summary_sidecar.record_appends(previous_signature, new_locations, self._signature)
+            if self._signature is None:
+                return
+
+            if not self._sidecar_synced:
+                self._write_sidecar()
+                return
+
+            try:
+                with open(file=self.index_path, mode="r+b") as index_file:
+                    index_file.seek(0, os.SEEK_END)
+                    index_file.write(b"".join(
+                        f"{date_value} {offset} {length}\n".encode("ascii")
+                        for date_value, offset, length in locations
+                    ))
+                    index_file.seek(0)
+                    index_file.write(_format_header(*self._signature))
+            except OSError:
+                self._write_sidecar()
+
+    def remove_entry(self, date_value: str) -> bool:
+        """
+        Cut the line for a date out of the log and shift later offsets.
+
+        The log is rewritten by copying the bytes around the line, so no JSON is
+        decoded. Returns False when the date is not logged.
+        """
+        with self._lock:
+            location = self._ensure_fresh().get(date_value)
+            if location is None:
+                return False
+
+            offset, length = location
+            previous_signature = self._signature
+            temp_path = self.log_path.with_name(self.log_path.name + ".tmp")
+
+            with open(file=self.log_path, mode="rb") as log_file, open(file=temp_path, mode="wb") as temp_file:
+                shutil.copyfileobj(_LimitedReader(log_file, offset), temp_file)
+                log_file.seek(offset + length)
+                shutil.copyfileobj(log_file, temp_file)
+            temp_path.replace(self.log_path)
+
+            del self._entries[date_value]
+            self._entries = {
+                other_date: (other_offset - length if other_offset > offset else other_offset, other_length)
+                for other_date, (other_offset, other_length) in self._entries.items()
+            }
+            self._signature = get_log_signature(self.log_path)
+            self._write_sidecar()
+            self._summary_sidecar.record_removed(
+                previous_signature, (date_value, offset, length), self._entries, self._signature
+            )
+            return True
+
+
+class _LimitedReader:
+    """File wrapper that stops reading after ``limit`` bytes (for ``shutil.copyfileobj``)."""
+
+    def __init__(self, source: Any, limit: int) -> None:
+        self._source = source
+        self._remaining = limit
+
+    def read(self, size: int = -1) -> bytes:
+        if self._remaining <= 0:
+            return b""
+
+        size = self._remaining if size < 0 else min(size, self._remaining)
+        data = self._source.read(size)
+        self._remaining -= len(data)
+        return data
+
+
+_indexes: dict[Path, JsonlIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_jsonl_index(log_path: Path) -> JsonlIndex:
+    """Return the shared index for a JSONL log, creating it on first use."""
+    with _indexes_lock:
+        index = _indexes.get(log_path)
+        if index is None:
+            index = JsonlIndex(log_path)
+            _indexes[log_path] = index
+
+    return index
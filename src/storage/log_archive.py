@@ -0,0 +1,241 @@
+"""
+log_archive.py
+
+Compressed, block-seekable archive of the APOD log (``--archive`` / ``--import-archive``).
+Entries are written in date order and split into blocks of ``ARCHIVE_BLOCK_RECORDS``
+records. Each block is a JSONL chunk compressed on its own with ``ARCHIVE_CODEC``
+(lzma or gzip), and an index stores the date range of every block, so a read
+only decompresses the blocks that overlap the dates it needs. File layout:
+
+    b"APODARC1"          magic
+    block 0 .. block n   independently compressed JSONL
+    index                JSON: codec and [first_date, last_date, offset, length, count] per block
+    trailer              index offset and length (two big-endian uint64) + b"APODARC1"
+"""
+from __future__ import annotations
+
+import gzip
+import lzma
+import os
+import struct
+from bisect import bisect_left
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, NamedTuple
+
+from rich.text import Text
+
+from src.config import ARCHIVE_BLOCK_RECORDS, ARCHIVE_CODEC, archive_file_path
+from src.startup.console import console
+from src.storage.log_query import ORDER_DATE, in_date_range
+from src.storage.log_storage import iter_entries, log_apod_entries
+from src.utils import json_codec
+
+ARCHIVE_VERSION = 1
+# Archived entries handed to the logs together while importing.
+ARCHIVE_IMPORT_BATCH_SIZE = 1000
+
+_MAGIC = b"APODARC1"
+_TRAILER = struct.Struct(">QQ8s")
+
+_CODECS: dict[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    # mtime=0 keeps the gzip blocks byte-for-byte reproducible.
+    "gzip": (lambda data: gzip.compress(data, mtime=0), gzip.decompress),
+    "lzma": (lzma.compress, lzma.decompress),
+}
+
+
+class ArchiveBlock(NamedTuple):
+    first_date: str
+    last_date: str
+    offset: int
+    length: int
+    count: int
+
+
+class ArchiveIndex(NamedTuple):
+    codec: str
+    blocks: list[ArchiveBlock]
+
+    @property
+    def count(self) -> int:
+        return sum(block.count for block in self.blocks)
+
+
+def _get_codec(codec: str) -> tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    try:
+        return _CODECS[codec]
+    except KeyError:
+        raise ValueError(f"Unknown archive codec {codec!r}; expected one of {', '.join(_CODECS)}.") from None
+
+
+def _write_block(archive_file: BinaryIO, entries: list[dict[str, Any]], compress: Callable[[bytes], bytes]) -> ArchiveBlock:
+    data = compress("".join(json_codec.dumps(entry) + "\n" for entry in entries).encode("utf-8"))
+    block = ArchiveBlock(entries[0]["date"], entries[-1]["date"], archive_file.tell(), len(data), len(entries))
+    archive_file.write(data)
+    return block
+
+
+def write_archive(
+    entries: Iterable[dict[str, Any]],
+    archive_path: Path,
+    codec: str = ARCHIVE_CODEC,
+    block_records: int = ARCHIVE_BLOCK_RECORDS,
+) -> ArchiveIndex:
+    """
+       Stream entries (in date order) into an archive, atomically replacing ``archive_path``.
+
+       Returns:
+           ArchiveIndex: The block index that was written.
+    """
+    compress, _ = _get_codec(codec)
+    block_records = max(1, block_records)
+    temp_path = archive_path.with_name(archive_path.name + ".tmp")
+    blocks: list[ArchiveBlock] = []
+    pending: list[dict[str, Any]] = []
+
+    try:
+        with open(file=temp_path, mode="wb") as archive_file:
+            archive_file.write(_MAGIC)
+
+            for entry in entries:
+                pending.append(entry)
+                if len(pending) == block_records:
+                    blocks.append(_write_block(archive_file, pending, compress))
+                    pending = []
+
+            if pending:
+                blocks.append(_write_block(archive_file, pending, compress))
+
+            index_offset = archive_file.tell()
+            index_data = json_codec.dumps({"version": ARCHIVE_VERSION, "codec": codec, "blocks": blocks}).encode("utf-8")
+            archive_file.write(index_data)
+            archive_file.write(_TRAILER.pack(index_offset, len(index_data), _MAGIC))
+            archive_file.flush()
+            os.fsync(archive_file.fileno())
+
+        temp_path.replace(archive_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return ArchiveIndex(codec, blocks)
+
+
+def _read_index(archive_file: BinaryIO, archive_name: str) -> ArchiveIndex:
+    size = archive_file.seek(0, os.SEEK_END)
+    if size < len(_MAGIC) + _TRAILER.size:
+        raise ValueError(f"'{archive_name}' is not an APOD archive.")
+
+    archive_file.seek(size - _TRAILER.size)
+    index_offset, index_length, trailer_magic = _TRAILER.unpack(archive_file.read(_TRAILER.size))
+    archive_file.seek(0)
+    if (
+        archive_file.read(len(_MAGIC)) != _MAGIC
+        or trailer_magic != _MAGIC
+        or index_offset + index_length + _TRAILER.size != size
+    ):
+        raise ValueError(f"'{archive_name}' is not an APOD archive.")
+
+    archive_file.seek(index_offset)
+    content = json_codec.loads(archive_file.read(index_length))
+    if content.get("version") != ARCHIVE_VERSION:
+        raise ValueError(f"'{archive_name}' was written by an unsupported archive version.")
+
+    _get_codec(content["codec"])
+    return ArchiveIndex(content["codec"], [ArchiveBlock(*block) for block in content["blocks"]])
+
+
+def read_archive_index(archive_path: Path) -> ArchiveIndex:
+    with open(file=archive_path, mode="rb") as archive_file:
+        return _read_index(archive_file, archive_path.name)
+
+
+def iter_archive_entries(
+    archive_path: Path,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield the archived entries in an inclusive date range, in date order.
+    Only the blocks whose date range overlaps ``date_from``/``date_to`` are read and decompressed.
+    """
+    with open(file=archive_path, mode="rb") as archive_file:
+        index = _read_index(archive_file, archive_path.name)
+        _, decompress = _get_codec(index.codec)
+        start = 0 if date_from is None else bisect_left([block.last_date for block in index.blocks], date_from)
+
+        for block in index.blocks[start:]:
+            if date_to is not None and block.first_date > date_to:
+                break
+
+            archive_file.seek(block.offset)
+            for line in decompress(archive_file.read(block.length)).splitlines():
+                entry = json_codec.loads(line)
+                if in_date_range(entry["date"], date_from, date_to):
+                    yield entry
+
+
+def find_archived_entry(archive_path: Path, date_value: str) -> dict[str, Any] | None:
+    """Return the archived entry for a date, decompressing only the block that holds it."""
+    return next(iter_archive_entries(archive_path, date_value, date_value), None)
+
+
+def _print_archive_error(error: Exception, archive_path: Path) -> None:
+    if isinstance(error, FileNotFoundError):
+        msg = Text("\nNo archive found ", style="err")
+        msg.append("at ", style="body.text")
+        msg.append(f"'{archive_path}' ", style="app.primary")
+        msg.append("X", style="err")
+        console.print(msg)
+        return
+
+    if isinstance(error, PermissionError):
+        msg = Text("\nPermission error: ", style="err")
+        msg.append("Unable to read/write ", style="body.text")
+        msg.append(f"'{archive_path.name}'", style="app.primary")
+        msg.append(" at ", style="body.text")
+        msg.append(f"'{archive_path.parent}' ", style="app.primary")
+        msg.append("X", style="err")
+        console.print(msg)
+        return
+
+    console.print()
+    console.print(Text(str(error), style="err"))
+
+
+def export_archive(archive_path: Path = archive_file_path) -> None:
+    """Write every logged APOD to a compressed archive and report its size."""
+    try:
+        index = write_archive((record.to_dict() for record in iter_entries(order=ORDER_DATE)), archive_path)
+        archive_size = archive_path.stat().st_size
+    except Exception as e:
+        _print_archive_error(e, archive_path)
+        return
+
+    msg = Text("Archived: ", style="app.secondary")
+    msg.append(str(index.count), style="app.primary")
+    msg.append(" APODs -> ", style="body.text")
+    msg.append(f"{archive_path.name} ", style="app.primary")
+    msg.append(f"({archive_size / 1024:.1f} KB, {len(index.blocks)} {index.codec} blocks) ", style="body.text")
+    msg.append("✓", style="ok")
+    console.print(msg)
+
+
+def import_archive(archive_path: Path = archive_file_path) -> None:
+    """Log every archived APOD that is not logged yet, streaming the archive in batches."""
+    imported = 0
+    try:
+        entries = iter_archive_entries(archive_path)
+        while batch := list(islice(entries, ARCHIVE_IMPORT_BATCH_SIZE)):
+            imported += log_apod_entries(batch, show_individual_success_messages=False)
+    except Exception as e:
+        _print_archive_error(e, archive_path)
+        return
+
+    msg = Text("Imported: ", style="app.secondary")
+    msg.append(str(imported), style="app.primary")
+    msg.append(" new APODs <- ", style="body.text")
+    msg.append(f"{archive_path.name} ", style="app.primary")
+    msg.append("✓", style="ok")
+    console.print(msg)
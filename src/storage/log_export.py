@@ -0,0 +1,83 @@
+"""
+log_export.py
+
+Regenerates the flat logs (``output.jsonl`` / ``output.csv``) from any stream of
+records. The SQLite and sharded backends use it for ``--export-logs``. Each file
+is written to a temp file and then atomically swapped in. Afterwards the caches
+and journals of the replaced file are reset.
+"""
+from __future__ import annotations
+
+import csv
+from typing import Iterable
+
+from rich.text import Text
+
+from src.config import csv_file_name, csv_file_path, json_file_name, json_file_path
+from src.startup.console import console
+from src.storage.apod_record import ApodRecord
+from src.utils import json_codec
+from src.utils.csv_utils import HEADERS, get_csv_log_repository, get_csv_update_journal
+from src.utils.json_utils import (
+    get_json_log_index,
+    get_json_log_repository,
+    get_json_search_index,
+    get_json_update_journal,
+)
+
+
+def export_records_to_jsonl(records: Iterable[ApodRecord]) -> int:
+    """
+       Regenerate ``output.jsonl`` from records (atomically replacing it).
+
+       Returns:
+           int: Number of entries exported.
+    """
+    temp_path = json_file_path.with_name(json_file_path.name + ".tmp")
+    exported = 0
+
+    with open(file=temp_path, mode="w", encoding="utf-8") as json_file:
+        for record in records:
+            json_file.write(json_codec.dumps(record.to_dict()) + "\n")
+            exported += 1
+    temp_path.replace(json_file_path)
+
+    # The export is authoritative; pending file-backend patches no longer apply.
+    get_json_update_journal().clear()
+    get_json_log_index().invalidate()
+    get_json_search_index().invalidate()
+    get_json_log_repository().invalidate()
+    return exported
+
+
+def export_records_to_csv(records: Iterable[ApodRecord]) -> int:
+    """
+       Regenerate ``output.csv`` from records (atomically replacing it).
+
+       Returns:
+           int: Number of rows exported.
+    """
+    temp_path = csv_file_path.with_name(csv_file_path.name + ".tmp")
+    exported = 0
+
+    with open(file=temp_path, mode="w", encoding="utf-8", newline="") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=HEADERS.keys())
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record.to_dict())
+            exported += 1
+    temp_path.replace(csv_file_path)
+
+    get_csv_update_journal().clear()
+    get_csv_log_repository().invalidate()
+    return exported
+
+
+def show_export_results(exported_json: int, exported_csv: int) -> None:
+    for file_name, exported in ((json_file_name, exported_json), (csv_file_name, exported_csv)):
+        msg = Text("Exported: ", style="app.secondary")
+        msg.append(str(exported), style="app.primary")
+        msg.append(" APODs -> ", style="body.text")
+        msg.append(f"{file_name} ", style="app.primary")
+        msg.append("✓", style="ok")
+        console.print(msg)
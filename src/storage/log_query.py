@@ -0,0 +1,164 @@
+"""
+log_query.py
+
+Streaming queries over the JSONL and CSV logs.
+``iter_jsonl_records`` and ``iter_csv_records`` lazily yield ``ApodRecord``s
+with pending update journal patches applied. Both accept an inclusive
+``date_from``/``date_to`` range, a ``predicate`` on the record, and one of
+these orders:
+
+    ORDER_LOGGED       file order (oldest logged first)
+    ORDER_LOGGED_DESC  newest logged first, read backwards from the end of the log
+    ORDER_DATE         by APOD date, earliest first
+    ORDER_DATE_DESC    by APOD date, latest first
+
+Callers may stop at any point and nothing past it is read. For JSONL, date
+ranges and date orders are answered from the date index and summary sidecars,
+so only the lines that are yielded get read, one seek each. The CSV log has no
+index, so its date orders sort the rows in range in memory.
+"""
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from typing import Callable, Iterator
+
+from src.storage.apod_record import ApodRecord
+from src.storage.jsonl_index import get_jsonl_index
+from src.storage.log_tail import iter_csv_rows_backwards, iter_lines_backwards
+from src.storage.update_journal import get_update_journal
+from src.utils import json_codec
+
+ORDER_LOGGED = "logged"
+ORDER_LOGGED_DESC = "logged_desc"
+ORDER_DATE = "date"
+ORDER_DATE_DESC = "date_desc"
+ORDERS = (ORDER_LOGGED, ORDER_LOGGED_DESC, ORDER_DATE, ORDER_DATE_DESC)
+
+RecordPredicate = Callable[[ApodRecord], bool]
+
+
+def check_order(order: str) -> None:
+    if order not in ORDERS:
+        raise ValueError(f"Unknown entry order {order!r}; expected one of {', '.join(ORDERS)}.")
+
+
+def in_date_range(date_value: str, date_from: str | None, date_to: str | None) -> bool:
+    return (date_from is None or date_value >= date_from) and (date_to is None or date_value <= date_to)
+
+
+def _iter_indexed_locations(
+    log_path: Path,
+    date_from: str | None,
+    date_to: str | None,
+    order: str,
+) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(date, offset, length)`` of the indexed lines in range, in the requested order."""
+    index = get_jsonl_index(log_path)
+
+    if order in (ORDER_LOGGED, ORDER_LOGGED_DESC):
+        locations = [location for location in index.locations() if in_date_range(location[0], date_from, date_to)]
+        yield from reversed(locations) if order == ORDER_LOGGED_DESC else locations
+        return
+
+    descending = order == ORDER_DATE_DESC
+    summary = index.summary()
+    endpoint = summary.newest if descending else summary.oldest
+    skipped_date = None
+
+    if endpoint is not None and in_date_range(endpoint[0], date_from, date_to):
+        # The summary sidecar answers the first location, so taking one entry never loads the index.
+        yield endpoint
+        skipped_date = endpoint[0]
+
+    locations = [
+        location for location in index.locations()
+        if location[0] != skipped_date and in_date_range(location[0], date_from, date_to)
+    ]
+    locations.sort(reverse=descending)
+    yield from locations
+
+
+def _iter_indexed_lines(
+    log_path: Path,
+    date_from: str | None,
+    date_to: str | None,
+    order: str,
+) -> Iterator[bytes]:
+    with open(file=log_path, mode="rb") as log_file:
+        for _, offset, length in _iter_indexed_locations(log_path, date_from, date_to, order):
+            log_file.seek(offset)
+            yield log_file.read(length)
+
+
+def _iter_lines_forward(log_path: Path) -> Iterator[bytes]:
+    with open(file=log_path, mode="rb") as log_file:
+        for line in log_file:
+            if line.strip():
+                yield line
+
+
+def iter_jsonl_records(
+    log_path: Path,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    predicate: RecordPredicate | None = None,
+    order: str = ORDER_LOGGED,
+) -> Iterator[ApodRecord]:
+    """Yield the records of a JSONL log lazily (see the module docstring for the arguments)."""
+    check_order(order)
+    if not log_path.exists():
+        return
+
+    if date_from is None and date_to is None and order == ORDER_LOGGED:
+        lines = _iter_lines_forward(log_path)
+    elif date_from is None and date_to is None and order == ORDER_LOGGED_DESC:
+        lines = iter_lines_backwards(log_path)
+    else:
+        lines = _iter_indexed_lines(log_path, date_from, date_to, order)
+
+    update_journal = get_update_journal(log_path)
+    for line in lines:
+        record = ApodRecord.from_dict(update_journal.apply(json_codec.loads(line)))
+        if in_date_range(record.date, date_from, date_to) and (predicate is None or predicate(record)):
+            yield record
+
+
+def _iter_csv_rows_forward(log_path: Path) -> Iterator[dict[str, str]]:
+    with open(file=log_path, mode="r", encoding="utf-8", newline="") as csv_file:
+        for row in csv.DictReader(csv_file):
+            if row.get("date"):
+                yield row
+
+
+def iter_csv_records(
+    log_path: Path,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    predicate: RecordPredicate | None = None,
+    order: str = ORDER_LOGGED,
+) -> Iterator[ApodRecord]:
+    """Yield the records of a CSV log lazily (see the module docstring for the arguments)."""
+    check_order(order)
+    if not log_path.exists():
+        return
+
+    if order == ORDER_LOGGED:
+        rows = _iter_csv_rows_forward(log_path)
+    elif order == ORDER_LOGGED_DESC:
+        rows = iter_csv_rows_backwards(log_path)
+    else:
+        rows = iter(sorted(
+            (row for row in _iter_csv_rows_forward(log_path) if in_date_range(row["date"], date_from, date_to)),
+            key=lambda row: row["date"],
+            reverse=order == ORDER_DATE_DESC,
+        ))
+
+    update_journal = get_update_journal(log_path)
+    for row in rows:
+        if not in_date_range(row["date"], date_from, date_to):
+            continue
+
+        record = ApodRecord.from_dict(update_journal.apply(row))
+        if predicate is None or predicate(record):
+            yield record
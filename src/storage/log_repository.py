@@ -0,0 +1,150 @@
+"""
+log_repository.py
+
+Session-scoped, in-memory view of an APOD log (JSONL or CSV).
+The log is parsed once into compact ``ApodRecord``s (see apod_record.py) and
+every read is served from memory. Pending patches from the log's update
+journal are overlaid on load.
+Before each read the size and mtime of the log and its journal are checked,
+and the records are reloaded only when one of them changed.
+"""
+from __future__ import annotations
+
+import csv
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from src.storage.apod_record import ApodRecord
+from src.storage.log_signature import get_log_signature
+from src.storage.update_journal import UpdateJournal, get_update_journal
+from src.utils import json_codec
+
+
+def load_jsonl_records(log_path: Path) -> list[ApodRecord]:
+    """Parse every non-empty line of a JSONL log."""
+    with open(file=log_path, mode="r", encoding="utf-8") as json_file:
+        return [ApodRecord.from_dict(json_codec.loads(line)) for line in json_file if line.strip()]
+
+
+def load_csv_records(log_path: Path) -> list[ApodRecord]:
+    """Parse every data row of a CSV log."""
+    with open(file=log_path, mode="r", encoding="utf-8", newline="") as csv_file:
+        return [ApodRecord.from_dict(row) for row in csv.DictReader(csv_file) if row.get("date")]
+
+
+class LogRepository:
+    """
+    Cached records of one log file, reloaded only when the file changes on disk.
+    """
+
+    def __init__(self, log_path: Path, loader: Callable[[Path], list[ApodRecord]]) -> None:
+        self.log_path = log_path
+        self._loader = loader
+        self._journal: UpdateJournal = get_update_journal(log_path)
+        self._lock = threading.Lock()
+        self._records: list[ApodRecord] = []
+        self._positions: dict[str, int] = {}
+        self._dates: set[str] = set()
+        self._signature: tuple[tuple[int, int], tuple[int, int] | None] | None = None
+
+    def _load(self) -> None:
+        records = self._loader(self.log_path)
+        patches = self._journal.patches()
+
+        if patches:
+            records = [_patch_record(record, patches.get(record.date)) for record in records]
+
+        self._records = records
+        self._positions = {}
+        for position, record in enumerate(records):
+            self._positions.setdefault(record.date, position)
+        self._dates = set(self._positions)
+
+    def records(self) -> list[ApodRecord]:
+        """Return all records in log order (do not mutate the returned list)."""
+        with self._lock:
+            log_signature = get_log_signature(self.log_path)
+            if log_signature is None:
+                self._records, self._dates, self._signature = [], set(), None
+                return self._records
+
+            signature = (log_signature, self._journal.signature())
+            if signature != self._signature:
+                self._load()
+                self._signature = signature
+
+            return self._records
+
+    def record_appended(self, records: list[ApodRecord]) -> None:
+        """
+        Add records the caller just appended to the file, without re-reading it.
+
+        Only applies when the cache was loaded; otherwise the next read loads
+        the file (including the new records) anyway.
+        """
+        with self._lock:
+            if self._signature is None:
+                return
+
+            log_signature = get_log_signature(self.log_path)
+            if log_signature is None:
+                self._signature = None
+                return
+
+            for record in records:
+                self._positions.setdefault(record.date, len(self._records))
+                self._records.append(record)
+                self._dates.add(record.date)
+            self._signature = (log_signature, self._signature[1])
+
+    def record_patched(self, updates: dict[str, dict[str, Any]]) -> None:
+        """
+        Apply field updates the caller just wrote to the update journal, without re-reading the log.
+
+        Only applies when the cache was loaded; otherwise the next read
+        overlays the journal anyway.
+        """
+        with self._lock:
+            if self._signature is None:
+                return
+
+            for date_value, fields in updates.items():
+                position = self._positions.get(date_value)
+                if position is not None:
+                    self._records[position] = _patch_record(self._records[position], fields)
+            self._signature = (self._signature[0], self._journal.signature())
+
+    def invalidate(self) -> None:
+        """Force a reload on the next read (for rewrites that may keep size and mtime)."""
+        with self._lock:
+            self._signature = None
+
+    def dates(self) -> set[str]:
+        self.records()
+        return self._dates
+
+    def count(self) -> int:
+        return len(self.records())
+
+
+def _patch_record(record: ApodRecord, fields: dict[str, Any] | None) -> ApodRecord:
+    if not fields:
+        return record
+
+    return record.replace(**fields)
+
+
+_repositories: dict[Path, LogRepository] = {}
+_repositories_lock = threading.Lock()
+
+
+def get_log_repository(log_path: Path, loader: Callable[[Path], list[ApodRecord]]) -> LogRepository:
+    """Return the shared repository for a log file, creating it on first use."""
+    with _repositories_lock:
+        repository = _repositories.get(log_path)
+        if repository is None:
+            repository = LogRepository(log_path, loader)
+            _repositories[log_path] = repository
+
+    return repository
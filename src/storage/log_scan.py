@@ -0,0 +1,90 @@
+"""
+log_scan.py
+
+Index-free scanning of JSONL logs.
+The log is memory-mapped and searched for the raw ``"date": "YYYY-MM-DD"``
+bytes, so finding dates needs no per-line decoding. Only lines where the
+pattern is missing, or the line that answers a lookup, are decoded.
+This is used where no usable ``.idx`` exists yet, such as
+first-run rebuilds and lookups on logs written by older versions.
+"""
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import Iterator
+
+from src.utils import json_codec
+
+# json.dumps writes '"date": "..."'; the optional whitespace also covers compact or hand-edited lines.
+# Quotes inside JSON string values are always escaped, so this can only match a key.
+_DATE_FIELD_PATTERN = re.compile(rb'"date"\s*:\s*"(\d{4}-\d{2}-\d{2})"')
+
+
+def _date_field_pattern(date_value: str) -> re.Pattern[bytes]:
+    return re.compile(rb'"date"\s*:\s*"' + re.escape(date_value.encode("ascii")) + rb'"')
+
+
+def _line_bounds(mapped: mmap.mmap, start: int, end: int, floor: int = 0) -> tuple[int, int]:
+    """Return ``(offset, length)`` of the line containing ``mapped[start:end]`` (newline included)."""
+    line_start = mapped.rfind(b"\n", floor, start) + 1 or floor
+    line_end = mapped.find(b"\n", end)
+    line_end = len(mapped) if line_end == -1 else line_end + 1
+    return line_start, line_end - line_start
+
+
+def _decode_lines(mapped: mmap.mmap, start: int, end: int) -> Iterator[tuple[str, int, int]]:
+    """Fall back to decoding the non-blank lines in ``mapped[start:end]``."""
+    offset = start
+    for line in io.BytesIO(mapped[start:end]):
+        if line.strip():
+            yield json_codec.loads(line)["date"], offset, len(line)
+        offset += len(line)
+
+
+def iter_date_locations(log_path: Path) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(date, offset, length)`` for every non-blank line of a JSONL log, in file order."""
+    with open(file=log_path, mode="rb") as log_file:
+        if os.fstat(log_file.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            position = 0
+
+            for match in _DATE_FIELD_PATTERN.finditer(mapped):
+                if match.start() < position:
+                    continue
+
+                line_start, length = _line_bounds(mapped, match.start(), match.end(), position)
+                if line_start > position:
+                    # Lines without a recognisable date field between the previous match and this one.
+                    yield from _decode_lines(mapped, position, line_start)
+
+                yield match.group(1).decode("ascii"), line_start, length
+                position = line_start + length
+
+            if position < len(mapped):
+                yield from _decode_lines(mapped, position, len(mapped))
+
+
+def find_date_location(log_path: Path, date_value: str) -> tuple[int, int] | None:
+    """
+    Return ``(offset, length)`` of the first line logged for a date, or None.
+
+    Only lines containing the date's byte pattern are decoded, to confirm the
+    match is the entry's own ``date`` field.
+    """
+    with open(file=log_path, mode="rb") as log_file:
+        if os.fstat(log_file.fileno()).st_size == 0:
+            return None
+
+        with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for match in _date_field_pattern(date_value).finditer(mapped):
+                offset, length = _line_bounds(mapped, match.start(), match.end())
+                if json_codec.loads(mapped[offset:offset + length]).get("date") == date_value:
+                    return offset, length
+
+    return None
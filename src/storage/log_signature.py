@@ -0,0 +1,20 @@
+"""
+log_signature.py
+
+``(size, mtime_ns)`` signatures of log files.
+Sidecars, caches and journals remember the signature of the file they were
+built from and treat any mismatch as a sign that the file changed.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def get_log_signature(log_path: Path) -> tuple[int, int] | None:
+    """Return ``(size, mtime_ns)`` of a file, or None when it does not exist."""
+    try:
+        stat = log_path.stat()
+    except OSError:
+        return None
+
+    return stat.st_size, stat.st_mtime_ns
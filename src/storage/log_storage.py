@@ -0,0 +1,249 @@
+"""
+log_storage.py
+
+Backend-neutral entry point for the APOD log.
+Callers log, update, delete, and display entries through these functions,
+which route to the flat files (``output.jsonl`` + ``output.csv``), the SQLite
+database, or the year-sharded JSONL logs depending on ``STORAGE_BACKEND``. With ``CSV_LOG_MODE=derived``
+the files backend only writes ``output.jsonl`` and regenerates ``output.csv``
+from it in the background.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+from rich.text import Text
+
+from src.config import STORAGE_BACKEND, csv_file_name, json_file_path
+from src.startup.console import console
+from src.storage import csv_storage, json_storage, sharded_storage, sqlite_storage
+from src.storage.apod_record import ApodRecord
+from src.storage.log_query import ORDER_LOGGED, RecordPredicate, iter_jsonl_records
+from src.storage.derived_csv import derive_csv_from_jsonl, is_csv_derived, schedule_csv_refresh
+from src.utils import csv_utils, json_utils
+
+
+def is_sqlite_backend() -> bool:
+    return STORAGE_BACKEND == "sqlite"
+
+
+def is_sharded_backend() -> bool:
+    return STORAGE_BACKEND == "sharded"
+
+
+def log_apod_entry(formatted_apod_data: Any, show_individual_success_message: bool = True) -> None:
+    if is_sqlite_backend():
+        sqlite_storage.log_data_to_sqlite(formatted_apod_data, show_individual_success_message)
+        return
+
+    if is_sharded_backend():
+        sharded_storage.log_data_to_sharded(formatted_apod_data, show_individual_success_message)
+        return
+
+    if is_csv_derived():
+        json_storage.log_data_to_json(formatted_apod_data, show_individual_success_message)
+        schedule_csv_refresh()
+        return
+
+    csv_storage.log_data_to_csv(formatted_apod_data, show_individual_success_message)
+    json_storage.log_data_to_json(formatted_apod_data, show_individual_success_message)
+
+
+def log_apod_entries(list_formatted_apod_data: Any, show_individual_success_messages: bool = True) -> int:
+    """Log several entries at once; return how many were new."""
+    if is_sqlite_backend():
+        return sqlite_storage.log_multiple_sqlite_entries(list_formatted_apod_data, show_individual_success_messages)
+
+    if is_sharded_backend():
+        return sharded_storage.log_multiple_sharded_entries(list_formatted_apod_data, show_individual_success_messages)
+
+    if is_csv_derived():
+        saved = json_storage.log_multiple_json_entries(list_formatted_apod_data, show_individual_success_messages)
+        schedule_csv_refresh()
+        return saved
+
+    csv_storage.log_multiple_csv_entries(list_formatted_apod_data, show_individual_success_messages)
+    return json_storage.log_multiple_json_entries(list_formatted_apod_data, show_individual_success_messages)
+
+
+def update_local_file_path(target_date: str, local_file_path: str) -> bool:
+    return update_local_file_paths({target_date: local_file_path}) > 0
+
+
+def update_local_file_paths(local_file_paths: dict[str, str]) -> int:
+    """Store several ``{date: local_file_path}`` values; return how many entries were updated."""
+    if is_sqlite_backend():
+        return sqlite_storage.update_local_file_paths_in_sqlite(local_file_paths)
+
+    if is_sharded_backend():
+        return sharded_storage.update_local_file_paths_in_shards(local_file_paths)
+
+    if is_csv_derived():
+        updated = json_storage.update_local_file_paths_in_json(local_file_paths)
+        schedule_csv_refresh()
+        return updated
+
+    csv_storage.update_local_file_paths_in_csv(local_file_paths)
+    return json_storage.update_local_file_paths_in_json(local_file_paths)
+
+
+def delete_log_entry(target_date: Any) -> bool:
+    """Delete one entry by date; True when it was found (in every flat log, for the files backend)."""
+    if is_sqlite_backend():
+        return sqlite_storage.delete_one_sqlite_entry(target_date)
+
+    if is_sharded_backend():
+        return sharded_storage.delete_one_sharded_entry(target_date)
+
+    if is_csv_derived():
+        found_json = json_storage.delete_one_json_entry(target_date)
+        schedule_csv_refresh()
+        return bool(found_json)
+
+    found_json = json_storage.delete_one_json_entry(target_date)
+    found_csv = csv_storage.delete_one_csv_entry(target_date)
+    return bool(found_json and found_csv)
+
+
+def clear_logs() -> bool:
+    if is_sqlite_backend():
+        return sqlite_storage.clear_sqlite_database()
+
+    if is_sharded_backend():
+        return sharded_storage.clear_sharded_logs()
+
+    if json_utils.clear_json_output_file() and csv_utils.clear_csv_output_file():
+        csv_utils.write_header_to_csv()
+        schedule_csv_refresh()
+        return True
+
+    return False
+
+
+def iter_entries(
+    date_from: str | None = None,
+    date_to: str | None = None,
+    predicate: RecordPredicate | None = None,
+    order: str = ORDER_LOGGED,
+) -> Iterator[ApodRecord]:
+    """
+    Lazily yield logged records from the active backend.
+
+    ``date_from``/``date_to`` are inclusive ``YYYY-MM-DD`` bounds, ``predicate``
+    filters records, and ``order`` is one of the ``log_query.ORDER_*`` values.
+    Each backend answers ranges and date orders from its own index, and
+    reading stops as soon as the caller stops iterating.
+    """
+    if is_sqlite_backend():
+        return sqlite_storage.iter_sqlite_entries(date_from, date_to, predicate, order)
+
+    if is_sharded_backend():
+        return sharded_storage.iter_sharded_records(date_from, date_to, predicate, order)
+
+    return iter_jsonl_records(json_file_path, date_from, date_to, predicate, order)
+
+
+def show_first_n_log_entries() -> None:
+    if is_sqlite_backend():
+        sqlite_storage.show_first_n_sqlite_log_entries()
+    elif is_sharded_backend():
+        sharded_storage.show_first_n_sharded_log_entries()
+    else:
+        json_storage.show_first_n_json_log_entries()
+
+
+def show_last_n_log_entries() -> None:
+    if is_sqlite_backend():
+        sqlite_storage.show_last_n_sqlite_log_entries()
+    elif is_sharded_backend():
+        sharded_storage.show_last_n_sharded_log_entries()
+    else:
+        json_storage.show_last_n_json_log_entries()
+
+
+def show_all_log_entries() -> None:
+    if is_sqlite_backend():
+        sqlite_storage.show_all_sqlite_entries()
+    elif is_sharded_backend():
+        sharded_storage.show_all_sharded_entries()
+    else:
+        json_storage.show_all_json_entries()
+
+
+def fetch_most_recent_apod() -> None:
+    if is_sqlite_backend():
+        sqlite_storage.fetch_most_recent_sqlite_apod()
+    elif is_sharded_backend():
+        sharded_storage.fetch_most_recent_sharded_apod()
+    else:
+        json_storage.fetch_most_recent_json_apod()
+
+
+def fetch_oldest_apod() -> None:
+    if is_sqlite_backend():
+        sqlite_storage.fetch_oldest_sqlite_apod()
+    elif is_sharded_backend():
+        sharded_storage.fetch_oldest_sharded_apod()
+    else:
+        json_storage.fetch_oldest_json_apod()
+
+
+def search_log_entries(query: str) -> None:
+    """Display the entries matching a full-text query (see ``search_index.parse_query``)."""
+    if is_sqlite_backend():
+        sqlite_storage.search_sqlite_entries(query)
+    elif is_sharded_backend():
+        sharded_storage.search_sharded_entries(query)
+    else:
+        json_storage.search_json_log_entries(query)
+
+
+def get_log_entry_count() -> int:
+    if is_sqlite_backend():
+        return sqlite_storage.get_sqlite_line_count()
+
+    if is_sharded_backend():
+        return sharded_storage.get_sharded_line_count()
+
+    return json_utils.get_line_count(0)
+
+
+def get_logged_dates() -> set[str]:
+    if is_sqlite_backend():
+        return sqlite_storage.get_logged_sqlite_dates()
+
+    if is_sharded_backend():
+        return sharded_storage.get_logged_sharded_dates()
+
+    return json_utils.get_logged_json_dates()
+
+
+def export_logs() -> None:
+    """Regenerate the flat logs from the primary store (database, shards, or JSONL for a derived CSV)."""
+    if is_sqlite_backend():
+        sqlite_storage.export_sqlite_logs()
+        return
+
+    if is_sharded_backend():
+        sharded_storage.export_sharded_logs()
+        return
+
+    if is_csv_derived():
+        try:
+            exported = derive_csv_from_jsonl()
+        except Exception as e:
+            console.print()
+            console.print(Text(str(e), style="err"))
+            return
+
+        msg = Text("Exported: ", style="app.secondary")
+        msg.append(str(exported), style="app.primary")
+        msg.append(" APODs -> ", style="body.text")
+        msg.append(f"{csv_file_name} ", style="app.primary")
+        msg.append("✓", style="ok")
+        console.print(msg)
+        return
+
+    msg = Text("Nothing to export: ", style="app.secondary")
+    msg.append("the JSONL and CSV logs are the active storage backend and are always up to date.", style="body.text")
+    console.print(msg)
@@ -0,0 +1,140 @@
+"""
+log_summary.py
+
+Small summary sidecar for a JSONL log: entry count plus the earliest and
+latest APOD dates with the byte offset and length of their lines.
+It lives next to the log as ``<log>.summary`` and is signed with the log's
+size and mtime. Appends and deletes update it in place; whenever the
+signature no longer matches the log, the owner rebuilds it from the date
+index. With it, "count", "oldest" and "most recent" cost one small read plus
+at most one seek into the log.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+# (date, byte offset, line length)
+EntryLocation = tuple[str, int, int]
+
+
+class LogSummary(NamedTuple):
+    count: int
+    oldest: EntryLocation | None
+    newest: EntryLocation | None
+
+
+EMPTY_LOG_SUMMARY = LogSummary(0, None, None)
+
+
+def summarize_locations(entries: dict[str, tuple[int, int]]) -> LogSummary:
+    """Build the summary of a full ``{date: (offset, length)}`` index."""
+    if not entries:
+        return EMPTY_LOG_SUMMARY
+
+    oldest_date = min(entries)
+    newest_date = max(entries)
+    return LogSummary(
+        count=len(entries),
+        oldest=(oldest_date, *entries[oldest_date]),
+        newest=(newest_date, *entries[newest_date]),
+    )
+
+
+class SummarySidecar:
+    """
+    Cached summary of one log, valid only for the log signature it was written for.
+    """
+
+    def __init__(self, log_path: Path) -> None:
+        self.summary_path = log_path.with_name(log_path.name + ".summary")
+        self._summary: LogSummary | None = None
+        self._signature: tuple[int, int] | None = None
+
+    def read(self, signature: tuple[int, int] | None) -> LogSummary | None:
+        """Return the summary if it was written for ``signature``, else None."""
+        if signature is None:
+            return None
+
+        if self._signature == signature:
+            return self._summary
+
+        try:
+            with open(file=self.summary_path, mode="r", encoding="utf-8") as summary_file:
+                content = json.load(summary_file)
+
+            if tuple(content["signature"]) != signature:
+                return None
+
+            summary = LogSummary(
+                count=int(content["count"]),
+                oldest=tuple(content["oldest"]) if content["oldest"] else None,
+                newest=tuple(content["newest"]) if content["newest"] else None,
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        self._summary, self._signature = summary, signature
+        return summary
+
+    def write(self, summary: LogSummary, signature: tuple[int, int] | None) -> None:
+        self._summary, self._signature = summary, signature
+        if signature is None:
+            return
+
+        content = {"signature": list(signature), **summary._asdict()}
+        temp_path = self.summary_path.with_name(self.summary_path.name + ".tmp")
+        try:
+            with open(file=temp_path, mode="w", encoding="utf-8") as summary_file:
+                json.dump(content, summary_file)
+            temp_path.replace(self.summary_path)
+        except OSError:
+            # Only an accelerator; the next read rebuilds it from the index.
+            self._signature = None
+
+    def record_appends(
+        self,
+        previous_signature: tuple[int, int] | None,
+        locations: list[EntryLocation],
+        signature: tuple[int, int] | None,
+    ) -> None:
+        """Fold newly indexed lines into the summary, if it matched the log before the append."""
+        summary = self.read(previous_signature)
+        if summary is None:
+            return
+
+        count, oldest, newest = summary
+        for location in locations:
+            count += 1
+            if oldest is None or location[0] < oldest[0]:
+                oldest = location
+            if newest is None or location[0] > newest[0]:
+                newest = location
+
+        self.write(LogSummary(count, oldest, newest), signature)
+
+    def record_removed(
+        self,
+        previous_signature: tuple[int, int] | None,
+        removed: EntryLocation,
+        remaining_entries: dict[str, tuple[int, int]],
+        signature: tuple[int, int] | None,
+    ) -> None:
+        """Drop a line cut out of the log, shifting the offsets of later lines."""
+        summary = self.read(previous_signature)
+        if summary is None:
+            return
+
+        date_value, offset, length = removed
+        if date_value in (summary.oldest and summary.oldest[0], summary.newest and summary.newest[0]):
+            # The earliest or latest date is gone; find the next one in the (already loaded) index.
+            self.write(summarize_locations(remaining_entries), signature)
+            return
+
+        def shifted(location: EntryLocation | None) -> EntryLocation | None:
+            if location is None or location[1] < offset:
+                return location
+            return location[0], location[1] - length, location[2]
+
+        self.write(LogSummary(summary.count - 1, shifted(summary.oldest), shifted(summary.newest)), signature)
@@ -0,0 +1,97 @@
+"""
+log_tail.py
+
+Backwards readers for the JSONL and CSV logs.
+They seek to the end of the log and read fixed-size blocks backwards,
+yielding records from last to first. A caller that stops after N records only
+pays for those N, not for the size of the log.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import os
+from itertools import chain
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _iter_blocks_backwards(log_file: BinaryIO, block_size: int) -> Iterator[tuple[int, bytes]]:
+    """Yield ``(offset, block)`` pairs from the end of the file to its start."""
+    position = log_file.seek(0, os.SEEK_END)
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        log_file.seek(position)
+        yield position, log_file.read(read_size)
+
+
+def iter_lines_backwards(log_path: Path, block_size: int = TAIL_BLOCK_SIZE) -> Iterator[bytes]:
+    """Yield the non-blank lines of a file from last to first (without line endings)."""
+    partial = b""
+
+    with open(file=log_path, mode="rb") as log_file:
+        for _, block in _iter_blocks_backwards(log_file, block_size):
+            # The first piece may continue in the previous block, so it is carried over.
+            pieces = (block + partial).split(b"\n")
+            partial = pieces[0]
+
+            for piece in reversed(pieces[1:]):
+                if piece.strip():
+                    yield piece.rstrip(b"\r")
+
+    if partial.strip():
+        yield partial.rstrip(b"\r")
+
+
+def _iter_csv_record_starts(log_file: BinaryIO, block_size: int) -> Iterator[int]:
+    """
+    Yield the offsets where CSV records start, from the end of the file backwards (offset 0 excluded).
+
+    Quoted fields may contain newlines, so a newline only ends a record when
+    it lies outside quotes. Escaped quotes come in pairs, so a line start is a
+    record boundary exactly when the number of quote characters from there to
+    the end of the file is even.
+    """
+    quote_count = 0
+    end = log_file.seek(0, os.SEEK_END)
+
+    for offset, block in _iter_blocks_backwards(log_file, block_size):
+        segment_end = len(block)
+        newline_index = block.rfind(b"\n", 0, segment_end)
+
+        while newline_index != -1:
+            quote_count += block.count(b'"', newline_index + 1, segment_end)
+            record_start = offset + newline_index + 1
+
+            if quote_count % 2 == 0 and record_start < end:
+                yield record_start
+
+            segment_end = newline_index
+            newline_index = block.rfind(b"\n", 0, segment_end)
+
+        quote_count += block.count(b'"', 0, segment_end)
+
+
+def iter_csv_rows_backwards(log_path: Path, block_size: int = TAIL_BLOCK_SIZE) -> Iterator[dict[str, str]]:
+    """Yield the data rows of a CSV log with a header row from last to first, decoding one record at a time."""
+    with open(file=log_path, mode="rb") as log_file, open(file=log_path, mode="rb") as record_file:
+        header = record_file.readline()
+        fieldnames = next(csv.reader([header.decode("utf-8-sig")]), [])
+        if not fieldnames:
+            return
+
+        record_end = log_file.seek(0, os.SEEK_END)
+        for record_start in chain(_iter_csv_record_starts(log_file, block_size), [0]):
+            record_start = max(record_start, len(header))
+            if record_start < record_end:
+                record_file.seek(record_start)
+                record_text = record_file.read(record_end - record_start).decode("utf-8")
+                rows = csv.DictReader(io.StringIO(record_text, newline=""), fieldnames=fieldnames)
+                yield from reversed([row for row in rows if row.get("date")])
+                record_end = record_start
+
+            if record_start <= len(header):
+                return
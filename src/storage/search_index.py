@@ -0,0 +1,401 @@
+"""
+search_index.py
+
+Full-text search over the ``title`` and ``explanation`` of logged APODs.
+``InvertedIndex`` maps each token to a posting list of ``{date: term frequency}``
+and ranks matches with BM25. ``SearchIndex`` persists one for a JSONL log in
+``<log>.search`` so searches never decode the log. ``search_many`` searches
+several logs (e.g. year shards) with their BM25 statistics combined, so the
+ranking matches one index over all of them.
+
+Sidecar layout (plain text, replayed in order on load):
+    <log size:20 digits> <log mtime_ns:20 digits>\\n
+    +YYYY-MM-DD <document length> <token>:<tf> <token>:<tf> ...\\n
+    -YYYY-MM-DD\\n
+Logging an entry appends one ``+`` line and deleting one appends a ``-`` line,
+after which the fixed-width header is re-signed in place. Whenever the header
+no longer matches the log (manual edits, rewrites) the sidecar is rebuilt.
+
+Query syntax: terms separated by spaces must all match (AND); ``OR`` between
+groups of terms returns entries matching any group, e.g. ``saturn cassini OR
+titan``.
+"""
+from __future__ import annotations
+
+import math
+import os
+import re
+import threading
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from src.storage.log_signature import get_log_signature
+from src.utils import json_codec
+
+_HEADER_WIDTH = 20
+# Title words say more about an APOD than words buried in the explanation.
+_TITLE_WEIGHT = 3
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were which with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase search tokens, dropping stopwords and single characters."""
+    return [
+        token for token in _TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS
+    ]
+
+
+def parse_query(query: str) -> list[list[str]]:
+    """Split a query into OR-groups of AND-ed tokens (empty groups are dropped)."""
+    groups = []
+    for group_text in re.split(r"\s+OR\s+", query.strip()):
+        tokens = list(dict.fromkeys(tokenize(group_text)))
+        if tokens:
+            groups.append(tokens)
+    return groups
+
+
+def _entry_term_frequencies(entry: dict[str, Any]) -> Counter[str]:
+    frequencies = Counter(tokenize(entry.get("explanation") or ""))
+    for token in tokenize(entry.get("title") or ""):
+        frequencies[token] += _TITLE_WEIGHT
+    return frequencies
+
+
+class InvertedIndex:
+    """
+    In-memory token -> ``{date: term frequency}`` index with ranked AND/OR search.
+    """
+
+    def __init__(self) -> None:
+        self.postings: dict[str, dict[str, int]] = {}
+        self.document_lengths: dict[str, int] = {}
+        self._total_length = 0
+
+    def add_document(self, date_value: str, frequencies: dict[str, int]) -> None:
+        if date_value in self.document_lengths:
+            self.remove_document(date_value)
+
+        length = sum(frequencies.values())
+        self.document_lengths[date_value] = length
+        self._total_length += length
+
+        for token, frequency in frequencies.items():
+            self.postings.setdefault(token, {})[date_value] = frequency
+
+    def add_entry(self, entry: dict[str, Any]) -> dict[str, int]:
+        """Index a log entry and return the term frequencies that were added."""
+        frequencies = dict(_entry_term_frequencies(entry))
+        self.add_document(entry["date"], frequencies)
+        return frequencies
+
+    def remove_document(self, date_value: str) -> bool:
+        length = self.document_lengths.pop(date_value, None)
+        if length is None:
+            return False
+
+        self._total_length -= length
+        # A document's tokens are not stored separately, so walk the postings once.
+        for token in [token for token, posting in self.postings.items() if date_value in posting]:
+            posting = self.postings[token]
+            del posting[date_value]
+            if not posting:
+                del self.postings[token]
+        return True
+
+    @property
+    def total_length(self) -> int:
+        return self._total_length
+
+    def search(self, query: str) -> list[tuple[str, float]]:
+        """Return ``(date, score)`` pairs matching the query, best match first."""
+        return search_inverted_indexes([self], query)
+
+
+def _merged_posting(indexes: list[InvertedIndex], token: str) -> dict[str, int]:
+    if len(indexes) == 1:
+        return indexes[0].postings.get(token, {})
+
+    posting: dict[str, int] = {}
+    for index in indexes:
+        posting.update(index.postings.get(token, {}))
+    return posting
+
+
+def search_inverted_indexes(indexes: list[InvertedIndex], query: str) -> list[tuple[str, float]]:
+    """
+    Return ``(date, score)`` pairs matching the query, best match first, over
+    indexes that each hold different dates. Document counts, lengths and
+    postings are combined, so the scores equal those of a single index.
+    """
+    document_count = sum(len(index.document_lengths) for index in indexes)
+    if not document_count:
+        return []
+
+    average_length = sum(index.total_length for index in indexes) / document_count or 1.0
+    document_lengths = indexes[0].document_lengths if len(indexes) == 1 else {
+        date_value: length for index in indexes for date_value, length in index.document_lengths.items()
+    }
+    scores: dict[str, float] = {}
+
+    for group in parse_query(query):
+        postings = [_merged_posting(indexes, token) for token in group]
+
+        if not all(postings):
+            continue
+
+        # Intersect starting from the rarest token so the candidate set stays small.
+        ordered = sorted(zip(group, postings), key=lambda item: len(item[1]))
+        candidates = set(ordered[0][1])
+        for _, posting in ordered[1:]:
+            candidates.intersection_update(posting)
+
+        for date_value in candidates:
+            length_ratio = document_lengths[date_value] / average_length
+            score = 0.0
+            for _, posting in ordered:
+                frequency = posting[date_value]
+                idf = math.log(1 + (document_count - len(posting) + 0.5) / (len(posting) + 0.5))
+                score += idf * frequency * (_BM25_K1 + 1) / (
+                    frequency + _BM25_K1 * (1 - _BM25_B + _BM25_B * length_ratio)
+                )
+            scores[date_value] = max(score, scores.get(date_value, 0.0))
+
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+def build_inverted_index(entries: Iterable[dict[str, Any]]) -> InvertedIndex:
+    index = InvertedIndex()
+    for entry in entries:
+        index.add_entry(entry)
+    return index
+
+
+def _format_header(size: int, mtime_ns: int) -> bytes:
+    return f"{size:0{_HEADER_WIDTH}d} {mtime_ns:0{_HEADER_WIDTH}d}\n".encode("ascii")
+
+
+def _format_add_line(date_value: str, frequencies: dict[str, int]) -> str:
+    terms = " ".join(f"{token}:{frequency}" for token, frequency in frequencies.items())
+    return f"+{date_value} {sum(frequencies.values())} {terms}\n"
+
+
+class SearchIndex:
+    """
+    Persistent inverted index of one JSONL log, revalidated against the log on every use.
+    """
+
+    def __init__(self, log_path: Path) -> None:
+        self.log_path = log_path
+        self.index_path = log_path.with_name(log_path.name + ".search")
+        self._lock = threading.RLock()
+        self._index = InvertedIndex()
+        self._signature: tuple[int, int] | None = None
+        # True while the sidecar on disk matches the in-memory index, so updates may extend it.
+        self._sidecar_synced = False
+
+    def _ensure_fresh(self) -> InvertedIndex:
+        signature = get_log_signature(self.log_path)
+
+        if signature is None:
+            self._index, self._signature = InvertedIndex(), None
+            return self._index
+
+        if signature != self._signature and not self._load_sidecar(signature):
+            self.rebuild()
+
+        return self._index
+
+    def _load_sidecar(self, signature: tuple[int, int]) -> bool:
+        try:
+            with open(file=self.index_path, mode="r", encoding="utf-8") as index_file:
+                if index_file.readline().encode("ascii") != _format_header(*signature):
+                    return False
+
+                index = InvertedIndex()
+                for line in index_file:
+                    if line.startswith("-"):
+                        index.remove_document(line[1:].strip())
+                        continue
+
+                    date_value, _, *terms = line[1:].split()
+                    frequencies = {}
+                    for term in terms:
+                        token, _, frequency = term.rpartition(":")
+                        frequencies[token] = int(frequency)
+                    index.add_document(date_value, frequencies)
+
+        except (OSError, ValueError, UnicodeError):
+            return False
+
+        self._index, self._signature = index, signature
+        self._sidecar_synced = True
+        return True
+
+    def _write_sidecar(self) -> None:
+        """Write a compacted sidecar (adds only) for the current index and signature."""
+        self._sidecar_synced = False
+        if self._signature is None:
+            return
+
+        postings_by_date: dict[str, dict[str, int]] = {date_value: {} for date_value in self._index.document_lengths}
+        for token, posting in self._index.postings.items():
+            for date_value, frequency in posting.items():
+                postings_by_date[date_value][token] = frequency
+
+        temp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(file=temp_path, mode="w", encoding="utf-8") as index_file:
+                index_file.write(_format_header(*self._signature).decode("ascii"))
+                index_file.writelines(
+                    _format_add_line(date_value, frequencies) for date_value, frequencies in postings_by_date.items()
+                )
+            temp_path.replace(self.index_path)
+        except OSError:
+            # The index is only an accelerator; it will be rebuilt next session.
+            return
+
+        self._sidecar_synced = True
+
+    def _extend_sidecar(self, lines: list[str], signature: tuple[int, int]) -> bool:
+        """Append update lines to the sidecar and re-sign its header; return whether it worked."""
+        try:
+            with open(file=self.index_path, mode="r+b") as index_file:
+                index_file.seek(0, os.SEEK_END)
+                index_file.write("".join(lines).encode("utf-8"))
+                index_file.seek(0)
+                index_file.write(_format_header(*signature))
+        except OSError:
+            return False
+
+        return True
+
+    def _sidecar_header_matches(self, signature: tuple[int, int]) -> bool:
+        try:
+            with open(file=self.index_path, mode="rb") as index_file:
+                return index_file.readline() == _format_header(*signature)
+        except OSError:
+            return False
+
+    def _apply_update(
+        self,
+        previous_signature: tuple[int, int] | None,
+        lines: list[str],
+        update_memory: Callable[[], None],
+    ) -> None:
+        """
+        Record a change the caller just made to the log.
+
+        ``previous_signature`` is the log's signature from before that change.
+        When the index (in memory, or only on disk if it was not loaded this
+        session) matched it, the change is applied incrementally; otherwise
+        the index is left stale and the next search rebuilds it.
+        """
+        with self._lock:
+            signature = get_log_signature(self.log_path)
+
+            if previous_signature is None and signature is not None:
+                # The change created the log, so it starts from an empty index.
+                self._index, self._signature = InvertedIndex(), None
+                update_memory()
+                self._signature = signature
+                self._write_sidecar()
+                return
+
+            if self._signature is None:
+                # Not loaded this session: extend the sidecar on disk without reading it.
+                if signature and previous_signature and self._sidecar_header_matches(previous_signature):
+                    self._extend_sidecar(lines, signature)
+                return
+
+            if self._signature != previous_signature or signature is None:
+                self._signature = None
+                return
+
+            update_memory()
+            self._signature = signature
+            if not (self._sidecar_synced and self._extend_sidecar(lines, signature)):
+                self._write_sidecar()
+
+    def rebuild(self) -> None:
+        """Rebuild the index by decoding every line of the log."""
+        with self._lock:
+            index = InvertedIndex()
+
+            try:
+                with open(file=self.log_path, mode="r", encoding="utf-8") as log_file:
+                    for line in log_file:
+                        if line.strip():
+                            entry = json_codec.loads(line)
+                            if entry.get("date") not in index.document_lengths:
+                                index.add_entry(entry)
+            except OSError:
+                self._index, self._signature = InvertedIndex(), None
+                return
+
+            self._index = index
+            self._signature = get_log_signature(self.log_path)
+            self._write_sidecar()
+
+    def search(self, query: str) -> list[tuple[str, float]]:
+        """Return ``(date, score)`` pairs matching the query, best match first."""
+        with self._lock:
+            return self._ensure_fresh().search(query)
+
+    def record_appended(self, entries: list[dict[str, Any]], previous_signature: tuple[int, int] | None) -> None:
+        """Index entries the caller just appended to the log."""
+        frequencies_by_date = [(entry["date"], dict(_entry_term_frequencies(entry))) for entry in entries]
+
+        def update_memory() -> None:
+            for date_value, frequencies in frequencies_by_date:
+                self._index.add_document(date_value, frequencies)
+
+        lines = [_format_add_line(date_value, frequencies) for date_value, frequencies in frequencies_by_date]
+        self._apply_update(previous_signature, lines, update_memory)
+
+    def record_removed(self, date_value: str, previous_signature: tuple[int, int] | None) -> None:
+        """Drop a date the caller just cut out of the log."""
+        self._apply_update(previous_signature, [f"-{date_value}\n"], lambda: self._index.remove_document(date_value))
+
+    def carry_over(self, previous_signature: tuple[int, int] | None) -> None:
+        """Re-sign the index after a rewrite that kept every title and explanation."""
+        self._apply_update(previous_signature, [], lambda: None)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._signature = None
+
+
+def search_many(search_indexes: Iterable[SearchIndex], query: str) -> list[tuple[str, float]]:
+    """Search several logs holding different dates (e.g. year shards) as if they were one log."""
+    with ExitStack() as stack:
+        indexes = []
+        for search_index in search_indexes:
+            stack.enter_context(search_index._lock)
+            indexes.append(search_index._ensure_fresh())
+
+        return search_inverted_indexes(indexes, query)
+
+
+_indexes: dict[Path, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(log_path: Path) -> SearchIndex:
+    """Return the shared search index for a JSONL log, creating it on first use."""
+    with _indexes_lock:
+        index = _indexes.get(log_path)
+        if index is None:
+            index = SearchIndex(log_path)
+            _indexes[log_path] = index
+
+    return index
@@ -0,0 +1,664 @@
+"""
+sharded_storage.py
+
+Year-sharded JSONL persistence layer for APOD snapshots (``STORAGE_BACKEND=sharded``).
+Entries live in ``data/logs/<year>.jsonl``, one shard per APOD year, and
+``data/logs/manifest.json`` lists the shards. Every shard is an ordinary JSONL
+log with its own date index, summary, search index, and update journal. A lookup, update,
+or delete by date therefore touches one shard, and date-range reads only open
+the shards of those years. ``output.jsonl`` and ``output.csv`` are generated
+from the shards on demand with the export functions.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from rich.text import Text
+
+from src.config import (
+    DATA_DIR,
+    SEARCH_RESULT_LIMIT,
+    json_file_name,
+    json_file_path,
+    sharded_logs_dir,
+    sharded_manifest_name,
+    sharded_manifest_path,
+)
+from src.startup.console import console
+from src.storage.apod_record import ApodRecord
+from src.storage.jsonl_index import JsonlIndex, get_jsonl_index
+from src.storage.log_query import (
+    ORDER_DATE,
+    ORDER_DATE_DESC,
+    ORDER_LOGGED,
+    ORDER_LOGGED_DESC,
+    RecordPredicate,
+    check_order,
+    iter_jsonl_records,
+)
+from src.storage.log_export import export_records_to_csv, export_records_to_jsonl, show_export_results
+from src.storage.log_signature import get_log_signature
+from src.storage.search_index import SearchIndex, get_search_index, search_many
+from src.storage.update_journal import UpdateJournal, get_update_journal
+from src.utils import json_codec
+from src.utils.json_utils import (
+    ask_entries_amount,
+    check_if_json_output_exists,
+    format_raw_jsonl_entry,
+    show_search_results,
+    show_log_records,
+)
+
+_MANIFEST_VERSION = 1
+# Entries buffered (across all years) while migrating, before they are appended to their shards.
+_MIGRATION_BATCH_SIZE = 1000
+
+_manifest_lock = threading.RLock()
+_manifest_years: list[str] | None = None
+# Whether output.jsonl has been fully migrated into the shards (the manifest's "migrated" flag).
+_manifest_migrated = False
+
+
+def _year_of(date_value: Any) -> str:
+    return str(date_value)[:4]
+
+
+def _shard_path(year: str) -> Path:
+    return sharded_logs_dir / f"{year}.jsonl"
+
+
+def _shard_name(year: str) -> str:
+    return f"logs/{year}.jsonl"
+
+
+def _shard_index(year: str) -> JsonlIndex:
+    return get_jsonl_index(_shard_path(year))
+
+
+def _shard_journal(year: str) -> UpdateJournal:
+    return get_update_journal(_shard_path(year))
+
+
+def _shard_search_index(year: str) -> SearchIndex:
+    return get_search_index(_shard_path(year))
+
+
+def _encode_line(entry: dict[str, Any]) -> bytes:
+    return json_codec.dumps_line(entry)
+
+
+def _group_by_year(entries: Iterable[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    entries_by_year: dict[str, list[dict[str, Any]]] = {}
+    for entry in entries:
+        entries_by_year.setdefault(_year_of(entry['date']), []).append(entry)
+    return entries_by_year
+
+
+def _read_manifest() -> list[str]:
+    """Return the shard years in ascending order (the manifest is read once per session)."""
+    global _manifest_years, _manifest_migrated
+
+    with _manifest_lock:
+        if _manifest_years is None:
+            try:
+                with open(file=sharded_manifest_path, mode="r", encoding="utf-8") as manifest_file:
+                    content = json.load(manifest_file)
+                _manifest_years = sorted(content["years"])
+                _manifest_migrated = content.get("migrated") is True
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                # Missing or damaged manifest: the shard files themselves are authoritative,
+                # and the (idempotent) migration runs again.
+                _manifest_years = sorted(path.stem for path in sharded_logs_dir.glob("[0-9][0-9][0-9][0-9].jsonl"))
+                _manifest_migrated = False
+
+        return list(_manifest_years)
+
+
+def _write_manifest(years: Iterable[str], migrated: bool | None = None) -> None:
+    """Write the manifest; ``migrated`` keeps the current migration flag when None."""
+    global _manifest_years, _manifest_migrated
+
+    with _manifest_lock:
+        if migrated is None:
+            _read_manifest()
+            migrated = _manifest_migrated
+
+        sorted_years = sorted(set(years))
+        sharded_logs_dir.mkdir(parents=True, exist_ok=True)
+        temp_path = sharded_manifest_path.with_name(sharded_manifest_path.name + ".tmp")
+        with open(file=temp_path, mode="w", encoding="utf-8") as manifest_file:
+            json.dump({"version": _MANIFEST_VERSION, "years": sorted_years, "migrated": migrated}, manifest_file)
+        temp_path.replace(sharded_manifest_path)
+        _manifest_years = sorted_years
+        _manifest_migrated = migrated
+
+
+def _register_years(years: Iterable[str]) -> None:
+    """Add shard years to the manifest (before their shards are first written)."""
+    with _manifest_lock:
+        known_years = _read_manifest()
+        new_years = set(years) - set(known_years)
+        if new_years:
+            _write_manifest([*known_years, *new_years])
+
+
+def _print_sharded_error(error: Exception, file_name: str = sharded_manifest_name) -> None:
+    if isinstance(error, PermissionError):
+        msg = Text("\nPermission error: ", style="err")
+        msg.append("Unable to read/write ", style="body.text")
+        msg.append(f"'{file_name}'", style="app.primary")
+        msg.append(" at ", style="body.text")
+        msg.append(f"'{sharded_logs_dir}' ", style="app.primary")
+        msg.append("X", style="err")
+        console.print(msg)
+        return
+
+    if isinstance(error, json_codec.JSONDecodeError):
+        msg = Text("\nJSONL parse error: ", style="err")
+        msg.append("Could not decode JSON from file ", style="body.text")
+        msg.append(f"'{file_name}'", style="app.primary")
+        msg.append(". Check the file format.", style="body.text")
+        console.print(msg)
+        return
+
+    console.print()
+    console.print(Text(str(error), style="err"))
+
+
+def check_if_sharded_log_exists() -> bool:
+    return sharded_manifest_path.exists() and sharded_manifest_path.is_file()
+
+
+def is_sharded_migration_complete() -> bool:
+    """True once the manifest records that ``output.jsonl`` was fully migrated into the shards."""
+    with _manifest_lock:
+        if not check_if_sharded_log_exists():
+            return False
+
+        _read_manifest()
+        return _manifest_migrated
+
+
+def migrate_jsonl_to_shards(source_path: Path = json_file_path) -> int:
+    """
+       Stream a single-file JSONL log into the year shards.
+
+       Lines are read one at a time (with their pending update journal patches)
+       and appended to their shards in batches of ``_MIGRATION_BATCH_SIZE``
+       entries, so memory stays bounded by the batch size. If a line fails, the
+       entries read before it are still written. Dates that are already sharded
+       are skipped, so a failed or interrupted migration can simply be run again.
+
+       Returns:
+           int: Number of entries migrated.
+    """
+    source_journal = get_update_journal(source_path)
+    pending: list[dict[str, Any]] = []
+    seen_dates: set[str] = set()
+    migrated = 0
+
+    def flush() -> None:
+        nonlocal migrated
+        entries_by_year = _group_by_year(pending)
+        pending.clear()
+        _register_years(entries_by_year)
+
+        for year, entries in entries_by_year.items():
+            shard_index = _shard_index(year)
+            logged_dates = shard_index.dates()
+            new_entries = [entry for entry in entries if entry['date'] not in logged_dates]
+            if new_entries:
+                previous_signature = get_log_signature(_shard_path(year))
+                shard_index.append_lines([(entry['date'], _encode_line(entry)) for entry in new_entries], sync=True)
+                _shard_search_index(year).record_appended(new_entries, previous_signature)
+                migrated += len(new_entries)
+
+    try:
+        with open(file=source_path, mode="r", encoding="utf-8") as source_file:
+            for line in source_file:
+                if not line.strip():
+                    continue
+
+                entry = source_journal.apply(json_codec.loads(line))
+                date_value = entry.get('date')
+                if not date_value or date_value in seen_dates:
+                    continue
+
+                seen_dates.add(date_value)
+                pending.append(entry)
+                if len(pending) >= _MIGRATION_BATCH_SIZE:
+                    flush()
+    finally:
+        if pending:
+            flush()
+
+    return migrated
+
+
+def create_sharded_log() -> Any:
+    """
+       Create the shard directory and manifest and migrate the existing JSONL log into it.
+       The manifest is only marked as migrated once the migration succeeded, so
+       startup keeps retrying a failed or interrupted one.
+
+       Returns:
+        None:
+    """
+    if is_sharded_migration_complete():
+        return
+
+    try:
+        if not check_if_sharded_log_exists():
+            _write_manifest(_read_manifest(), migrated=False)
+
+            msg = Text("Created sharded log: ", style="ok")
+            msg.append(f"'{sharded_manifest_name}' ", style="app.primary")
+            msg.append("✓", style="ok")
+            console.print(msg)
+
+        if check_if_json_output_exists():
+            migrated_count = migrate_jsonl_to_shards()
+
+            if migrated_count:
+                msg = Text("Imported: ", style="app.secondary")
+                msg.append(str(migrated_count), style="app.primary")
+                msg.append(" APODs from ", style="body.text")
+                msg.append(f"{json_file_name} ", style="app.primary")
+                msg.append("✓", style="ok")
+                console.print(msg)
+
+        _write_manifest(_read_manifest(), migrated=True)
+
+    except Exception as e:
+        _print_sharded_error(e, json_file_name if isinstance(e, json_codec.JSONDecodeError) else sharded_manifest_name)
+
+
+def log_data_to_sharded(formatted_apod_data: Any, show_individual_success_message: bool = True) -> Any:
+    """
+       Append a formatted APOD snapshot to the shard of its year.
+
+       Returns:
+        None, or "Duplicate found." when the date is already logged.
+    """
+    year = _year_of(formatted_apod_data['date'])
+
+    try:
+        shard_index = _shard_index(year)
+        if shard_index.contains(formatted_apod_data['date']):
+            msg = Text("Skipped logging: ", style="app.secondary")
+            msg.append(f"apod-{formatted_apod_data['date']}", style="app.primary")
+            msg.append(" already exists in ", style="body.text")
+            msg.append(_shard_name(year), style="app.primary")
+            msg.append(".", style="body.text")
+            console.print(msg)
+            return "Duplicate found."
+
+        _register_years([year])
+        previous_signature = get_log_signature(_shard_path(year))
+        shard_index.append_line(formatted_apod_data['date'], _encode_line(formatted_apod_data))
+        _shard_search_index(year).record_appended([formatted_apod_data], previous_signature)
+
+        if show_individual_success_message:
+            msg = Text("Saved: ", style="app.secondary")
+            msg.append("APOD ", style="body.text")
+            msg.append(f"'{formatted_apod_data['date']}'", style="app.primary")
+            msg.append(" -> ", style="body.text")
+            msg.append(f"{_shard_name(year)} ", style="app.primary")
+            msg.append("✓", style="ok")
+            console.print(msg)
+
+    except Exception as e:
+        _print_sharded_error(e, _shard_name(year))
+
+    return None
+
+
+def log_multiple_sharded_entries(list_formatted_apod_data: Any, show_individual_success_messages: bool = True) -> int:
+    """
+       Append multiple APOD entries with one write (and one fsync) per touched year shard.
+
+       Returns:
+           int: Number of entries written.
+    """
+    seen_dates = set()
+    unique_entries = []
+    skipped_count = 0
+
+    for entry in list_formatted_apod_data:
+        if entry['date'] in seen_dates:
+            skipped_count += 1
+            continue
+
+        seen_dates.add(entry['date'])
+        unique_entries.append(entry)
+
+    saved_count = 0
+    year = ""
+
+    try:
+        entries_by_year = _group_by_year(unique_entries)
+        _register_years(entries_by_year)
+
+        for year, entries in sorted(entries_by_year.items()):
+            shard_index = _shard_index(year)
+            logged_dates = shard_index.dates()
+            new_entries = [entry for entry in entries if entry['date'] not in logged_dates]
+            skipped_count += len(entries) - len(new_entries)
+
+            if not new_entries:
+                continue
+
+            previous_signature = get_log_signature(_shard_path(year))
+            shard_index.append_lines([(entry['date'], _encode_line(entry)) for entry in new_entries], sync=True)
+            _shard_search_index(year).record_appended(new_entries, previous_signature)
+            saved_count += len(new_entries)
+
+    except Exception as e:
+        _print_sharded_error(e, _shard_name(year) if year else sharded_manifest_name)
+
+    if show_individual_success_messages and saved_count:
+        msg = Text("Saved: ", style="app.secondary")
+        msg.append(str(saved_count), style="app.primary")
+        msg.append(" APODs -> ", style="body.text")
+        msg.append("logs/ ", style="app.primary")
+        msg.append("✓", style="ok")
+        console.print(msg)
+
+    if skipped_count:
+        msg = Text("Skipped logging: ", style="app.secondary")
+        msg.append(str(skipped_count), style="app.primary")
+        msg.append(" duplicate APODs not added to ", style="body.text")
+        msg.append("logs/", style="app.primary")
+        msg.append(".", style="body.text")
+        console.print(msg)
+
+    return saved_count
+
+
+def update_local_file_path_in_shards(target_date: str, local_file_path: str) -> bool:
+    """Record a local file path for the matching APOD entry in its shard's update journal."""
+    return update_local_file_paths_in_shards({target_date: local_file_path}) > 0
+
+
+def update_local_file_paths_in_shards(local_file_paths: dict[str, str]) -> int:
+    """Record several ``{date: local_file_path}`` values in the update journals of their shards.
+
+    A shard is only rewritten when its own journal passes the compaction
+    threshold, so at most one year of data is rewritten at a time.
+
+    Returns:
+        int: Number of entries that were updated.
+    """
+    updated = 0
+    paths_by_year: dict[str, dict[str, str]] = {}
+    for date_value, local_file_path in local_file_paths.items():
+        paths_by_year.setdefault(_year_of(date_value), {})[date_value] = local_file_path
+
+    for year, year_paths in sorted(paths_by_year.items()):
+        try:
+            shard_index = _shard_index(year)
+            updates = {
+                date_value: {'local_file_path': local_file_path}
+                for date_value, local_file_path in year_paths.items()
+                if shard_index.contains(date_value)
+            }
+
+            if not updates:
+                continue
+
+            shard_journal = _shard_journal(year)
+            shard_journal.record(updates)
+            if shard_journal.needs_compaction():
+                compact_shard_update_journal(year)
+
+            updated += len(updates)
+
+        except Exception as e:
+            _print_sharded_error(e, _shard_name(year))
+
+    return updated
+
+
+def compact_shard_update_journal(year: str) -> int:
+    """Fold a shard's pending update journal patches into that shard with one streaming rewrite.
+
+    Returns:
+        int: Number of entries that were patched.
+    """
+    shard_path = _shard_path(year)
+    shard_journal = _shard_journal(year)
+    patches = shard_journal.patches()
+
+    if not patches or not shard_path.exists():
+        shard_journal.clear()
+        return 0
+
+    updated = 0
+    previous_signature = get_log_signature(shard_path)
+    temp_path = shard_path.with_name(shard_path.name + ".tmp")
+
+    with open(file=shard_path, mode="r", encoding="utf-8") as shard_file, \
+            open(file=temp_path, mode="w", encoding="utf-8") as temp_file:
+        for line in shard_file:
+            if not line.strip():
+                continue
+
+            content = json_codec.loads(line)
+            if content.get('date') in patches:
+                content.update(patches[content['date']])
+                updated += 1
+
+            temp_file.write(json_codec.dumps(content) + "\n")
+    temp_path.replace(shard_path)
+
+    shard_journal.clear()
+    _shard_index(year).invalidate()
+    # Only local_file_path changed, so the search postings still hold.
+    _shard_search_index(year).carry_over(previous_signature)
+    return updated
+
+
+def delete_one_sharded_entry(target_date: Any) -> bool:
+    """
+       Delete a single entry by its APOD date, rewriting only the shard of its year.
+
+       Returns:
+        Boolean:
+    """
+    viewer_path = DATA_DIR / "viewer" / f"apod-{target_date}.html"
+    year = _year_of(target_date)
+
+    if year not in _read_manifest():
+        return False
+
+    try:
+        previous_signature = get_log_signature(_shard_path(year))
+        if not _shard_index(year).remove_entry(str(target_date)):
+            return False
+
+        _shard_search_index(year).record_removed(str(target_date), previous_signature)
+        _shard_journal(year).discard(str(target_date))
+
+        if viewer_path.exists() and viewer_path.is_file():
+            viewer_path.unlink()
+
+        return True
+
+    except Exception as e:
+        _print_sharded_error(e, _shard_name(year))
+
+    return False
+
+
+def clear_sharded_logs() -> bool:
+    """Delete every shard (with its sidecars) and the generated viewer pages."""
+    try:
+        for year in _read_manifest():
+            _shard_journal(year).clear()
+            for shard_file in sharded_logs_dir.glob(f"{year}.jsonl*"):
+                shard_file.unlink()
+            _shard_index(year).invalidate()
+            _shard_search_index(year).invalidate()
+
+        # A cleared log must not re-import output.jsonl on the next start.
+        _write_manifest([], migrated=True)
+
+        viewer_dir = DATA_DIR / "viewer"
+        if viewer_dir.exists() and viewer_dir.is_dir():
+            for html_file in viewer_dir.glob("*.html"):
+                html_file.unlink()
+        return True
+
+    except Exception as e:
+        _print_sharded_error(e)
+
+    return False
+
+
+def get_sharded_line_count() -> int:
+    """Return the number of logged entries (from each shard's summary sidecar)."""
+    try:
+        return sum(_shard_index(year).summary().count for year in _read_manifest())
+
+    except Exception as e:
+        _print_sharded_error(e)
+
+    return 0
+
+
+def get_logged_sharded_dates() -> set[str]:
+    """Return every logged APOD date (read from the shard date indexes)."""
+    logged_dates: set[str] = set()
+    for year in _read_manifest():
+        logged_dates.update(_shard_index(year).dates())
+    return logged_dates
+
+
+def iter_sharded_records(
+    date_from: str | None = None,
+    date_to: str | None = None,
+    predicate: RecordPredicate | None = None,
+    order: str = ORDER_LOGGED,
+) -> Iterator[ApodRecord]:
+    """
+    Yield records lazily, shard by shard (arguments as in log_query.py).
+
+    The logging orders go year by year, in logging order within each year.
+    Shards of years outside ``date_from``/``date_to`` are never opened.
+    """
+    check_order(order)
+    descending = order in (ORDER_LOGGED_DESC, ORDER_DATE_DESC)
+    years = _read_manifest()
+
+    for year in reversed(years) if descending else years:
+        if (date_from and year < date_from[:4]) or (date_to and year > date_to[:4]):
+            continue
+
+        yield from iter_jsonl_records(_shard_path(year), date_from, date_to, predicate, order)
+
+
+def show_first_n_sharded_log_entries() -> Any:
+    """Display the first N logged entries (oldest year first)."""
+    entries_amount = ask_entries_amount()
+    if entries_amount is None:
+        return
+
+    try:
+        records = list(islice(iter_sharded_records(), entries_amount))
+    except Exception as e:
+        _print_sharded_error(e)
+        return
+
+    show_log_records(records, entries_amount)
+
+
+def show_last_n_sharded_log_entries() -> Any:
+    """Display the last N logged entries, reading backwards from the newest year's shard."""
+    entries_amount = ask_entries_amount()
+    if entries_amount is None:
+        return
+
+    try:
+        records = list(islice(iter_sharded_records(order=ORDER_LOGGED_DESC), entries_amount))
+    except Exception as e:
+        _print_sharded_error(e)
+        return
+
+    show_log_records(records[::-1], entries_amount)
+
+
+def show_all_sharded_entries() -> Any:
+    """Display all logged entries."""
+    console.print()
+    count = 0
+
+    try:
+        for record in iter_sharded_records():
+            format_raw_jsonl_entry(record.to_dict(), count)
+            count += 1
+    except Exception as e:
+        _print_sharded_error(e)
+
+    if count == 0:
+        console.print(Text("No entries found.\n", style="body.text"))
+        return
+
+    console.print()
+
+
+def _fetch_one_by_date(order: str) -> Any:
+    """Show the first entry in a date order; each shard's summary sidecar locates it in one seek."""
+    try:
+        record = next(iter_sharded_records(order=order), None)
+    except Exception as e:
+        _print_sharded_error(e)
+        return
+
+    if record is None:
+        console.print(Text("\nNo entries found.\n", style="body.text"))
+        return
+
+    console.print()
+    format_raw_jsonl_entry(record.to_dict(), 0)
+    console.print()
+
+
+def fetch_most_recent_sharded_apod() -> Any:
+    """Fetch the most recent APOD (by date) from the newest year's shard."""
+    _fetch_one_by_date(ORDER_DATE_DESC)
+
+
+def fetch_oldest_sharded_apod() -> Any:
+    """Fetch the oldest APOD (by date) from the oldest year's shard."""
+    _fetch_one_by_date(ORDER_DATE)
+
+
+def _read_sharded_entry(date_value: str) -> dict[str, Any] | None:
+    entry = _shard_index(_year_of(date_value)).read_entry(date_value)
+    return ApodRecord.from_dict(entry).to_dict() if entry is not None else None
+
+
+def search_sharded_entries(query: str, limit: int = SEARCH_RESULT_LIMIT) -> Any:
+    """Display the entries whose title or explanation match a query, best match first."""
+    try:
+        hits = search_many([_shard_search_index(year) for year in _read_manifest()], query)
+        show_search_results(query, hits, _read_sharded_entry, limit)
+
+    except Exception as e:
+        _print_sharded_error(e)
+
+
+def export_sharded_logs() -> Any:
+    """Regenerate both flat logs from the shards and report the result."""
+    try:
+        exported_json = export_records_to_jsonl(iter_sharded_records())
+        exported_csv = export_records_to_csv(iter_sharded_records())
+    except Exception as e:
+        _print_sharded_error(e)
+        return
+
+    show_export_results(exported_json, exported_csv)
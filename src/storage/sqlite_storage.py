@@ -0,0 +1,565 @@
+"""
+sqlite_storage.py
+
+SQLite persistence layer for APOD snapshots (``STORAGE_BACKEND=sqlite``).
+Offers the same operations as the JSONL/CSV layers, backed by one indexed
+table in WAL mode, so lookups by date stay indexed and updates are
+transactional at any log size. ``output.jsonl`` and ``output.csv`` are
+generated from the database on demand with the export functions.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from typing import Any, Iterable, Iterator
+
+from rich.text import Text
+
+from src.config import (
+    DATA_DIR,
+    SEARCH_RESULT_LIMIT,
+    json_file_name,
+    sqlite_db_name,
+    sqlite_db_path,
+)
+from src.startup.console import console
+from src.storage.apod_record import ApodRecord
+from src.storage.log_query import (
+    ORDER_DATE,
+    ORDER_DATE_DESC,
+    ORDER_LOGGED,
+    ORDER_LOGGED_DESC,
+    RecordPredicate,
+    check_order,
+)
+from src.storage.log_export import export_records_to_csv, export_records_to_jsonl, show_export_results
+from src.storage.search_index import InvertedIndex, build_inverted_index
+from src.utils.json_utils import (
+    check_if_json_output_exists,
+    format_raw_jsonl_entry,
+    get_json_log_repository,
+    show_search_results,
+    ask_entries_amount,
+    show_log_records,
+)
+
+_COLUMNS = ApodRecord.FIELDS
+_SELECT_COLUMNS = ", ".join(_COLUMNS)
+
+# Row ids keep logging order, so "first/last N" match the order of the flat logs.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS apods (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    date TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    explanation TEXT NOT NULL DEFAULT '',
+    logged_at TEXT NOT NULL DEFAULT '',
+    local_file_path TEXT NOT NULL DEFAULT 'Not saved yet'
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_apods_date ON apods (date);
+-- logged_at holds the month-first display stamp, which does not sort; the logging orders use id.
+DROP INDEX IF EXISTS idx_apods_logged_at;
+"""
+
+# Sort column and direction per order. Both columns are unique, so iteration can
+# resume each chunk after the last key it returned.
+_ORDER_KEYS = {
+    ORDER_LOGGED: ("id", "ASC"),
+    ORDER_LOGGED_DESC: ("id", "DESC"),
+    ORDER_DATE: ("date", "ASC"),
+    ORDER_DATE_DESC: ("date", "DESC"),
+}
+_ITER_CHUNK_SIZE = 500
+
+# ``PRAGMA user_version`` once output.jsonl has been fully imported into the database.
+_IMPORT_COMPLETE_VERSION = 1
+
+_connection: sqlite3.Connection | None = None
+_connection_lock = threading.RLock()
+
+# In-memory search index over the table. Our own inserts and deletes update it in
+# place; ``_search_index_version`` is the ``data_version`` it was built at, which
+# only changes when another connection commits to the database.
+_search_index: InvertedIndex | None = None
+_search_index_version: int | None = None
+
+
+def get_sqlite_connection() -> sqlite3.Connection:
+    """Return the shared connection, opening the database (WAL mode) and schema on first use."""
+    global _connection
+
+    with _connection_lock:
+        if _connection is None:
+            connection = sqlite3.connect(sqlite_db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            # WAL keeps the database consistent on power loss with NORMAL; only the last commits may roll back.
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SCHEMA)
+            _connection = connection
+
+        return _connection
+
+
+def close_sqlite_connection() -> None:
+    """Close the shared connection (it is reopened on next use)."""
+    global _connection, _search_index
+
+    with _connection_lock:
+        if _connection is not None:
+            _connection.close()
+            _connection = None
+            # data_version values are only comparable within one connection.
+            _search_index = None
+
+
+def check_if_sqlite_db_exists() -> bool:
+    return sqlite_db_path.exists() and sqlite_db_path.is_file()
+
+
+def is_sqlite_import_complete() -> bool:
+    """Return True once the database exists and the JSONL import into it has completed."""
+    if not check_if_sqlite_db_exists():
+        return False
+
+    try:
+        connection = get_sqlite_connection()
+        with _connection_lock:
+            return connection.execute("PRAGMA user_version").fetchone()[0] >= _IMPORT_COMPLETE_VERSION
+    except sqlite3.Error:
+        return False
+
+
+def _mark_import_complete(connection: sqlite3.Connection) -> None:
+    connection.execute(f"PRAGMA user_version = {_IMPORT_COMPLETE_VERSION}")
+
+
+def _insert_entries(entries: Iterable[dict[str, Any]]) -> int:
+    """Insert entries in one transaction, skipping logged dates; return how many were added."""
+    connection = get_sqlite_connection()
+    query = f"INSERT OR IGNORE INTO apods ({_SELECT_COLUMNS}) VALUES ({', '.join('?' for _ in _COLUMNS)})"
+
+    with _connection_lock:
+        inserted = []
+        with connection:
+            for entry in entries:
+                record = ApodRecord.from_dict(entry)
+                if connection.execute(query, record.to_row()).rowcount:
+                    inserted.append(record)
+
+        if _search_index is not None:
+            for record in inserted:
+                _search_index.add_entry(record.to_dict())
+
+        return len(inserted)
+
+
+def _select_records(query: str, parameters: tuple[Any, ...] = ()) -> list[ApodRecord]:
+    connection = get_sqlite_connection()
+    with _connection_lock:
+        return [ApodRecord.from_row(row) for row in connection.execute(query, parameters)]
+
+
+def iter_sqlite_entries(
+    date_from: str | None = None,
+    date_to: str | None = None,
+    predicate: RecordPredicate | None = None,
+    order: str = ORDER_LOGGED,
+) -> Iterator[ApodRecord]:
+    """
+    Yield records lazily without loading the whole table (arguments as in log_query.py).
+
+    The date range and date orders are served by the ``date`` index and the
+    logging orders by the row ids. Rows are read in chunks of
+    ``_ITER_CHUNK_SIZE``, each its own short query that continues after the
+    last key. The connection lock is only held while a chunk is read, so other
+    threads can log or update while the caller is still iterating.
+    """
+    check_order(order)
+    key_column, direction = _ORDER_KEYS[order]
+    comparison = "<" if direction == "DESC" else ">"
+    last_key = None
+    connection = get_sqlite_connection()
+
+    while True:
+        clauses, parameters = [], []
+        if date_from is not None:
+            clauses.append("date >= ?")
+            parameters.append(date_from)
+        if date_to is not None:
+            clauses.append("date <= ?")
+            parameters.append(date_to)
+        if last_key is not None:
+            clauses.append(f"{key_column} {comparison} ?")
+            parameters.append(last_key)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with _connection_lock:
+            rows = connection.execute(
+                f"SELECT {key_column}, {_SELECT_COLUMNS} FROM apods{where} "
+                f"ORDER BY {key_column} {direction} LIMIT {_ITER_CHUNK_SIZE}",
+                parameters,
+            ).fetchall()
+
+        for row in rows:
+            record = ApodRecord.from_row(row[1:])
+            if predicate is None or predicate(record):
+                yield record
+
+        if len(rows) < _ITER_CHUNK_SIZE:
+            return
+
+        last_key = rows[-1][0]
+
+
+def _print_sqlite_error(error: Exception) -> None:
+    if isinstance(error, PermissionError):
+        msg = Text("\nPermission error: ", style="err")
+        msg.append("Unable to read/write ", style="body.text")
+        msg.append(f"'{sqlite_db_name}'", style="app.primary")
+        msg.append(" at ", style="body.text")
+        msg.append(f"'{sqlite_db_path}' ", style="app.primary")
+        msg.append("X", style="err")
+        console.print(msg)
+        return
+
+    if isinstance(error, sqlite3.Error):
+        msg = Text("\nSQLite error: ", style="err")
+        msg.append(str(error), style="body.text")
+        msg.append(" in ", style="body.text")
+        msg.append(f"'{sqlite_db_name}'", style="app.primary")
+        console.print(msg)
+        return
+
+    console.print()
+    console.print(Text(str(error), style="err"))
+
+
+def create_sqlite_database() -> Any:
+    """
+       Create the SQLite database and import the existing JSONL log into it.
+       The database is only marked as imported once the import succeeded, so
+       startup keeps retrying a failed or interrupted one.
+
+       Returns:
+        None:
+    """
+    if is_sqlite_import_complete():
+        return
+
+    try:
+        created = not check_if_sqlite_db_exists()
+        connection = get_sqlite_connection()
+
+        if created:
+            msg = Text("Created database: ", style="ok")
+            msg.append(f"'{sqlite_db_name}' ", style="app.primary")
+            msg.append("✓", style="ok")
+            console.print(msg)
+
+        if check_if_json_output_exists():
+            imported_count = _insert_entries(record.to_dict() for record in get_json_log_repository().records())
+
+            if imported_count:
+                msg = Text("Imported: ", style="app.secondary")
+                msg.append(str(imported_count), style="app.primary")
+                msg.append(" APODs from ", style="body.text")
+                msg.append(f"{json_file_name} ", style="app.primary")
+                msg.append("✓", style="ok")
+                console.print(msg)
+
+        with _connection_lock, connection:
+            _mark_import_complete(connection)
+
+    except Exception as e:
+        _print_sqlite_error(e)
+
+
+def log_data_to_sqlite(formatted_apod_data: Any, show_individual_success_message: bool = True) -> Any:
+    """
+       Insert a formatted APOD snapshot into the database.
+
+       Returns:
+        None, or "Duplicate found." when the date is already logged.
+    """
+    try:
+        if not _insert_entries([formatted_apod_data]):
+            msg = Text("Skipped logging: ", style="app.secondary")
+            msg.append(f"apod-{formatted_apod_data['date']}", style="app.primary")
+            msg.append(" already exists in ", style="body.text")
+            msg.append(str(sqlite_db_name), style="app.primary")
+            msg.append(".", style="body.text")
+            console.print(msg)
+            return "Duplicate found."
+
+        if show_individual_success_message:
+            msg = Text("Saved: ", style="app.secondary")
+            msg.append("APOD ", style="body.text")
+            msg.append(f"'{formatted_apod_data['date']}'", style="app.primary")
+            msg.append(" -> ", style="body.text")
+            msg.append(f"{sqlite_db_name} ", style="app.primary")
+            msg.append("✓", style="ok")
+            console.print(msg)
+
+    except Exception as e:
+        _print_sqlite_error(e)
+
+    return None
+
+
+def log_multiple_sqlite_entries(list_formatted_apod_data: Any, show_individual_success_messages: bool = True) -> int:
+    """
+       Insert multiple APOD entries in one transaction, skipping dates already logged.
+
+       Returns:
+           int: Number of entries written.
+    """
+    entries = list(list_formatted_apod_data)
+
+    try:
+        saved_count = _insert_entries(entries)
+    except Exception as e:
+        _print_sqlite_error(e)
+        return 0
+
+    skipped_count = len(entries) - saved_count
+
+    if show_individual_success_messages and saved_count:
+        msg = Text("Saved: ", style="app.secondary")
+        msg.append(str(saved_count), style="app.primary")
+        msg.append(" APODs -> ", style="body.text")
+        msg.append(f"{sqlite_db_name} ", style="app.primary")
+        msg.append("✓", style="ok")
+        console.print(msg)
+
+    if skipped_count:
+        msg = Text("Skipped logging: ", style="app.secondary")
+        msg.append(str(skipped_count), style="app.primary")
+        msg.append(" duplicate APODs not added to ", style="body.text")
+        msg.append(str(sqlite_db_name), style="app.primary")
+        msg.append(".", style="body.text")
+        console.print(msg)
+
+    return saved_count
+
+
+def update_local_file_path_in_sqlite(target_date: str, local_file_path: str) -> bool:
+    """Store a local file path for the matching APOD row."""
+    return update_local_file_paths_in_sqlite({target_date: local_file_path}) > 0
+
+
+def update_local_file_paths_in_sqlite(local_file_paths: dict[str, str]) -> int:
+    """Store several ``{date: local_file_path}`` values in one transaction.
+
+    Returns:
+        int: Number of rows that were updated.
+    """
+    if not local_file_paths:
+        return 0
+
+    try:
+        connection = get_sqlite_connection()
+        with _connection_lock, connection:
+            changes_before = connection.total_changes
+            connection.executemany(
+                "UPDATE apods SET local_file_path = ? WHERE date = ?",
+                ((local_file_path, date_value) for date_value, local_file_path in local_file_paths.items()),
+            )
+            return connection.total_changes - changes_before
+
+    except Exception as e:
+        _print_sqlite_error(e)
+
+    return 0
+
+
+def delete_one_sqlite_entry(target_date: Any) -> bool:
+    """
+       Delete a single entry by its APOD date.
+
+       Returns:
+        Boolean:
+    """
+    viewer_path = DATA_DIR / "viewer" / f"apod-{target_date}.html"
+
+    try:
+        connection = get_sqlite_connection()
+        with _connection_lock:
+            with connection:
+                deleted = connection.execute("DELETE FROM apods WHERE date = ?", (str(target_date),)).rowcount > 0
+            if deleted and _search_index is not None:
+                _search_index.remove_document(str(target_date))
+
+        if deleted and viewer_path.exists() and viewer_path.is_file():
+            viewer_path.unlink()
+
+        return deleted
+
+    except Exception as e:
+        _print_sqlite_error(e)
+
+    return False
+
+
+def clear_sqlite_database() -> bool:
+    """Delete every entry (and the generated viewer pages)."""
+    global _search_index
+
+    try:
+        connection = get_sqlite_connection()
+        with _connection_lock:
+            with connection:
+                connection.execute("DELETE FROM apods")
+                # A cleared database must not pull the stale JSONL log back in.
+                _mark_import_complete(connection)
+            _search_index = None
+
+        viewer_dir = DATA_DIR / "viewer"
+        if viewer_dir.exists() and viewer_dir.is_dir():
+            for html_file in viewer_dir.glob("*.html"):
+                html_file.unlink()
+        return True
+
+    except Exception as e:
+        _print_sqlite_error(e)
+
+    return False
+
+
+def get_sqlite_line_count() -> int:
+    """Return the number of logged entries."""
+    try:
+        connection = get_sqlite_connection()
+        with _connection_lock:
+            return connection.execute("SELECT COUNT(*) FROM apods").fetchone()[0]
+
+    except Exception as e:
+        _print_sqlite_error(e)
+
+    return 0
+
+
+def get_logged_sqlite_dates() -> set[str]:
+    """Return every logged APOD date (read from the date index)."""
+    connection = get_sqlite_connection()
+    with _connection_lock:
+        return {row[0] for row in connection.execute("SELECT date FROM apods")}
+
+
+def show_first_n_sqlite_log_entries() -> Any:
+    """Display the first N logged entries (in logging order)."""
+    entries_amount = ask_entries_amount()
+    if entries_amount is None:
+        return
+
+    try:
+        records = _select_records(f"SELECT {_SELECT_COLUMNS} FROM apods ORDER BY id LIMIT ?", (entries_amount,))
+    except Exception as e:
+        _print_sqlite_error(e)
+        return
+
+    show_log_records(records, entries_amount)
+
+
+def show_last_n_sqlite_log_entries() -> Any:
+    """Display the last N logged entries (in logging order)."""
+    entries_amount = ask_entries_amount()
+    if entries_amount is None:
+        return
+
+    try:
+        records = _select_records(f"SELECT {_SELECT_COLUMNS} FROM apods ORDER BY id DESC LIMIT ?", (entries_amount,))
+    except Exception as e:
+        _print_sqlite_error(e)
+        return
+
+    show_log_records(records[::-1], entries_amount)
+
+
+def show_all_sqlite_entries() -> Any:
+    """Display all logged entries."""
+    console.print()
+    count = 0
+
+    try:
+        for record in iter_sqlite_entries():
+            format_raw_jsonl_entry(record.to_dict(), count)
+            count += 1
+    except Exception as e:
+        _print_sqlite_error(e)
+
+    if count == 0:
+        console.print(Text("No entries found.\n", style="body.text"))
+        return
+
+    console.print()
+
+
+def _fetch_one_by_date(order: str) -> Any:
+    try:
+        records = _select_records(f"SELECT {_SELECT_COLUMNS} FROM apods ORDER BY date {order} LIMIT 1")
+    except Exception as e:
+        _print_sqlite_error(e)
+        return
+
+    if not records:
+        console.print(Text("\nNo entries found.\n", style="body.text"))
+        return
+
+    console.print()
+    format_raw_jsonl_entry(records[0].to_dict(), 0)
+    console.print()
+
+
+def fetch_most_recent_sqlite_apod() -> Any:
+    """Fetch the most recent APOD (by date), served from the date index."""
+    _fetch_one_by_date("DESC")
+
+
+def fetch_oldest_sqlite_apod() -> Any:
+    """Fetch the oldest APOD (by date), served from the date index."""
+    _fetch_one_by_date("ASC")
+
+
+def _get_sqlite_search_index() -> InvertedIndex:
+    """Return the search index of the table, rebuilding it only after another connection changed it."""
+    global _search_index, _search_index_version
+
+    connection = get_sqlite_connection()
+    with _connection_lock:
+        version = connection.execute("PRAGMA data_version").fetchone()[0]
+        if _search_index is None or version != _search_index_version:
+            rows = connection.execute("SELECT date, title, explanation FROM apods")
+            _search_index = build_inverted_index(
+                {"date": date_value, "title": title, "explanation": explanation}
+                for date_value, title, explanation in rows
+            )
+            _search_index_version = version
+
+        return _search_index
+
+
+def _read_sqlite_entry(date_value: str) -> dict[str, Any] | None:
+    records = _select_records(f"SELECT {_SELECT_COLUMNS} FROM apods WHERE date = ?", (date_value,))
+    return records[0].to_dict() if records else None
+
+
+def search_sqlite_entries(query: str, limit: int = SEARCH_RESULT_LIMIT) -> Any:
+    """Display the entries whose title or explanation match a query, best match first."""
+    try:
+        show_search_results(query, _get_sqlite_search_index().search(query), _read_sqlite_entry, limit)
+
+    except Exception as e:
+        _print_sqlite_error(e)
+
+
+def export_sqlite_logs() -> Any:
+    """Regenerate both flat logs from the database and report the result."""
+    try:
+        exported_json = export_records_to_jsonl(iter_sqlite_entries())
+        exported_csv = export_records_to_csv(iter_sqlite_entries())
+    except Exception as e:
+        _print_sqlite_error(e)
+        return
+
+    show_export_results(exported_json, exported_csv)
@@ -0,0 +1,156 @@
+"""
+update_journal.py
+
+Append-only journal of field updates for a log (JSONL or CSV).
+Changing a field of an already logged entry (for example ``local_file_path``
+after a download) appends one small patch record to ``<log>.journal`` instead
+of rewriting the whole log. Readers overlay the patches on the entries they
+load, and once the journal grows past ``UPDATE_JOURNAL_COMPACT_THRESHOLD``
+records the owning storage module folds it back into the log.
+
+Journal layout (one JSON object per line, later lines win):
+    {"date": "YYYY-MM-DD", "local_file_path": "..."}
+    {"date": "YYYY-MM-DD", "discard": true}
+A ``discard`` record drops every earlier patch for that date; it is written
+when the entry is deleted so a later re-log of the date starts clean.
+"""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+from src.config import UPDATE_JOURNAL_COMPACT_THRESHOLD
+from src.storage.log_signature import get_log_signature
+from src.utils import json_codec
+
+_DISCARD_KEY = "discard"
+
+
+class UpdateJournal:
+    """
+    In-memory view of one log's patch journal, reloaded when the journal file changes.
+    """
+
+    def __init__(self, log_path: Path) -> None:
+        self.log_path = log_path
+        self.journal_path = log_path.with_name(log_path.name + ".journal")
+        self._lock = threading.Lock()
+        self._patches: dict[str, dict[str, Any]] = {}
+        self._record_count = 0
+        self._signature: tuple[int, int] | None = None
+
+    def _ensure_fresh(self) -> None:
+        signature = get_log_signature(self.journal_path)
+        if signature == self._signature:
+            return
+
+        patches: dict[str, dict[str, Any]] = {}
+        record_count = 0
+
+        if signature is not None:
+            try:
+                with open(file=self.journal_path, mode="r", encoding="utf-8") as journal_file:
+                    for line in journal_file:
+                        try:
+                            record = json_codec.loads(line)
+                        except json_codec.JSONDecodeError:
+                            # A torn last line from an interrupted write; the patch was never acknowledged.
+                            continue
+
+                        record_count += 1
+                        _apply_record(patches, record)
+            except OSError:
+                patches, record_count, signature = {}, 0, None
+
+        self._patches, self._record_count, self._signature = patches, record_count, signature
+
+    def signature(self) -> tuple[int, int] | None:
+        """Return ``(size, mtime_ns)`` of the journal file, or None when it is empty/missing."""
+        with self._lock:
+            self._ensure_fresh()
+            return self._signature
+
+    def patches(self) -> dict[str, dict[str, Any]]:
+        """Return the merged ``{date: {field: value}}`` overlay (do not mutate it)."""
+        with self._lock:
+            self._ensure_fresh()
+            return self._patches
+
+    def apply(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Overlay the pending patches for ``entry['date']`` onto the entry in place and return it."""
+        patch = self.patches().get(entry.get("date"))
+        if patch:
+            entry.update(patch)
+        return entry
+
+    def needs_compaction(self) -> bool:
+        with self._lock:
+            self._ensure_fresh()
+            return self._record_count >= UPDATE_JOURNAL_COMPACT_THRESHOLD
+
+    def record(self, updates: dict[str, dict[str, Any]]) -> None:
+        """Append one patch record per ``{date: {field: value}}`` item with a single write."""
+        self._append([{"date": date_value, **fields} for date_value, fields in updates.items()])
+
+    def discard(self, date_value: str) -> None:
+        """Drop every pending patch for a date (call when its entry is deleted)."""
+        with self._lock:
+            self._ensure_fresh()
+            if date_value not in self._patches:
+                return
+
+        self._append([{"date": date_value, _DISCARD_KEY: True}])
+
+    def _append(self, records: list[dict[str, Any]]) -> None:
+        if not records:
+            return
+
+        with self._lock:
+            self._ensure_fresh()
+
+            with open(file=self.journal_path, mode="a", encoding="utf-8") as journal_file:
+                journal_file.write("".join(json_codec.dumps(record) + "\n" for record in records))
+
+            for record in records:
+                _apply_record(self._patches, record)
+            self._record_count += len(records)
+            self._signature = get_log_signature(self.journal_path)
+
+    def clear(self) -> None:
+        """Delete the journal (after its patches were folded into the log, or the log was cleared)."""
+        with self._lock:
+            try:
+                self.journal_path.unlink()
+            except FileNotFoundError:
+                pass
+
+            self._patches, self._record_count, self._signature = {}, 0, None
+
+
+def _apply_record(patches: dict[str, dict[str, Any]], record: dict[str, Any]) -> None:
+    date_value = record.get("date")
+    if not date_value:
+        return
+
+    if record.get(_DISCARD_KEY):
+        patches.pop(date_value, None)
+        return
+
+    fields = {key: value for key, value in record.items() if key != "date"}
+    patches.setdefault(date_value, {}).update(fields)
+
+
+_journals: dict[Path, UpdateJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_update_journal(log_path: Path) -> UpdateJournal:
+    """Return the shared update journal for a log file, creating it on first use."""
+    with _journals_lock:
+        journal = _journals.get(log_path)
+        if journal is None:
+            journal = UpdateJournal(log_path)
+            _journals[log_path] = journal
+
+    return journal
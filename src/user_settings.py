@@ -1,13 +1,13 @@
 """User settings persistence, prompts, and settings display helpers."""
 
 from typing import Any
-import json
 from pathlib import Path
 
 from rich.text import Text
 
 from src.config import user_settings_name, user_settings_path
 from src.startup.console import console
+from src.utils import json_codec
 from src.utils.box_utils import build_box_lines, stylize_line
 
 
@@ -38,10 +38,10 @@ def _normalize_and_persist_settings(settings_dict: dict) -> dict:
     }
 
     with open(file=user_settings_path, mode="w", encoding="utf-8") as file:
-        file.write(json.dumps({"automatically_redirect": normalized_settings["automatically_redirect"]}, ensure_ascii=False) + "\n")
-        file.write(json.dumps({"launch_count": normalized_settings["launch_count"]}, ensure_ascii=False) + "\n")
-        file.write(json.dumps({"automatically_set_wallpaper": normalized_settings["automatically_set_wallpaper"]}, ensure_ascii=False) + "\n")
-        file.write(json.dumps({"automatically_save_apod_files": normalized_settings["automatically_save_apod_files"]}, ensure_ascii=False) + "\n")
+        file.write(json_codec.dumps({"automatically_redirect": normalized_settings["automatically_redirect"]}) + "\n")
+        file.write(json_codec.dumps({"launch_count": normalized_settings["launch_count"]}) + "\n")
+        file.write(json_codec.dumps({"automatically_set_wallpaper": normalized_settings["automatically_set_wallpaper"]}) + "\n")
+        file.write(json_codec.dumps({"automatically_save_apod_files": normalized_settings["automatically_save_apod_files"]}) + "\n")
 
     return normalized_settings
 
@@ -59,10 +59,10 @@ def create_user_settings() -> Any:
 
     try:
         with open(file=user_settings_path, mode="w", encoding="utf-8") as file:
-            file.write(json.dumps(initial_automatically_redirect_dict, ensure_ascii=False) + "\n")
-            file.write(json.dumps(initial_launch_count_dict, ensure_ascii=False) + "\n")
-            file.write(json.dumps(initial_automatically_set_wallpaper_dict, ensure_ascii=False) + "\n")
-            file.write(json.dumps(initial_automatically_save_apod_files_dict, ensure_ascii=False) + "\n")
+            file.write(json_codec.dumps(initial_automatically_redirect_dict) + "\n")
+            file.write(json_codec.dumps(initial_launch_count_dict) + "\n")
+            file.write(json_codec.dumps(initial_automatically_set_wallpaper_dict) + "\n")
+            file.write(json_codec.dumps(initial_automatically_save_apod_files_dict) + "\n")
 
     except PermissionError:
         print(f"Permission error: Unable to write '{user_settings_name}' at '{user_settings_path}' X")
@@ -85,7 +85,7 @@ def get_all_user_settings() -> Any:
             for line in file:
                 if not line:
                     continue
-                content = json.loads(line)
+                content = json_codec.loads(line)
                 settings_dict.update(content)
 
         return _normalize_and_persist_settings(settings_dict)
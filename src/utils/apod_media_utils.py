@@ -5,9 +5,10 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+from email.utils import formatdate, parsedate_to_datetime
 from html import unescape
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from urllib.parse import unquote, urlparse
 
 
@@ -16,8 +17,13 @@ from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.text import Text
 
 from src.startup.console import console
+from src.storage.cache_storage import get_media_validators, store_media_validators
+from src.utils.http_utils import build_conditional_headers, extract_validators, http_get
 
 
+# Downloads stream into "<name>.part" and replace the saved file only once complete.
+PARTIAL_DOWNLOAD_SUFFIX = ".part"
+
 DIRECT_MEDIA_EXTENSIONS = {
     ".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tif", ".tiff", ".svg",
     ".mp4", ".mov", ".webm", ".mkv", ".avi", ".mp3", ".wav",
@@ -198,7 +204,7 @@ def _extract_video_url_from_page(page_url: str) -> str | None:
     _debug_video(f"Inspecting embed page for direct media URL: {page_url}")
 
     try:
-        page_response = requests.get(page_url, timeout=20)
+        page_response = http_get(page_url)
         page_response.raise_for_status()
     except requests.RequestException as error:
         _debug_video(f"Embed page request failed: {error}")
@@ -246,6 +252,15 @@ def _debug_video(message: str) -> None:
     # print(f"[DEBUG_VIDEO] {message}")
 
 
+def get_partial_download_path(file_path: Path) -> Path:
+    """Return the temp file a download streams into before it replaces ``file_path``."""
+    return file_path.with_name(file_path.name + PARTIAL_DOWNLOAD_SUFFIX)
+
+
+def _is_saved_date_file(file_path: Path) -> bool:
+    return file_path.is_file() and file_path.suffix != PARTIAL_DOWNLOAD_SUFFIX
+
+
 def build_download_path(date_value: str, extension: str) -> Path:
     """Build a non-conflicting destination path for a media file download.
 
@@ -277,7 +292,7 @@ def check_if_date_file_exists(date_value: str) -> bool:
     """
     download_dir = get_apod_download_dir()
     for existing_file in download_dir.glob(f"apod-{date_value}*"):
-        if existing_file.is_file():
+        if _is_saved_date_file(existing_file):
             return True
     return False
 
@@ -292,7 +307,7 @@ def get_existing_date_file_path(date_value: str) -> str | None:
     download_dir = get_apod_download_dir()
     matches = sorted(
         existing_file for existing_file in download_dir.glob(f"apod-{date_value}*")
-        if existing_file.is_file()
+        if _is_saved_date_file(existing_file)
     )
     if not matches:
         return None
@@ -312,24 +327,115 @@ def _get_existing_local_file_path(apod_data: dict[str, Any]) -> str:
     return existing_path
 
 
-def download_apod_file(apod_data: dict, *, show_progress: bool = True) -> str | None:
+def _build_media_revalidation_headers(media_url: str, date_value: str, existing_path: Path) -> dict[str, str]:
+    """Build conditional request headers for re-checking an already saved media file.
+
+    When validators were recorded for this exact URL and file, and the file on
+    disk still has the recorded size, they are sent as ``If-None-Match`` /
+    ``If-Modified-Since``. Files saved before validators were recorded fall
+    back to the file's modification time. A file whose size no longer matches
+    (e.g. an interrupted download) gets no conditional headers, so it is
+    downloaded again in full.
+    """
+    try:
+        file_stat = existing_path.stat()
+    except OSError:
+        return {}
+
+    record = get_media_validators(date_value)
+    if record is None or record.get("file_path") != str(existing_path):
+        return {"If-Modified-Since": formatdate(file_stat.st_mtime, usegmt=True)}
+
+    if record.get("url") != media_url or record.get("content_length") != str(file_stat.st_size):
+        return {}
+
+    return build_conditional_headers(record)
+
+
+def _is_media_unchanged(response: requests.Response, existing_path: Path) -> bool:
+    """Return True when a media response says the saved file is still current.
+
+    Besides a proper ``304 Not Modified``, a ``200`` from a server that ignores
+    conditional headers also counts when its ``Last-Modified`` is not newer
+    than the saved file and its ``Content-Length`` matches the file size. In
+    both cases the body is never read.
+    """
+    if response.status_code == 304:
+        return True
+
+    if response.status_code != 200:
+        return False
+
+    try:
+        last_modified = parsedate_to_datetime(response.headers.get("last-modified", "")).timestamp()
+        content_length = int(response.headers.get("content-length", ""))
+        file_stat = existing_path.stat()
+    except (TypeError, ValueError, OSError):
+        return False
+
+    return last_modified <= file_stat.st_mtime and content_length == file_stat.st_size
+
+
+def open_media_response(media_url: str, date_value: str, existing_path: Path | None) -> tuple[requests.Response, bool]:
+    """Send a streamed GET for a media file, revalidating ``existing_path`` when given.
+
+    Returns ``(response, unchanged)``. When ``unchanged`` is True the saved
+    file is still current; the response has already been closed and the
+    file's validators are refreshed. Otherwise the response is open and its
+    body still has to be read by the caller.
+    """
+    headers = _build_media_revalidation_headers(media_url, date_value, existing_path) if existing_path else {}
+    response = http_get(media_url, headers=headers or None, stream=True)
+
+    if existing_path is not None and _is_media_unchanged(response, existing_path):
+        response.close()
+        record_media_validators(date_value, media_url, existing_path, response)
+        return response, True
+
+    return response, False
+
+
+def record_media_validators(date_value: str, media_url: str, file_path: Path, response: requests.Response) -> None:
+    """Store a media response's validators next to the size of the file saved from it."""
+    validators = extract_validators(response)
+
+    if response.status_code == 304:
+        # A 304 may omit validators that did not change; keep the recorded ones.
+        record = get_media_validators(date_value) or {}
+        for key in ("etag", "last_modified"):
+            if key not in validators and record.get(key):
+                validators[key] = record[key]
+
+    try:
+        validators["content_length"] = str(file_path.stat().st_size)
+    except OSError:
+        return
+
+    store_media_validators(date_value, media_url, file_path, validators)
+
+
+def download_apod_file(
+    apod_data: dict,
+    *,
+    show_progress: bool = True,
+    on_chunk: Callable[[int], None] | None = None,
+) -> str | None:
     """Download APOD media to disk and return the saved file path when successful.
 
-    This function validates the APOD date, skips duplicate
-    date downloads, chooses a media URL, downloads the content in chunks, saves
-    the file in Downloads, and prints a clear success or failure message.
-    If anything important is missing or fails, it returns ``None``.
+    This function validates the APOD date, chooses a media URL, downloads the
+    content in chunks, saves the file in Downloads, and prints a clear success
+    or failure message. A file that was already saved for the date is
+    revalidated with a conditional request and only downloaded again when the
+    server reports a change. If anything important is missing, unchanged, or
+    fails, it returns ``None``. ``on_chunk`` is called with the size of every
+    chunk written, for callers that aggregate progress themselves.
     """
     date_value = str(apod_data.get("date", "")).strip()
     if not date_value:
         return None
 
-    if check_if_date_file_exists(date_value):
-        msg = Text("Skipped file download: ", style="app.secondary")
-        msg.append(f"apod-{date_value}", style="app.primary")
-        msg.append(" already exists in downloads.", style="body.text")
-        console.print(msg)
-        return None
+    existing_file = get_existing_date_file_path(date_value)
+    existing_path = Path(existing_file) if existing_file else None
 
     media_url = resolve_direct_media_url(apod_data)
     if media_url is None:
@@ -340,8 +446,16 @@ def download_apod_file(apod_data: dict, *, show_progress: bool = True) -> str |
 
     try:
         media_type = str(apod_data.get("media_type", "")).strip().lower()
+        requested_media_url = media_url
+
+        response, unchanged = open_media_response(media_url, date_value, existing_path)
+        if unchanged:
+            msg = Text("Skipped file download: ", style="app.secondary")
+            msg.append(f"apod-{date_value}", style="app.primary")
+            msg.append(" already exists in downloads.", style="body.text")
+            console.print(msg)
+            return None
 
-        response = requests.get(media_url, stream=True, timeout=20)
         response.raise_for_status()
 
         extension = infer_extension(response, media_url)
@@ -371,7 +485,7 @@ def download_apod_file(apod_data: dict, *, show_progress: bool = True) -> str |
                 response.close()
                 media_url = fallback_video_url
                 _debug_video(f"Retrying video download with fallback URL: {media_url[:220]}")
-                response = requests.get(media_url, stream=True, timeout=20)
+                response = http_get(media_url, stream=True)
                 response.raise_for_status()
                 extension = infer_extension(response, media_url)
                 _debug_video(
@@ -402,7 +516,10 @@ def download_apod_file(apod_data: dict, *, show_progress: bool = True) -> str |
                 _debug_video("Video stream detected with ambiguous extension; defaulting to .mp4")
                 extension = ".mp4"
 
-        file_path = build_download_path(date_value, extension)
+        if existing_path is not None:
+            file_path = existing_path.with_suffix(extension)
+        else:
+            file_path = build_download_path(date_value, extension)
 
         first_chunk = next(response.iter_content(chunk_size=8192), b"")
         if media_type == "video" and first_chunk:
@@ -445,6 +562,7 @@ def download_apod_file(apod_data: dict, *, show_progress: bool = True) -> str |
                     task_id,
                     progress_total,
                     show_estimated_progress,
+                    on_chunk,
                 )
         else:
             _write_apod_file_chunks(
@@ -455,11 +573,18 @@ def download_apod_file(apod_data: dict, *, show_progress: bool = True) -> str |
                 None,
                 progress_total,
                 show_estimated_progress,
+                on_chunk,
             )
 
         if media_type == "video" and not first_chunk:
             _debug_video("No data chunks were received while saving video file.")
 
+        if existing_path is not None and existing_path != file_path:
+            existing_path.unlink(missing_ok=True)
+
+        if media_url == requested_media_url:
+            record_media_validators(date_value, media_url, file_path, response)
+
         msg = Text("Saved file: ", style="app.secondary")
         msg.append(file_path.name, style="body.text")
         msg.append(" ✓", style="ok")
@@ -469,8 +594,12 @@ def download_apod_file(apod_data: dict, *, show_progress: bool = True) -> str |
 
     except requests.RequestException as e:
         msg = Text("Skipped file download: ", style="app.secondary")
-        msg.append(f"apod-{date_value} ", style="app.primary")
-        msg.append(" is hosted on YouTube, so automatic download is not available.", style="body.text")
+        if existing_path is not None:
+            msg.append(f"apod-{date_value}", style="app.primary")
+            msg.append(" already exists in downloads.", style="body.text")
+        else:
+            msg.append(f"apod-{date_value} ", style="app.primary")
+            msg.append(" is hosted on YouTube, so automatic download is not available.", style="body.text")
         console.print(msg)
 
     except OSError as e:
@@ -489,32 +618,49 @@ def _write_apod_file_chunks(
     task_id: int | None,
     progress_total: int,
     show_estimated_progress: bool,
+    on_chunk: Callable[[int], None] | None = None,
 ) -> None:
-    """Write APOD response chunks to disk and update progress when supplied."""
+    """Write APOD response chunks to disk and update progress when supplied.
+
+    Chunks stream into a ``.part`` temp file that replaces ``file_path`` only
+    once the download is complete, so a failed stream never truncates a file
+    that was already saved there.
+    """
     initial_bytes = len(first_chunk)
-    with open(file_path, "wb") as output_file:
-        if first_chunk:
-            output_file.write(first_chunk)
-            if progress is not None and task_id is not None:
-                if show_estimated_progress:
-                    progress.update(task_id, completed=min(92, max(1, int(initial_bytes / 8192))))
-                else:
-                    progress.update(task_id, completed=min(initial_bytes, progress_total))
-
-        written_bytes = initial_bytes
-        for chunk in response.iter_content(chunk_size=8192):
-            if not chunk:
-                continue
-
-            output_file.write(chunk)
-            written_bytes += len(chunk)
-
-            if progress is not None and task_id is not None:
-                if show_estimated_progress:
-                    estimated_progress = min(92, max(1, int(written_bytes / 8192)))
-                    progress.update(task_id, completed=estimated_progress)
-                else:
-                    progress.update(task_id, completed=min(written_bytes, progress_total))
+    partial_path = get_partial_download_path(file_path)
+    try:
+        with open(partial_path, "wb") as output_file:
+            if first_chunk:
+                output_file.write(first_chunk)
+                if on_chunk is not None:
+                    on_chunk(initial_bytes)
+                if progress is not None and task_id is not None:
+                    if show_estimated_progress:
+                        progress.update(task_id, completed=min(92, max(1, int(initial_bytes / 8192))))
+                    else:
+                        progress.update(task_id, completed=min(initial_bytes, progress_total))
+
+            written_bytes = initial_bytes
+            for chunk in response.iter_content(chunk_size=8192):
+                if not chunk:
+                    continue
+
+                output_file.write(chunk)
+                written_bytes += len(chunk)
+                if on_chunk is not None:
+                    on_chunk(len(chunk))
+
+                if progress is not None and task_id is not None:
+                    if show_estimated_progress:
+                        estimated_progress = min(92, max(1, int(written_bytes / 8192)))
+                        progress.update(task_id, completed=estimated_progress)
+                    else:
+                        progress.update(task_id, completed=min(written_bytes, progress_total))
+
+        partial_path.replace(file_path)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
 
     if progress is not None and task_id is not None:
         progress.update(task_id, completed=progress_total)
@@ -7,7 +7,9 @@ cli_commands.py
 
 from __future__ import annotations
 from typing import Any
+import datetime
 import os
+from pathlib import Path
 
 from dataclasses import dataclass
 from typing import Callable, Optional
@@ -20,9 +22,14 @@ from src.user_settings import (
     print_settings_box,
 )
 from src.wallpaper import apply_auto_wallpaper_from_file_path
+from src.nasa.nasa_backfill import run_backfill
+from src.nasa.nasa_concurrent import log_apods_for_dates
+from src.nasa.nasa_sampling import log_random_unlogged_apods
+from src.storage.log_archive import export_archive, import_archive
+from src.storage.log_storage import export_logs, search_log_entries
 
 from src.utils.browser_utils import take_user_to_browser
-from src.config import README_URL
+from src.config import README_URL, archive_file_path
 from rich.text import Text
 from src.startup.console import console
 
@@ -42,6 +49,13 @@ CMD_AUTO_REDIRECT = "auto_redirect"
 CMD_AUTO_WALLPAPER = "auto_wallpaper"
 CMD_VIEW_SETTINGS = "settings"
 CMD_AUTO_SAVE = "auto_save"
+CMD_BACKFILL = "backfill"
+CMD_FETCH_DATES = "fetch_dates"
+CMD_RANDOM_SAMPLE = "random_sample"
+CMD_EXPORT = "export"
+CMD_ARCHIVE = "archive"
+CMD_IMPORT_ARCHIVE = "import_archive"
+CMD_SEARCH = "search"
 
 
 def clear_screen() -> None:
@@ -67,6 +81,13 @@ def parse_global_command(raw: str) -> Optional[CommandMatch]:
       - --auto-wallpaper, --automatically-set-wallpaper, /auto-wallpaper, /automatically-set-wallpaper
       - --settings, /settings, -settings
       - --auto-save, /auto-save, --automatically-save-apod-files
+      - --backfill [YYYY-MM-DD [YYYY-MM-DD]], /backfill
+      - --fetch-dates YYYY-MM-DD [YYYY-MM-DD ...], /fetch-dates
+      - --random N, /random N
+      - --export, /export
+      - --archive [PATH], /archive
+      - --import-archive [PATH], /import-archive
+      - --search QUERY, /search QUERY
     """
     original = raw.strip()
     if not original:
@@ -120,6 +141,27 @@ def parse_global_command(raw: str) -> Optional[CommandMatch]:
     if token in ("auto-save", "automatically-save-apod-files") and not argument:
         return CommandMatch(CMD_AUTO_SAVE)
 
+    if token == "backfill":
+        return CommandMatch(CMD_BACKFILL, argument=argument)
+
+    if token == "fetch-dates" and argument:
+        return CommandMatch(CMD_FETCH_DATES, argument=argument)
+
+    if token == "random" and argument:
+        return CommandMatch(CMD_RANDOM_SAMPLE, argument=argument)
+
+    if token == "export" and not argument:
+        return CommandMatch(CMD_EXPORT)
+
+    if token == "archive":
+        return CommandMatch(CMD_ARCHIVE, argument=argument)
+
+    if token == "import-archive":
+        return CommandMatch(CMD_IMPORT_ARCHIVE, argument=argument)
+
+    if token == "search" and argument:
+        return CommandMatch(CMD_SEARCH, argument=argument)
+
     return None
 
 
@@ -186,12 +228,101 @@ def handle_global_command(raw: str) -> bool:
         run_plain_modal(change_auto_save)
         return True
 
+    if match.name == CMD_BACKFILL:
+        def backfill_date_range() -> Any:
+            date_range = parse_date_range_argument(match.argument)
+            if date_range is None:
+                return
+
+            run_backfill(*date_range)
+
+        run_plain_modal(backfill_date_range)
+        return True
+
+    if match.name == CMD_FETCH_DATES:
+        def fetch_many_dates() -> Any:
+            log_apods_for_dates((match.argument or "").replace(",", " ").split())
+
+        run_plain_modal(fetch_many_dates)
+        return True
+
+    if match.name == CMD_RANDOM_SAMPLE:
+        def sample_unlogged_dates() -> Any:
+            argument = (match.argument or "").strip()
+            if not argument.isdigit():
+                msg = Text("Input error: ", style="err")
+                msg.append(f"'{argument}'", style="app.primary")
+                msg.append(" is not a positive number.", style="body.text")
+                console.print(msg)
+                return
+
+            log_random_unlogged_apods(int(argument))
+
+        run_plain_modal(sample_unlogged_dates)
+        return True
+
+    if match.name == CMD_EXPORT:
+        run_plain_modal(export_logs)
+        return True
+
+    if match.name == CMD_ARCHIVE:
+        def write_log_archive() -> Any:
+            export_archive(get_archive_path_argument(match.argument))
+
+        run_plain_modal(write_log_archive)
+        return True
+
+    if match.name == CMD_IMPORT_ARCHIVE:
+        def read_log_archive() -> Any:
+            import_archive(get_archive_path_argument(match.argument))
+
+        run_plain_modal(read_log_archive)
+        return True
+
+    if match.name == CMD_SEARCH:
+        def search_logged_entries() -> Any:
+            search_log_entries(match.argument or "")
+
+        run_plain_modal(search_logged_entries)
+        return True
+
     if match.name == CMD_QUIT:
         raise SystemExit
 
     return False
 
 
+def parse_date_range_argument(argument: str | None) -> tuple[datetime.date | None, datetime.date | None] | None:
+    """
+    Parse an optional ``[start] [end]`` pair of ISO dates from a command argument.
+    Missing dates are returned as None; invalid dates print an error and return None.
+    """
+    parts = (argument or "").split()
+    if len(parts) > 2:
+        msg = Text("Input error: ", style="err")
+        msg.append("Expected at most two dates (YYYY-MM-DD).", style="body.text")
+        console.print(msg)
+        return None
+
+    dates: list[datetime.date | None] = [None, None]
+    for index, part in enumerate(parts):
+        try:
+            dates[index] = datetime.date.fromisoformat(part)
+        except ValueError:
+            msg = Text("Input error: ", style="err")
+            msg.append(f"'{part}'", style="app.primary")
+            msg.append(" is not a valid YYYY-MM-DD date.", style="body.text")
+            console.print(msg)
+            return None
+
+    return dates[0], dates[1]
+
+
+def get_archive_path_argument(argument: str | None) -> Path:
+    """Resolve the optional archive path of --archive/--import-archive (default: data/archive.apodz)."""
+    return Path(argument).expanduser() if argument else archive_file_path
+
+
 def open_readme() -> None:
     try:
         take_user_to_browser(README_URL)
@@ -237,6 +368,13 @@ def print_help() -> None:
     cmd_row("--auto-wallpaper", "Change auto-wallpaper setting")
     cmd_row("--auto-wallpaper <filepath>", "Set wallpaper from a global image path")
     cmd_row("--auto-save", "Change auto-save APOD files setting")
+    cmd_row("--backfill [start] [end]", "Log every APOD in a date range (resumable)")
+    cmd_row("--fetch-dates <date> ...", "Fetch and log many dates in parallel")
+    cmd_row("--random <n>", "Log n random APODs that are not logged yet")
+    cmd_row("--export", "Regenerate output.jsonl/output.csv from the active storage")
+    cmd_row("--archive [path]", "Write a compressed archive of the log")
+    cmd_row("--import-archive [path]", "Log the APODs stored in an archive")
+    cmd_row("--search <query>", "Search titles/explanations (AND; use OR between groups)")
 
     console.print()
 
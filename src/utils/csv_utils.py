@@ -12,6 +12,8 @@ from pathlib import Path
 from src.config import csv_file_path, csv_file_name, DATA_DIR
 from rich.text import Text
 from src.startup.console import console
+from src.storage.log_repository import LogRepository, get_log_repository, load_csv_records
+from src.storage.update_journal import UpdateJournal, get_update_journal
 from src.utils.viewer_utils import viewer_path_to_uri
 
 HEADERS = {
@@ -24,6 +26,16 @@ HEADERS = {
 }
 
 
+def get_csv_log_repository() -> LogRepository:
+    """Return the session-cached records of the CSV log."""
+    return get_log_repository(csv_file_path, load_csv_records)
+
+
+def get_csv_update_journal() -> UpdateJournal:
+    """Return the append-only field update journal of the CSV log."""
+    return get_update_journal(csv_file_path)
+
+
 def create_csv_output_file() -> Any:
     """
      Create the CSV output file if it does not already exist.
@@ -60,6 +72,8 @@ def clear_csv_output_file() -> Any:
 
     try:
         with open(file=csv_file_path, mode='w', encoding='utf-8') as csv_file:
+            get_csv_update_journal().clear()
+            get_csv_log_repository().invalidate()
             viewer_dir = DATA_DIR / "viewer"
             if viewer_dir.exists() and viewer_dir.is_dir():
                 for html_file in viewer_dir.glob("*.html"):
@@ -91,6 +105,7 @@ def delete_csv_output_file() -> Any:
     """
 
     Path(f"{csv_file_path}").unlink()
+    get_csv_update_journal().clear()
     msg = Text("Deleted: ", style="ok")
     msg.append(f"'{csv_file_name}' ", style="app.primary")
     msg.append("✓", style="ok")
@@ -127,6 +142,7 @@ def write_header_to_csv() -> Any:
 def check_for_duplicate_csv_entries(formatted_apod_data: Any) -> Any:
     """
        Check whether a CSV entry with the same APOD date already exists.
+       Uses the cached set of logged dates, so the file is not re-scanned per entry.
 
        Args:
        formatted_apod_data: A dict containing the APOD snapshot to compare.
@@ -136,22 +152,15 @@ def check_for_duplicate_csv_entries(formatted_apod_data: Any) -> Any:
     """
 
     try:
-        with open(file=csv_file_path, mode='r', encoding='utf-8') as csv_file:
-           content = csv.reader(csv_file)
-
-           for row in content:
-              if not row or row[0] == 'date':
-                  continue
-
-              if row[0] == formatted_apod_data['date']:
-                   apod_name =  f'apod-{formatted_apod_data["date"]}'
-                   msg = Text("Skipped logging: ", style="app.secondary")
-                   msg.append(apod_name, style="app.primary")
-                   msg.append(" already exists in ", style="body.text")
-                   msg.append(str(csv_file_name), style="app.primary")
-                   msg.append(".", style="body.text")
-                   console.print(msg)
-                   return True
+        if formatted_apod_data['date'] in get_csv_log_repository().dates():
+            apod_name = f'apod-{formatted_apod_data["date"]}'
+            msg = Text("Skipped logging: ", style="app.secondary")
+            msg.append(apod_name, style="app.primary")
+            msg.append(" already exists in ", style="body.text")
+            msg.append(str(csv_file_name), style="app.primary")
+            msg.append(".", style="body.text")
+            console.print(msg)
+            return True
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
@@ -181,7 +190,7 @@ def format_raw_csv_entry(formatted_csv_entry: Any, count: Any) -> Any:
        Print a single CSV entry in a readable, numbered format.
 
        Args:
-       formatted_csv_entry: A list representing one CSV row.
+       formatted_csv_entry: A dict representing one CSV row.
        count: Zero-based index used for display numbering.
 
        Returns:
@@ -237,6 +246,7 @@ def format_raw_csv_entry(formatted_csv_entry: Any, count: Any) -> Any:
 def get_line_count(count: Any) -> Any:
     """
        Count the number of data rows in the CSV file.
+       Served from the session cache; the file is only re-read after it changed.
 
        Args:
        count: Initial count value (typically 0).
@@ -246,13 +256,7 @@ def get_line_count(count: Any) -> Any:
        """
 
     try:
-        with open(file=csv_file_path, mode='r', encoding='utf-8') as csv_file:
-            content = csv.reader(csv_file)
-            for row in content:
-                if not row or row[0] == 'date':
-                    continue
-
-                count += 1
+        count += get_csv_log_repository().count()
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
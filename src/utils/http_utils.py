@@ -0,0 +1,177 @@
+"""
+http_utils.py
+
+Shared, pooled HTTP transport for every network call in the application.
+One ``requests.Session`` is kept per host so API calls and media downloads
+reuse TCP/TLS connections instead of paying a new handshake per request.
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config import (
+    HTTP_BACKOFF_FACTOR,
+    HTTP_BACKOFF_JITTER,
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_MAX_CONCURRENCY_PER_HOST,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_READ_TIMEOUT,
+)
+from src.utils import json_codec
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_sessions: dict[str, requests.Session] = {}
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_sessions_lock = threading.Lock()
+
+
+def _get_host_key(url: str) -> str:
+    """Return the ``scheme://host`` key used to pick a pooled session."""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def build_retry_policy() -> Retry:
+    """Build the retry policy shared by every pooled session.
+
+    Rate-limit (429) and server-side (5xx) responses are retried with
+    exponential backoff plus random jitter, so parallel callers do not retry
+    in lockstep. ``Retry-After`` headers sent by the server are honored. When
+    retries run out, the last response is returned instead of raising, so
+    callers can keep branching on ``status_code``.
+    """
+    return Retry(
+        total=HTTP_MAX_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        backoff_jitter=HTTP_BACKOFF_JITTER,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _create_session() -> requests.Session:
+    """Create a session with a sized connection pool and the retry policy mounted."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=build_retry_policy(),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """Return the pooled session for the host of ``url``, creating it on first use."""
+    host_key = _get_host_key(url)
+
+    with _sessions_lock:
+        session = _sessions.get(host_key)
+        if session is None:
+            session = _create_session()
+            _sessions[host_key] = session
+
+    return session
+
+
+def get_host_slots(url: str) -> threading.BoundedSemaphore:
+    """Return the semaphore that caps in-flight requests to the host of ``url``."""
+    host_key = _get_host_key(url)
+
+    with _sessions_lock:
+        slots = _host_slots.get(host_key)
+        if slots is None:
+            slots = threading.BoundedSemaphore(HTTP_MAX_CONCURRENCY_PER_HOST)
+            _host_slots[host_key] = slots
+
+    return slots
+
+
+def get_default_timeout() -> tuple[float, float]:
+    """Return the configured ``(connect, read)`` timeout pair."""
+    return HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
+
+
+def http_get(
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    stream: bool = False,
+    timeout: float | tuple[float, float] | None = None,
+) -> requests.Response:
+    """Send a GET request through the pooled session for the target host.
+
+    Every request gets a connect/read timeout, falling back to the configured
+    defaults when ``timeout`` is not supplied. At most
+    ``HTTP_MAX_CONCURRENCY_PER_HOST`` requests to one host are in flight at
+    once, no matter how many threads call in. For streamed responses the slot
+    is released once headers arrive, not when the body is fully read. Network
+    failures still raise ``requests.RequestException`` exactly like a bare
+    ``requests.get`` would.
+    """
+    session = get_session(url)
+
+    with get_host_slots(url):
+        return session.get(
+            url,
+            params=params,
+            headers=headers,
+            stream=stream,
+            timeout=timeout if timeout is not None else get_default_timeout(),
+        )
+
+
+def decode_json_response(response: requests.Response) -> Any:
+    """Decode a JSON response body with the shared codec, raising what ``response.json()`` would."""
+    try:
+        return json_codec.loads(response.content)
+    except json_codec.JSONDecodeError as error:
+        raise requests.JSONDecodeError(error.msg, error.doc, error.pos) from None
+
+
+def extract_validators(response: requests.Response) -> dict[str, str]:
+    """Return the cache validators (ETag, Last-Modified, Content-Length) sent with a response."""
+    validators = {}
+
+    for header_name, key in (("ETag", "etag"), ("Last-Modified", "last_modified"), ("Content-Length", "content_length")):
+        header_value = response.headers.get(header_name, "").strip()
+        if header_value:
+            validators[key] = header_value
+
+    return validators
+
+
+def build_conditional_headers(validators: dict[str, str] | None) -> dict[str, str]:
+    """Turn stored validators into ``If-None-Match`` / ``If-Modified-Since`` request headers."""
+    headers = {}
+
+    if not validators:
+        return headers
+
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    return headers
+
+
+def close_all_sessions() -> None:
+    """Close every pooled session and drop it from the registry."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
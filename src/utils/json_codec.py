@@ -0,0 +1,54 @@
+"""
+json_codec.py
+
+JSON codec shared by the logs, user settings and API response decoding.
+``loads`` uses orjson when it is installed (``JSON_CODEC=auto``) and the
+standard library otherwise (or with ``JSON_CODEC=json``). Documents orjson
+rejects but the standard library accepts (``NaN``, lone surrogates, non-UTF-8
+encodings) are retried with the standard library, and decode errors are
+always ``json.JSONDecodeError``. Note that orjson reads integers beyond 64 bits
+as floats; no APOD or settings field holds such values.
+
+``dumps`` always writes exactly what ``json.dumps(obj, ensure_ascii=False)``
+writes, which is the existing on-disk format. orjson has no option for the
+``", "``/``": "`` separators, so it is not used for encoding. One encoder is
+reused instead of building a new one per call.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from src.config import JSON_CODEC
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+_fast_loads = orjson.loads if orjson is not None and JSON_CODEC != "json" else None
+_encoder = json.JSONEncoder(ensure_ascii=False)
+
+CODEC_NAME = "orjson" if _fast_loads is not None else "json"
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except JSONDecodeError:
+            pass
+
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode like ``json.dumps(obj, ensure_ascii=False)``."""
+    return _encoder.encode(obj)
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Encode one UTF-8, newline-terminated JSONL line."""
+    return (_encoder.encode(obj) + "\n").encode("utf-8")
@@ -0,0 +1,114 @@
+"""
+json_stream_utils.py
+
+Incremental decoding of JSON array responses.
+Large ``start_date``/``end_date`` responses are decoded one element at a time
+as bytes arrive, so memory stays bounded by a single element plus one network
+chunk instead of the whole array.
+"""
+from __future__ import annotations
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+import requests
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+def _skip_whitespace(buffer: str, position: int) -> int:
+    while position < len(buffer) and buffer[position] in _WHITESPACE:
+        position += 1
+    return position
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array from an iterable of UTF-8 byte chunks.
+
+    A top-level object (the API answers a one-day range with a bare object)
+    is yielded as a single element.
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed or ends early.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    in_array = False
+    expect_separator = False
+
+    def read_more() -> bool:
+        nonlocal buffer, position
+        try:
+            chunk = next(chunk_iterator)
+        except StopIteration:
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+            position = 0
+            return False
+
+        # Drop consumed text so the buffer never holds more than one pending element.
+        buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
+        return True
+
+    chunk_iterator = iter(chunks)
+    stream_open = True
+
+    while True:
+        position = _skip_whitespace(buffer, position)
+
+        if position >= len(buffer):
+            if stream_open:
+                stream_open = read_more()
+                continue
+            raise json.JSONDecodeError("Unexpected end of JSON array", buffer, position)
+
+        if not in_array:
+            if buffer[position] == "[":
+                in_array = True
+                position += 1
+                continue
+
+            # Not an array: decode the whole document as one value.
+            while stream_open:
+                stream_open = read_more()
+            value, _ = _decoder.raw_decode(buffer, _skip_whitespace(buffer, 0))
+            yield value
+            return
+
+        if buffer[position] == "]":
+            return
+
+        if expect_separator:
+            if buffer[position] != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position)
+            position += 1
+            expect_separator = False
+            continue
+
+        try:
+            value, end = _decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError:
+            if not stream_open:
+                raise
+            stream_open = read_more()
+            continue
+
+        # A scalar that ends exactly at the buffer end may continue in the next chunk.
+        if end == len(buffer) and stream_open and not isinstance(value, (dict, list, str)):
+            stream_open = read_more()
+            continue
+
+        position = end
+        expect_separator = True
+        yield value
+
+
+def iter_response_json_items(response: requests.Response, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the elements of a streamed (``stream=True``) JSON array response as they arrive."""
+    return iter_json_array(response.iter_content(chunk_size=chunk_size))
@@ -4,17 +4,42 @@ json_utils.py
 Helper functions for working with the JSONL APOD log.
 Includes file checks, duplicate detection, and display formatting.
 """
-from typing import Any
+from typing import Any, Callable
 
-import json
 
 from pathlib import Path
-from src.config import json_file_path, json_file_name, DATA_DIR
+from src.config import json_file_path, json_file_name, DATA_DIR, SEARCH_RESULT_LIMIT
 from rich.text import Text
 from src.startup.console import console
+from src.storage.apod_record import ApodRecord
+from src.storage.jsonl_index import JsonlIndex, get_jsonl_index
+from src.storage.log_repository import LogRepository, get_log_repository, load_jsonl_records
+from src.storage.search_index import SearchIndex, get_search_index
+from src.storage.update_journal import UpdateJournal, get_update_journal
+from src.utils import json_codec
 from src.utils.viewer_utils import viewer_path_to_uri
 
 
+def get_json_log_index() -> JsonlIndex:
+    """Return the date -> offset index of the JSONL log."""
+    return get_jsonl_index(json_file_path)
+
+
+def get_json_log_repository() -> LogRepository:
+    """Return the session-cached records of the JSONL log."""
+    return get_log_repository(json_file_path, load_jsonl_records)
+
+
+def get_json_search_index() -> SearchIndex:
+    """Return the full-text search index of the JSONL log."""
+    return get_search_index(json_file_path)
+
+
+def get_json_update_journal() -> UpdateJournal:
+    """Return the append-only field update journal of the JSONL log."""
+    return get_update_journal(json_file_path)
+
+
 def create_json_output_file() -> Any:
     """
      Create the JSONL output file if it does not already exist.
@@ -50,6 +75,10 @@ def clear_json_output_file() -> Any:
 
     try:
         with open(file=json_file_path, mode='w') as json_file:
+            get_json_log_index().invalidate()
+            get_json_search_index().invalidate()
+            get_json_update_journal().clear()
+            get_json_log_repository().invalidate()
             viewer_dir = DATA_DIR / "viewer"
             if viewer_dir.exists() and viewer_dir.is_dir():
                 for html_file in viewer_dir.glob("*.html"):
@@ -80,6 +109,7 @@ def delete_json_output_file() -> Any:
     """
 
     Path(f"{json_file_path}").unlink()
+    get_json_update_journal().clear()
     msg = Text("Deleted: ", style="ok")
     msg.append(f"'{json_file_name}' ", style="app.primary")
     msg.append("✓", style="ok")
@@ -88,19 +118,18 @@ def delete_json_output_file() -> Any:
 
 def get_line_count(count: Any) -> Any:
     """
-      Count the number of lines in the JSONL log file.
+      Count the number of entries in the JSONL log file.
+      Served from the log's summary sidecar, so no log lines are read.
 
       Args:
       count: Initial count value (typically 0).
 
       Returns:
-       int: Total number of lines in the file.
+       int: Total number of entries in the file.
     """
 
     try:
-        with open(file=json_file_path, mode='r') as json_file:
-            for line in json_file:
-                count += 1
+        count += get_json_log_index().summary().count
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
@@ -111,7 +140,7 @@ def get_line_count(count: Any) -> Any:
         msg.append("X.", style="err")
         console.print(msg)
 
-    except json.decoder.JSONDecodeError:
+    except json_codec.JSONDecodeError:
         msg = Text("\nJSONL parse error: ", style="err")
         msg.append("Could not decode JSON from file ", style="body.text")
         msg.append(f"'{json_file_name}'", style="app.primary")
@@ -128,6 +157,7 @@ def get_line_count(count: Any) -> Any:
 def check_for_duplicate_json_entries(formatted_apod_data: Any) -> Any:
     """
       Check whether a JSONL entry with the same APOD date already exists.
+      Uses the sidecar date index, so no log lines are decoded.
 
       Args:
       formatted_apod_data: A dict containing the APOD snapshot to compare.
@@ -137,21 +167,15 @@ def check_for_duplicate_json_entries(formatted_apod_data: Any) -> Any:
     """
 
     try:
-        with open(file=json_file_path, mode='r') as json_file:
-            for line in json_file:
-                if line is None or len(line) == 0:
-                    continue
-
-                content = json.loads(line)
-                if content['date'] == formatted_apod_data['date']:
-                    apod_name = f'apod-{formatted_apod_data["date"]}'
-                    msg = Text("Skipped logging: ", style="app.secondary")
-                    msg.append(apod_name, style="app.primary")
-                    msg.append(" already exists in ", style="body.text")
-                    msg.append(str(json_file_name), style="app.primary")
-                    msg.append(".", style="body.text")
-                    console.print(msg)
-                    return True
+        if get_json_log_index().contains(formatted_apod_data['date']):
+            apod_name = f'apod-{formatted_apod_data["date"]}'
+            msg = Text("Skipped logging: ", style="app.secondary")
+            msg.append(apod_name, style="app.primary")
+            msg.append(" already exists in ", style="body.text")
+            msg.append(str(json_file_name), style="app.primary")
+            msg.append(".", style="body.text")
+            console.print(msg)
+            return True
 
     except PermissionError:
         msg = Text("\nPermission error: ", style="err")
@@ -162,7 +186,7 @@ def check_for_duplicate_json_entries(formatted_apod_data: Any) -> Any:
         msg.append("X.", style="err")
         console.print(msg)
 
-    except json.decoder.JSONDecodeError:
+    except json_codec.JSONDecodeError:
         msg = Text("\nJSONL parse error: ", style="err")
         msg.append("Could not decode JSON from file ", style="body.text")
         msg.append(f"'{json_file_name}'", style="app.primary")
@@ -238,3 +262,122 @@ def format_raw_jsonl_entry(formatted_jsonl_entry: Any, count: Any) -> Any:
         line.append(f"{local_file_uri}\n", style="app.url")
 
     console.print(line)
+
+
+def print_search_results_header(query: str, match_count: int, shown_count: int) -> None:
+    """Print the summary line above a list of search results."""
+    if match_count == 0:
+        msg = Text("\nNo entries match ", style="body.text")
+        msg.append(f"'{query}'", style="app.primary")
+        msg.append(".\n", style="body.text")
+        console.print(msg)
+        return
+
+    msg = Text("\nFound ", style="body.text")
+    msg.append(str(match_count), style="app.primary")
+    msg.append(" entries matching ", style="body.text")
+    msg.append(f"'{query}'", style="app.primary")
+    if shown_count < match_count:
+        msg.append(" (showing the best ", style="body.text")
+        msg.append(str(shown_count), style="app.primary")
+        msg.append(")", style="body.text")
+    msg.append(":\n", style="body.text")
+    console.print(msg)
+
+
+def show_search_results(
+    query: str,
+    hits: list[tuple[str, float]],
+    read_entry: Callable[[str], dict[str, Any] | None],
+    limit: int = SEARCH_RESULT_LIMIT,
+) -> None:
+    """Print the summary line and the best ``limit`` hits, reading each entry by date with ``read_entry``."""
+    shown_hits = hits[:limit]
+
+    print_search_results_header(query, len(hits), len(shown_hits))
+    if not hits:
+        return
+
+    for count, (date_value, _) in enumerate(shown_hits):
+        entry = read_entry(date_value)
+        if entry is not None:
+            format_raw_jsonl_entry(entry, count)
+
+    console.print()
+
+
+def get_logged_json_dates() -> set[str]:
+    """
+      Collect the APOD date of every entry in the JSONL log.
+
+      Returns:
+       set[str]: Logged dates (YYYY-MM-DD); empty when the log is missing or unreadable.
+    """
+
+    logged_dates = set()
+
+    if not check_if_json_output_exists():
+        return logged_dates
+
+    try:
+        logged_dates = get_json_log_index().dates()
+
+    except PermissionError:
+        msg = Text("\nPermission error: ", style="err")
+        msg.append("Unable to read ", style="body.text")
+        msg.append(f"'{json_file_name}'", style="app.primary")
+        msg.append(" at ", style="body.text")
+        msg.append(f"'{json_file_path}' ", style="app.primary")
+        msg.append("X.", style="err")
+        console.print(msg)
+
+    except json_codec.JSONDecodeError:
+        msg = Text("\nJSONL parse error: ", style="err")
+        msg.append("Could not decode JSON from file ", style="body.text")
+        msg.append(f"'{json_file_name}'", style="app.primary")
+        msg.append(". Check the file format.", style="body.text")
+        console.print(msg)
+
+    return logged_dates
+
+
+def ask_entries_amount() -> int | None:
+    """Prompt for how many entries to show; return None (after printing why) on bad input."""
+    try:
+        console.print("\nEnter number of entries: ", style="app.secondary", end="")
+        entries_amount = int(input())
+
+    except ValueError:
+        console.print(Text("\nInput error: ", style="err").append("Enter a valid number.", style="body.text"))
+        console.print()
+        return None
+
+    except Exception as e:
+        console.print()
+        console.print(Text(str(e), style="err"))
+        return None
+
+    if entries_amount < 1:
+        console.print(Text("\nInput error: ", style="err").append("Enter a number of 1 or more.", style="body.text"))
+        console.print()
+        return None
+
+    return entries_amount
+
+
+def show_log_records(records: list[ApodRecord], requested_amount: int | None = None) -> None:
+    """Display records (noting when fewer than ``requested_amount`` exist), or "No entries found."."""
+    if not records:
+        console.print(Text("\nNo entries found.\n", style="body.text"))
+        return
+
+    if requested_amount is not None and requested_amount > len(records):
+        msg = Text("\nOnly ", style="body.text")
+        msg.append(str(len(records)), style="app.primary")
+        msg.append(" entries available. Showing all available entries.", style="body.text")
+        console.print(msg)
+
+    console.print()
+    for count, record in enumerate(records):
+        format_raw_jsonl_entry(record.to_dict(), count)
+    console.print()
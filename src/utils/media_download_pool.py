@@ -0,0 +1,103 @@
+"""
+media_download_pool.py
+
+Parallel APOD media downloads with one aggregated progress display.
+Files are downloaded on a bounded thread pool, with a separate cap on
+concurrent downloads per media host, and the saved paths are returned
+together so callers can update the logs in a single pass.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from rich.filesize import decimal
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
+
+from src.config import MEDIA_DOWNLOAD_WORKERS, MEDIA_DOWNLOADS_PER_HOST
+from src.startup.console import console
+from src.utils.apod_media_utils import download_apod_file, resolve_direct_media_url
+from src.utils.http_utils import _get_host_key
+
+
+def download_apod_files(
+    apod_entries: list[dict[str, Any]],
+    max_workers: int = MEDIA_DOWNLOAD_WORKERS,
+    per_host_limit: int = MEDIA_DOWNLOADS_PER_HOST,
+) -> dict[str, str]:
+    """
+    Download the media of several APOD entries in parallel.
+
+    Unlike the per-request host slots in ``http_utils`` (released once headers
+    arrive), a download holds its host slot until the whole body is written,
+    so a single slow media host never gets more than ``per_host_limit``
+    concurrent transfers. Progress for all files is shown as one bar with the
+    number of finished files and the bytes transferred so far.
+
+    Args:
+        apod_entries: Raw APOD API payloads.
+        max_workers: Total download threads.
+        per_host_limit: Concurrent downloads allowed per media host.
+
+    Returns:
+        dict[str, str]: ``{date: saved_file_path}`` for every file that was written.
+    """
+    entries_by_date = {}
+    for apod_data in apod_entries:
+        date_value = str(apod_data.get("date", "")).strip()
+        if date_value:
+            entries_by_date.setdefault(date_value, apod_data)
+
+    if not entries_by_date:
+        return {}
+
+    host_slots: dict[str, threading.BoundedSemaphore] = {}
+    transfer_lock = threading.Lock()
+    transferred = {"bytes": 0}
+    started_at = time.perf_counter()
+
+    def get_host_slot(apod_data: dict[str, Any]) -> threading.BoundedSemaphore:
+        host_key = _get_host_key(resolve_direct_media_url(apod_data) or "")
+        with transfer_lock:
+            slot = host_slots.get(host_key)
+            if slot is None:
+                slot = threading.BoundedSemaphore(per_host_limit)
+                host_slots[host_key] = slot
+        return slot
+
+    with Progress(
+        SpinnerColumn(style="app.primary"),
+        TextColumn("[body.text]Saving APOD files to Downloads[/body.text]"),
+        BarColumn(bar_width=None, complete_style="app.primary", finished_style="ok"),
+        MofNCompleteColumn(),
+        TextColumn("[app.secondary]{task.fields[transfer]}[/app.secondary]"),
+        console=console,
+        transient=True,
+        expand=True,
+    ) as progress:
+        task_id = progress.add_task("save-apod-files", total=len(entries_by_date), transfer="0 bytes")
+
+        def on_chunk(byte_count: int) -> None:
+            with transfer_lock:
+                transferred["bytes"] += byte_count
+                total_bytes = transferred["bytes"]
+
+            elapsed_seconds = max(time.perf_counter() - started_at, 1e-6)
+            progress.update(
+                task_id,
+                transfer=f"{decimal(total_bytes)} @ {decimal(int(total_bytes / elapsed_seconds))}/s",
+            )
+
+        def download_one(apod_data: dict[str, Any]) -> str | None:
+            try:
+                with get_host_slot(apod_data):
+                    return download_apod_file(apod_data, show_progress=False, on_chunk=on_chunk)
+            finally:
+                progress.advance(task_id)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            saved_paths = dict(zip(entries_by_date, executor.map(download_one, entries_by_date.values())))
+
+    return {date_value: file_path for date_value, file_path in saved_paths.items() if file_path}
@@ -17,7 +17,10 @@ from src.startup.console import console
 from src.utils.apod_media_utils import (
     get_apod_download_dir,
     get_existing_date_file_path,
+    get_partial_download_path,
     infer_extension,
+    open_media_response,
+    record_media_validators,
     resolve_direct_media_url,
 )
 from src.wallpaper.linux import set_wallpaper_linux
@@ -207,24 +210,36 @@ def _set_local_image_as_wallpaper(
 
 
 def _resolve_or_download_image_for_date(apod_data: dict[str, Any], date_value: str) -> Path | None:
-    """Return an existing image path for an APOD date or download it once."""
+    """Return an up-to-date image path for an APOD date, downloading it only when needed.
+
+    An image that is already saved is revalidated with a conditional request,
+    so an unchanged image costs a 304 instead of a full download. When the
+    server cannot be reached, the saved image is used as-is.
+    """
     existing_file = get_existing_date_file_path(date_value)
-    if existing_file:
+    existing_path = None
+    if existing_file and Path(existing_file).suffix.lower() in {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp", ".tif", ".tiff"}:
         existing_path = Path(existing_file)
-        if existing_path.suffix.lower() in {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".webp", ".tif", ".tiff"}:
-            return existing_path
 
     media_url = resolve_direct_media_url(apod_data)
     if media_url is None:
+        if existing_path is not None:
+            return existing_path
+
         msg = Text("Auto-wallpaper skipped: ", style="err")
         msg.append("No direct image URL was available.", style="body.text")
         console.print(msg)
         return None
 
     try:
-        response = requests.get(media_url, stream=True, timeout=30)
+        response, unchanged = open_media_response(media_url, date_value, existing_path)
+        if unchanged:
+            return existing_path
         response.raise_for_status()
     except requests.RequestException as error:
+        if existing_path is not None:
+            return existing_path
+
         msg = Text("Auto-wallpaper download failed: ", style="err")
         msg.append(str(error), style="body.text")
         console.print(msg)
@@ -232,31 +247,48 @@ def _resolve_or_download_image_for_date(apod_data: dict[str, Any], date_value: s
 
     content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
     if not content_type.startswith("image/"):
+        response.close()
         msg = Text("Auto-wallpaper skipped: ", style="app.secondary")
         msg.append("APOD is not a downloadable image file.", style="body.text")
         console.print(msg)
         return None
 
     extension = infer_extension(response, media_url)
-    file_path = get_apod_download_dir() / f"apod-{date_value}{extension}"
+    if existing_path is not None:
+        file_path = existing_path.with_suffix(extension)
+    else:
+        file_path = get_apod_download_dir() / f"apod-{date_value}{extension}"
 
-    if file_path.exists():
-        msg = Text("Using existing APOD image: ", style="app.secondary")
-        msg.append(file_path.name, style="body.text")
-        console.print(msg)
-        return file_path
+        if file_path.exists():
+            response.close()
+            msg = Text("Using existing APOD image: ", style="app.secondary")
+            msg.append(file_path.name, style="body.text")
+            console.print(msg)
+            return file_path
 
+    # Stream into a temp file so a failed download never truncates the saved image.
+    partial_path = get_partial_download_path(file_path)
     try:
-        with open(file_path, "wb") as output_file:
+        with open(partial_path, "wb") as output_file:
             for chunk in response.iter_content(chunk_size=8192):
                 if chunk:
                     output_file.write(chunk)
-    except OSError as error:
+        partial_path.replace(file_path)
+    except (OSError, requests.RequestException) as error:
+        partial_path.unlink(missing_ok=True)
+        if existing_path is not None and existing_path.exists():
+            return existing_path
+
         msg = Text("Auto-wallpaper save failed: ", style="err")
         msg.append(str(error), style="body.text")
         console.print(msg)
         return None
 
+    if existing_path is not None and existing_path != file_path:
+        existing_path.unlink(missing_ok=True)
+
+    record_media_validators(date_value, media_url, file_path, response)
+
     msg = Text("Downloaded wallpaper image: ", style="ok")
     msg.append(file_path.name, style="body.text")
     msg.append(" ✓", style="ok")